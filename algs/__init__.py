@@ -0,0 +1,84 @@
+"""
+Algorithms of "Introduction to Algorithms" in Python
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-18
+
+Top-level namespace of the installable package. The algorithm packages
+and their main functions and classes are attributes of "algs" imported
+on first access (PEP 562), so "import algs" (and the "algs" command
+line) starts without importing any of them, e.g. "algs.quick_sort"
+imports "sorting.quick_sort" only
+
+"""
+
+# Standard library imports
+import importlib
+
+
+__version__ = "0.1.0"
+
+# Algorithm packages
+_PACKAGES = (
+    "bench", "linear_algebra", "polynomials", "random_utils", "searching",
+    "series", "sorting"
+    )
+
+# Functions and classes exposed by "algs" (name: module)
+_EXPORTS = {
+    "bubble_sort": "sorting.bubble_sort",
+    "insertion_sort": "sorting.insertion_sort",
+    "merge_sort": "sorting.merge_sort",
+    "quick_sort": "sorting.quick_sort",
+    "selection_sort": "sorting.selection_sort",
+    "binary_search": "searching.binary_search",
+    "maximum_subarray": "searching.maximum_subarray",
+    "fibo": "series.fibonacci",
+    "Matrix": "linear_algebra.matrix",
+    "CSRMatrix": "linear_algebra.sparse_matrix",
+    "matrix_add": "linear_algebra.matrix_base_operations",
+    "matrix_subtract": "linear_algebra.matrix_base_operations",
+    "matrix_multiply": "linear_algebra.matrix_base_operations",
+    "matrix_chain_multiply": "linear_algebra.matrix_chain",
+    "matvec": "linear_algebra.batch_operations",
+    "lup_decomposition": "linear_algebra.lup_decomposition",
+    "solve": "linear_algebra.lup_decomposition",
+    "save_matrix": "linear_algebra.matrix_file",
+    "open_matrix": "linear_algebra.matrix_file",
+    "set_backend": "linear_algebra.backends",
+    "Polynomial": "polynomials.polynomial",
+    "poly_multiply": "polynomials.polynomial",
+    "horner_eval": "polynomials.horner_rule_polys",
+    "estrin_eval": "polynomials.horner_rule_polys",
+    "multipoint_eval": "polynomials.multipoint",
+    "interpolate": "polynomials.multipoint",
+    "newton_roots": "polynomials.root_finding",
+    "array_randomize": "random_utils.array_randomizers",
+    "reservoir_sample": "random_utils.reservoir_sampling",
+    "weighted_reservoir_sample": "random_utils.reservoir_sampling",
+    "LazyPermutation": "random_utils.lazy_permutation",
+    "default_rng": "random_utils.rng",
+    "generate_sequence": "random_utils.workloads",
+    "random_matrix": "random_utils.workloads",
+    "profile": "bench.instrument",
+    }
+
+__all__ = [*_PACKAGES, *_EXPORTS]
+
+
+def __getattr__(name:str):
+    """Import a package (or the module of a function) on first access"""
+    if name in _PACKAGES:
+        value = importlib.import_module(name)
+    elif name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    else:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    # Later accesses skip "__getattr__"
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,19 @@
+"""
+Command Line Entry Point ("python -m algs")
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-18
+
+Runs the "algs" command (see "algs.cli")
+
+"""
+
+# Standard library imports
+import sys
+
+# Local application imports
+from algs.cli import main
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,354 @@
+"""
+Streaming Command Line Interface of the Algorithms
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-18
+
+Implements the "algs" command, which streams numbers from files (or
+the standard input) through the algorithms of the repository, chunk by
+chunk, so inputs are never loaded up front. Inputs are either text
+(numbers separated by newlines or blanks) or binary sequence files
+(see "random_utils.workloads") and matrix files (see
+"linear_algebra.matrix_file"):
+    - algs sort: external sort, each chunk sorted by the chosen
+      algorithm and spilled to disk as a run, runs merged on output;
+    - algs search: first index of keys in a sorted input, in one pass
+      over the chunks (or memory-mapped for sequence files);
+    - algs matmul: product of two matrices, the left one streamed in
+      blocks of rows and the product written block by block;
+    - algs fibo: fibonacci numbers of the streamed indices
+
+Usage:
+    algs sort --method merge numbers.txt > sorted.txt
+    algs search 17 42 --input sorted.seq --format binary
+    algs matmul A.txt B.txt --method strassen
+    seq 10 | algs fibo --method squaring
+
+"""
+
+# Standard library imports
+import argparse
+import heapq
+import importlib
+import os
+import sys
+import tempfile
+from contextlib import nullcontext
+from itertools import chain
+
+# Local application imports
+from random_utils.workloads import (
+    close_sequence, open_sequence, stream_sequence_file, write_sequence_file
+    )
+
+
+# Elements per chunk (rows per block for "matmul")
+_CHUNK = 1 << 16
+
+# Sorting algorithms as (module, function, keyword arguments)
+_SORTS = {
+    "merge": ("sorting.merge_sort", "merge_sort", {}),
+    "quick": ("sorting.quick_sort", "quick_sort", {}),
+    "randomized": ("sorting.quick_sort", "quick_sort",
+                   {"method": "randomized"}),
+    "insertion": ("sorting.insertion_sort", "insertion_sort", {}),
+    "selection": ("sorting.selection_sort", "selection_sort", {}),
+    "bubble": ("sorting.bubble_sort", "bubble_sort", {}),
+    }
+
+
+def _number(token:str):
+    """Integer (or float) of a text token"""
+    try:
+        return int(token)
+    except ValueError:
+        return float(token)
+
+
+def _open(path:str, binary:bool):
+    """File of a path ("-" for the standard input)"""
+    if path == "-":
+        return nullcontext(sys.stdin.buffer if binary else sys.stdin)
+    return open(path, "rb" if binary else "r")
+
+
+def _chunks(paths:list, binary:bool, chunk:int):
+    """Chunks of the numbers of the inputs (lists, or arrays for
+    sequence files)"""
+    for path in paths or ["-"]:
+        with _open(path, binary) as file:
+            if binary:
+                yield from stream_sequence_file(file, chunk)
+                continue
+            values = []
+            for line in file:
+                values.extend(map(_number, line.split()))
+                if len(values) >= chunk:
+                    yield values
+                    values = []
+            if values:
+                yield values
+
+
+def _rows(path:str, binary:bool):
+    """Matrix of a file (memory-mapped), or generator of its text rows"""
+    if binary:
+        from linear_algebra.matrix_file import open_matrix
+        return open_matrix(path)
+
+    def rows():
+        with _open(path, False) as file:
+            for line in file:
+                if line.strip():
+                    yield [_number(token) for token in line.split()]
+    return rows()
+
+
+def _writeText(out, values) -> None:
+    """Write values one per line"""
+    out.write("".join(f"{x}\n" for x in values))
+
+
+def _typecode(values) -> str:
+    """Sequence file typecode able to hold the values"""
+    typecode = getattr(values, "typecode", None)
+    if typecode is not None:
+        return typecode
+    return "d" if any(isinstance(x, float) for x in values) else "q"
+
+
+def _sort(args) -> int:
+    """Sort the inputs (external merge sort of sorted chunks)"""
+    module, name, kwargs = _SORTS[args.method]
+    sort = getattr(importlib.import_module(module), name)
+    binary = args.format == "binary"
+
+    with tempfile.TemporaryDirectory() as directory:
+        # Sorted runs (spilled to disk as soon as there is a second one)
+        runs, paths, typecodes, n = [], [], set(), 0
+        for values in _chunks(args.inputs, binary, args.chunk):
+            typecodes.add(_typecode(values))
+            n += len(values)
+            runs.append(sort(list(values), **kwargs))
+            if len(runs) > 1 or paths:
+                paths.extend(_spill(run, directory, len(paths), binary)
+                             for run in runs)
+                runs = []
+        typecode = "d" if "d" in typecodes else "q"
+
+        # Merge the runs on output
+        merged = runs[0] if runs else heapq.merge(*(
+            _unspill(path, binary) for path in paths
+            ))
+        if binary:
+            with _output(args.output, True) as out:
+                write_sequence_file(out, n, _batches(merged, args.chunk),
+                                    typecode)
+        else:
+            with _output(args.output, False) as out:
+                for batch in _batches(merged, args.chunk):
+                    _writeText(out, batch)
+    return 0
+
+
+def _spill(run:list, directory:str, index:int, binary:bool) -> str:
+    """Write a sorted run to a temporary file"""
+    path = os.path.join(directory, f"run{index}")
+    if binary:
+        with open(path, "wb") as file:
+            write_sequence_file(file, len(run), [run], _typecode(run))
+    else:
+        with open(path, "w") as file:
+            _writeText(file, (repr(x) for x in run))
+    return path
+
+
+def _unspill(path:str, binary:bool):
+    """Stream the elements of a spilled run"""
+    with open(path, "rb" if binary else "r") as file:
+        if binary:
+            yield from chain.from_iterable(stream_sequence_file(file))
+        else:
+            yield from map(_number, file)
+
+
+def _batches(values, size:int):
+    """Lists of up to "size" consecutive values"""
+    batch = []
+    for x in values:
+        batch.append(x)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _output(path:str, binary:bool):
+    """Output file of a path (None for the standard output)"""
+    if path is None:
+        return nullcontext(sys.stdout.buffer if binary else sys.stdout)
+    return open(path, "wb" if binary else "w")
+
+
+def _search(args) -> int:
+    """First index of each key in a sorted input (-1 if absent)"""
+    from searching.binary_search import binary_search
+    keys = [_number(key) for key in args.keys]
+    found = dict.fromkeys(keys, -1)
+
+    # Sequence files are memory-mapped (only the probed pages are read)
+    if args.format == "binary" and args.input != "-":
+        A = open_sequence(args.input)
+        try:
+            for key in keys:
+                found[key] = binary_search(A, key)
+        finally:
+            close_sequence(A)
+
+    # Other inputs are searched chunk by chunk, in a single pass
+    else:
+        pending, offset = sorted(found), 0
+        for values in _chunks([args.input], args.format == "binary",
+                              args.chunk):
+            while pending and pending[0] <= values[-1]:
+                key = pending.pop(0)
+                index = binary_search(values, key)
+                found[key] = -1 if index < 0 else offset + index
+            if not pending:
+                break
+            offset += len(values)
+
+    for key in keys:
+        print(f"{key} {found[key]}")
+    return 0
+
+
+def _matmul(args) -> int:
+    """Product of two matrices, the left one streamed in row blocks"""
+    from linear_algebra.matrix_base_operations import matrix_multiply
+    binary = args.format == "binary"
+
+    # Right operand (whole) and left operand (rows on demand)
+    B, A = _rows(args.B, binary), _rows(args.A, binary)
+    if binary:
+        from linear_algebra.matrix_file import close_matrix, create_matrix
+        if args.output is None:
+            raise ValueError("Output matrix file (--output) not provided!\n")
+        typecode = "d" if "d" in (A.typecode, B.typecode) else "q"
+        C = create_matrix(args.output, A.rows, B.cols, typecode)
+        A = map(A.row, range(A.rows))
+    else:
+        B = list(B)
+
+    # Multiply and write each block of rows
+    i = 0
+    with nullcontext() if binary else _output(args.output, False) as out:
+        for block in _batches(A, args.chunk):
+            rows = matrix_multiply(block, B, args.method)
+            if binary:
+                for row in rows:
+                    C.set_row(i, row)
+                    i += 1
+            else:
+                out.write("".join(
+                    " ".join(map(str, row)) + "\n" for row in rows
+                    ))
+    if binary:
+        close_matrix(C)
+    return 0
+
+
+def _fibo(args) -> int:
+    """Fibonacci numbers of the indices"""
+    from series.fibonacci import fibo
+
+    # Fibonacci numbers quickly exceed the default digits of str(int)
+    if hasattr(sys, "set_int_max_str_digits"):
+        sys.set_int_max_str_digits(0)
+    if args.indices:
+        chunks = [[int(n) for n in args.indices]]
+    else:
+        chunks = _chunks([args.input], args.format == "binary", args.chunk)
+    for indices in chunks:
+        _writeText(sys.stdout, (fibo(int(n), args.method) for n in indices))
+    return 0
+
+
+def _parser() -> argparse.ArgumentParser:
+    """Parser of the command line"""
+    parser = argparse.ArgumentParser(
+        prog="algs", description=__doc__.split("\n")[1]
+        )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    # Options shared by the commands
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--format", choices=["text", "binary"],
+                        default="text", help="input (and output) format")
+    common.add_argument("--chunk", type=int, default=_CHUNK,
+                        help="elements per chunk (rows for matmul)")
+
+    sort = commands.add_parser("sort", parents=[common],
+                               help="sort numbers")
+    sort.add_argument("inputs", nargs="*",
+                      help="input files (standard input if none or -)")
+    sort.add_argument("--method", choices=list(_SORTS), default="merge")
+    sort.add_argument("--output", help="output file (standard output)")
+    sort.set_defaults(run=_sort)
+
+    search = commands.add_parser("search", parents=[common],
+                                 help="search keys in sorted numbers")
+    search.add_argument("keys", nargs="+")
+    search.add_argument("--input", default="-",
+                        help="sorted input file (standard input)")
+    search.set_defaults(run=_search)
+
+    matmul = commands.add_parser("matmul", parents=[common],
+                                 help="multiply two matrices")
+    matmul.add_argument("A", help="left matrix file (- for standard input)")
+    matmul.add_argument("B", help="right matrix file")
+    matmul.add_argument("--method", default="standard",
+                        choices=["standard", "blocked", "divide_conquer",
+                                 "strassen"])
+    matmul.add_argument("--output", help="output file (standard output, "
+                        "required for binary matrix files)")
+    matmul.set_defaults(run=_matmul)
+
+    fibo = commands.add_parser("fibo", parents=[common],
+                               help="fibonacci numbers")
+    fibo.add_argument("indices", nargs="*",
+                      help="indices (read from the input if none)")
+    fibo.add_argument("--input", default="-",
+                      help="input file (standard input)")
+    fibo.add_argument("--method", default="bottom-up",
+                      choices=["recursive", "bottom-up", "top-down",
+                               "squaring"])
+    fibo.set_defaults(run=_fibo)
+    return parser
+
+
+def main(argv:list=None) -> int:
+    """Run the "algs" Command
+
+    > Arguments:
+        - argv (list): Command line arguments.
+            ---> Defaults to None (sys.argv).
+
+    > Output:
+        - Exit status.
+    """
+    args = _parser().parse_args(argv)
+    try:
+        return args.run(args)
+    except BrokenPipeError:
+        # Output closed early (e.g. piped into "head")
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+    except (OSError, ValueError, NotImplementedError) as error:
+        print(f"algs {args.command}: {str(error).strip()}", file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
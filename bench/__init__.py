@@ -0,0 +1,34 @@
+"""
+Benchmark Harness
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-18
+
+Package with the discovery, inputs, timing and instrumentation of the
+benchmark cases, run with "python -m bench" (submodules are imported
+on first access)
+
+"""
+
+# Standard library imports
+import importlib
+
+
+# Submodules of the package
+__all__ = [
+    "discovery",
+    "harness",
+    "inputs",
+    "instrument",
+    ]
+
+
+def __getattr__(name:str):
+    """Import a submodule on first access"""
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
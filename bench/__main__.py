@@ -0,0 +1,116 @@
+"""
+Benchmark Harness of the Repository Algorithms
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-18
+
+Discovers every public algorithm (and "method=" variant) of the
+repository, times each one over a sweep of sizes, fits its empirical
+growth exponent and compares it with the complexity claimed in its
+docstring. Results can be written to a JSON file and compared with a
+baseline file, the run failing (exit status 1) on slowdowns
+
+Usage (from the repository root):
+    python -m bench --list
+    python -m bench --filter sort fibo --output results.json
+    python -m bench --quick --baseline results.json --threshold 0.25
+
+"""
+
+# Standard library imports
+import argparse
+import math
+import sys
+
+# Local application imports
+from bench.discovery import discover
+from bench.harness import compare, load_results, run, save_results
+from bench.inputs import inputs_of
+from linear_algebra.backends import set_backend
+
+
+def _format_exponent(k) -> str:
+    """Exponent for the summary table"""
+    if k is None:
+        return "-"
+    return "exp" if math.isinf(k) else f"{k:.2f}"
+
+
+def main(argv:list=None) -> int:
+    """Run the Benchmark Harness
+
+    > Arguments:
+        - argv (list): Command line arguments.
+            ---> Defaults to None (sys.argv).
+
+    > Output:
+        - Exit status (1 on slowdowns against the baseline).
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m bench", description=__doc__.split("\n")[1]
+        )
+    parser.add_argument("--list", action="store_true",
+                        help="list the discovered cases and exit")
+    parser.add_argument("--filter", nargs="+", default=[],
+                        help="only cases whose name holds one of these")
+    parser.add_argument("--quick", action="store_true",
+                        help="only the first 3 sizes of each sweep")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--budget", type=float, default=1.0,
+                        help="seconds per call before a sweep stops")
+    parser.add_argument("--backend", default="python",
+                        help="linear algebra backend (python, numpy, auto)")
+    parser.add_argument("--output", help="JSON results file")
+    parser.add_argument("--baseline", help="JSON results to compare with")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="tolerated relative slowdown")
+    args = parser.parse_args(argv)
+
+    # Discover and filter cases
+    set_backend(args.backend)
+    cases = [
+        case for case in discover()
+        if not args.filter or any(f in case.key for f in args.filter)
+        ]
+    if args.list:
+        for case in cases:
+            status = "" if inputs_of(case) else "  (no inputs, skipped)"
+            print(f"{case.key}  [{case.claimed or '-'}]{status}")
+        return 0
+
+    # Run cases
+    print("\n>> Benchmark Sweeps:\n")
+    results = run(cases, quick=args.quick, repeat=args.repeat,
+                  warmup=args.warmup, budget=args.budget)
+
+    # Summary of fitted and claimed exponents
+    print("\n>> Growth Exponents (fitted vs claimed):\n")
+    for r in results["results"]:
+        fitted, claimed = r["exponent"], r["claimed_exponent"]
+        print(
+            f"  {r['case']:<64s} {_format_exponent(fitted):>6s}"
+            f"  vs {_format_exponent(claimed):>5s}  {r['claimed'] or ''}"
+            )
+    if args.output:
+        save_results(results, args.output)
+        print(f"\nResults written to {args.output}")
+
+    # Compare with the baseline
+    status = 0
+    if args.baseline:
+        slowdowns = compare(results, load_results(args.baseline),
+                            args.threshold)
+        print(f"\n>> Comparison with {args.baseline}:\n")
+        for case, ratio in slowdowns:
+            print(f"  SLOWER {case}: {ratio:.2f}x")
+        if slowdowns:
+            status = 1
+        else:
+            print(f"  No slowdowns beyond {1+args.threshold:.2f}x")
+    print()
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+"""
+Discovery of Benchmark Cases
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-18
+
+Implements the discovery of the public algorithms of the repository:
+every module of the algorithm packages is imported, and each public
+function it defines becomes one benchmark case per "method=" variant.
+Variants are read from the "---> Options:" line of the "method"
+argument in the docstring, and the claimed complexity of each variant
+from its "Theta Notation:" (or "Big-O Notation:") section
+
+"""
+
+# Standard library imports
+import importlib
+import inspect
+import math
+import pkgutil
+import re
+from collections import namedtuple
+
+
+# Packages with algorithms
+DEFAULT_PACKAGES = (
+    "sorting", "searching", "series", "linear_algebra", "polynomials",
+    "random_utils"
+    )
+
+# Benchmark case
+#   - key (str): Module-qualified name (with the method in brackets);
+#   - func (function): Public function;
+#   - method (str): Value of the "method" argument (None if absent);
+#   - claimed (str): Claimed complexity (None if not documented).
+Case = namedtuple("Case", ["key", "func", "method", "claimed"])
+
+# Exponents of the words that follow claimed complexities
+_WORDS = {"logarithmic": 0, "linear": 1, "quadratic": 2, "cubic": 3}
+
+
+def discover(packages=DEFAULT_PACKAGES) -> list:
+    """Benchmark Cases of the Public Algorithms of Packages
+
+    > Arguments:
+        - packages (tuple): Names of the packages.
+            ---> Defaults to the algorithm packages of the repository.
+
+    > Output:
+        - List of Case, in package, module and method order.
+    """
+    cases = []
+    for module in _modules(packages):
+        for name, func in inspect.getmembers(module, inspect.isfunction):
+            if name.startswith("_") or func.__module__ != module.__name__:
+                continue
+
+            key = f"{module.__name__}.{name}"
+            doc = inspect.getdoc(func) or ""
+            claims = _claims(doc)
+            if "method" not in inspect.signature(func).parameters:
+                cases.append(Case(key, func, None, claims.get(None)))
+                continue
+            named = any(claim is not None for claim in claims)
+            for method in _options(doc):
+                cases.append(Case(
+                    f"{key}[{method}]", func, method,
+                    claims.get(method if named else None)
+                    ))
+    return cases
+
+
+def claimed_exponent(claimed:str):
+    """Polynomial Exponent of a Claimed Complexity
+
+    > Arguments:
+        - claimed (str): Claimed complexity, e.g. "n**lg(7)" or
+          "n*lg(n)" (optionally followed by a word in parentheses,
+          e.g. "n*2" (quadratic)).
+
+    > Output:
+        - Exponent (float, logarithmic factors ignored, inf for
+          exponential complexities), or None if not understood.
+    """
+    if claimed is None:
+        return None
+
+    # Word in parentheses (e.g. "(quadratic)") takes precedence
+    word = re.search(r"\((\w+)\)\s*$", claimed)
+    if word and word.group(1) in _WORDS:
+        return float(_WORDS[word.group(1)])
+    if word and word.group(1).startswith("exp"):
+        return math.inf
+
+    expression = claimed.split('"')[1] if '"' in claimed else claimed
+    if re.fullmatch(r"\d+\*\*n", expression):
+        return math.inf
+    if re.fullmatch(r"lg\(n\)", expression):
+        return 0.0
+    match = re.fullmatch(r"n(?:\*\*(\w+(?:\(\d+\))?))?(?:\*lg\(n\))?",
+                         expression)
+    if match is None:
+        return None
+    power = match.group(1)
+    if power is None:
+        return 1.0
+    if power.startswith("lg("):
+        return math.log2(int(power[3:-1]))
+    return float(power) if power.isdigit() else None
+
+
+def _modules(packages) -> list:
+    """Imported modules of the packages (modules failing to import are
+    skipped)"""
+    modules = []
+    for package in packages:
+        root = importlib.import_module(package)
+        for info in pkgutil.iter_modules(root.__path__):
+            if info.ispkg or info.name.startswith("_"):
+                continue
+            try:
+                modules.append(
+                    importlib.import_module(f"{package}.{info.name}")
+                    )
+            except ImportError:
+                continue
+    return sorted(modules, key=lambda module: module.__name__)
+
+
+def _options(doc:str) -> list:
+    """Values listed in the "---> Options:" line of the method argument"""
+    match = re.search(
+        r"-\s*method\b.*?--->\s*Options:(.*?)(?:--->|\n\s*-\s|\Z)",
+        doc, re.S
+        )
+    return re.findall(r'"([^"]+)"', match.group(1)) if match else []
+
+
+def _claims(doc:str) -> dict:
+    """Claimed complexity of each method (key None for the function)"""
+    section = re.search(
+        r"(?:Theta|Big-O) Notation:\n(.*?)(?:\n\s*\n|\Z)", doc, re.S
+        )
+    if section is None:
+        return {}
+
+    claims = {}
+    for line in re.split(r"\n\s*-\s", "\n" + section.group(1)):
+        line = " ".join(line.split())
+        match = re.search(r'yields? ("[^"]+"(?: \(\w+\))?)', line)
+        if match is None:
+            continue
+        names = re.findall(r'"([^"]+)"', line[:match.start()])
+        for name in names or [None]:
+            claims.setdefault(name, match.group(1))
+        claims.setdefault(None, match.group(1))
+    return claims
@@ -0,0 +1,213 @@
+"""
+Benchmark Harness
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-18
+
+Implements the timing of the benchmark cases over size sweeps (with
+warmup calls and repeats), the fit of their empirical growth exponents
+(slope of log(time) against log(n)), and the JSON results that later
+runs compare against as a baseline
+
+"""
+
+# Standard library imports
+import json
+import math
+import platform
+import sys
+import time
+
+# Local application imports
+from bench.discovery import claimed_exponent
+from bench.inputs import inputs_of
+from linear_algebra.backends import get_backend
+
+
+# Shortest measurement (calls are looped until it is reached)
+_MIN_TIME = 0.01
+
+
+def time_call(func, repeat:int=3, warmup:int=1) -> float:
+    """Best Time per Call of a Function
+
+    Calls are looped until one measurement lasts at least 10 ms, so
+    fast functions are timed above the clock resolution.
+
+    > Arguments:
+        - func (function): Function called without arguments;
+        - repeat (int): Measurements (best one is kept).
+            ---> Defaults to 3.
+        - warmup (int): Calls before the measurements.
+            ---> Defaults to 1.
+
+    > Output:
+        - Seconds per call.
+    """
+    for _ in range(warmup):
+        func()
+
+    # Calls per measurement
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= _MIN_TIME:
+            break
+        loops *= 10
+
+    # Best measurement
+    best = elapsed
+    for _ in range(repeat-1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        best = min(best, time.perf_counter() - start)
+    return best / loops
+
+
+def fit_exponent(sizes:list, seconds:list):
+    """Empirical Growth Exponent (least squares slope in log-log)
+
+    > Arguments:
+        - sizes (list): Sizes of the sweep;
+        - seconds (list): Time per call of each size.
+
+    > Output:
+        - Exponent k of time ~ n**k, or None with fewer than 2 sizes.
+    """
+    if len(sizes) < 2:
+        return None
+    X = [math.log(n) for n in sizes]
+    Y = [math.log(max(t, 1e-12)) for t in seconds]
+    mx, my = sum(X) / len(X), sum(Y) / len(Y)
+    sxx = sum((x - mx)**2 for x in X)
+    sxy = sum((x - mx)*(y - my) for x, y in zip(X, Y))
+    return sxy / sxx
+
+
+def run_case(case, sizes:list=None, repeat:int=3, warmup:int=1,
+             budget:float=1.0, report=print) -> dict:
+    """Time a Benchmark Case over its Size Sweep
+
+    > Arguments:
+        - case (Case): Benchmark case (see "bench.discovery");
+        - sizes (list): Sizes of the sweep.
+            ---> Defaults to None (sizes of "bench.inputs").
+        - repeat (int), warmup (int): See "time_call";
+        - budget (float): Larger sizes are skipped once a call takes
+          more than "budget" seconds.
+            ---> Defaults to 1.0.
+        - report (function): Called with a line per size.
+            ---> Defaults to print.
+
+    > Output:
+        - Result dictionary (case, sizes, seconds, fitted and claimed
+          exponents), or None if the case has no inputs.
+    """
+    inputs = inputs_of(case)
+    if inputs is None:
+        return None
+    setup, default_sizes = inputs
+    kwargs = {} if case.method is None else {"method": case.method}
+
+    timed, seconds = [], []
+    for n in sizes or default_sizes:
+        t = time_call(setup(case.func, n, kwargs), repeat, warmup)
+        timed.append(n)
+        seconds.append(t)
+        report(f"  {case.key:<64s} n = {n:8d}: {t:12.6f} s")
+        if t > budget:
+            break
+
+    return {
+        "case": case.key,
+        "sizes": timed,
+        "seconds": seconds,
+        "exponent": fit_exponent(timed, seconds),
+        "claimed": case.claimed,
+        "claimed_exponent": claimed_exponent(case.claimed),
+        }
+
+
+def run(cases:list, quick:bool=False, **options) -> dict:
+    """Run Benchmark Cases
+
+    > Arguments:
+        - cases (list): Benchmark cases;
+        - quick (bool): Only time the first 3 sizes of each sweep.
+            ---> Defaults to False.
+        - options: Options of "run_case".
+
+    > Output:
+        - Results dictionary ("meta" and one "results" entry per case
+          with inputs).
+    """
+    results = []
+    for case in cases:
+        inputs = inputs_of(case)
+        if inputs is None:
+            continue
+        sizes = inputs[1][:3] if quick else None
+        results.append(run_case(case, sizes, **options))
+    return {"meta": _meta(), "results": results}
+
+
+def compare(results:dict, baseline:dict, threshold:float=0.25) -> list:
+    """Slowdowns Against a Baseline
+
+    A case slows down when the geometric mean of its time ratios
+    (over the sizes timed in both runs) exceeds 1 + threshold.
+
+    > Arguments:
+        - results (dict): Results of "run";
+        - baseline (dict): Results of an earlier "run";
+        - threshold (float): Tolerated relative slowdown.
+            ---> Defaults to 0.25.
+
+    > Output:
+        - List of (case, ratio) tuples of the cases that slowed down.
+    """
+    base = {
+        r["case"]: dict(zip(r["sizes"], r["seconds"]))
+        for r in baseline["results"]
+        }
+
+    slowdowns = []
+    for r in results["results"]:
+        before = base.get(r["case"], {})
+        logs = [
+            math.log(t / before[n]) for n, t in zip(r["sizes"], r["seconds"])
+            if n in before and before[n] > 0 and t > 0
+            ]
+        if not logs:
+            continue
+        ratio = math.exp(sum(logs) / len(logs))
+        if ratio > 1 + threshold:
+            slowdowns.append((r["case"], ratio))
+    return slowdowns
+
+
+def save_results(results:dict, path:str) -> None:
+    """Write results to a JSON file"""
+    with open(path, "w") as file:
+        json.dump(results, file, indent=2)
+
+
+def load_results(path:str) -> dict:
+    """Read results from a JSON file"""
+    with open(path) as file:
+        return json.load(file)
+
+
+def _meta() -> dict:
+    """Description of the machine and interpreter of a run"""
+    return {
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "backend": getattr(get_backend(), "name", None),
+        }
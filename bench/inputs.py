@@ -0,0 +1,230 @@
+"""
+Inputs of the Benchmark Cases
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-18
+
+Implements the inputs of each benchmarked function: for a function (and
+method) and a size n, a setup builds the inputs once (from
+"random_utils.workloads", so every run times the same data) and
+returns the call to be timed. Functions discovered without an entry
+here are listed as skipped by the harness
+
+"""
+
+# Standard library imports
+from collections import namedtuple
+
+# Local application imports
+from polynomials.multipoint import clear_tree_cache
+from random_utils.workloads import (
+    generate_sequence, random_matrix, random_polynomial
+    )
+
+
+# Inputs of a function
+#   - setup (function): setup(func, n, kwargs) returning the call;
+#   - sizes (list): Default sizes of the sweep;
+#   - methods (dict): Sizes of specific methods (None to skip one).
+Inputs = namedtuple("Inputs", ["setup", "sizes", "methods"])
+Inputs.__new__.__defaults__ = ({},)
+
+
+def _sequence(func, n:int, kwargs:dict):
+    """Sort-like call on a fresh copy of a uniform sequence"""
+    A = generate_sequence("uniform", n, seed=n)
+    return lambda: func(A[:], **kwargs)
+
+
+def _signed(func, n:int, kwargs:dict):
+    """Call on a sequence of signed integers (maximum subarray)"""
+    A = [x - n//2 for x in generate_sequence("uniform", n, seed=n)]
+    return lambda: func(A, **kwargs)
+
+
+def _search(func, n:int, kwargs:dict):
+    """Search of a present key in a sorted sequence"""
+    A = generate_sequence("sorted", n)
+    key = A[(7*n) // 11]
+    return lambda: func(A, key, **kwargs)
+
+
+def _index(func, n:int, kwargs:dict):
+    """Call with the size as the only argument (fibonacci index)"""
+    return lambda: func(n, **kwargs)
+
+
+def _matrix(func, n:int, kwargs:dict):
+    """Call on one n x n matrix"""
+    A = random_matrix(n, n, seed=n)
+    return lambda: func(A, **kwargs)
+
+
+def _matrices(func, n:int, kwargs:dict):
+    """Call on two n x n matrices"""
+    A, B = random_matrix(n, n, seed=n), random_matrix(n, n, seed=n+1)
+    return lambda: func(A, B, **kwargs)
+
+
+def _matvec(func, n:int, kwargs:dict):
+    """Call on an n x n matrix and a vector of n elements"""
+    A = random_matrix(n, n, seed=n)
+    x = random_matrix(1, n, seed=n+1)[0]
+    return lambda: func(A, x, **kwargs)
+
+
+def _polynomials(func, n:int, kwargs:dict):
+    """Call on two integer polynomials of n coefficients"""
+    a = random_polynomial(n-1, seed=n, typecode="q")
+    b = random_polynomial(n-1, seed=n+1, typecode="q")
+    return lambda: func(a, b, **kwargs)
+
+
+def _point(func, n:int, kwargs:dict):
+    """Call on a polynomial of n coefficients and one point"""
+    coeffs = random_polynomial(n-1, seed=n)
+    return lambda: func(coeffs, 0.5, **kwargs)
+
+
+def _points(func, n:int, kwargs:dict):
+    """Call on a polynomial of degree 16 and n points"""
+    coeffs = random_polynomial(16, seed=n)
+    xs = random_matrix(1, n, seed=n+1)[0]
+    return lambda: func(coeffs, xs, **kwargs)
+
+
+def _tree(func, n:int, kwargs:dict):
+    """Subproduct tree call on n integer points (cache cleared)"""
+    points = generate_sequence("uniform", n, seed=n, high=64*n)
+    points = list(dict.fromkeys(points))
+    values = random_polynomial(len(points)-1, seed=n, typecode="q")
+
+    def call():
+        clear_tree_cache()
+        return func(points, values, **kwargs)
+    return call
+
+
+def _multipoint(func, n:int, kwargs:dict):
+    """Evaluation of a polynomial of n coefficients at n points"""
+    points = list(dict.fromkeys(
+        generate_sequence("uniform", n, seed=n, high=64*n)
+        ))
+    coeffs = random_polynomial(n-1, seed=n, typecode="q")
+
+    def call():
+        clear_tree_cache()
+        return func(coeffs, points, **kwargs)
+    return call
+
+
+def _roots(func, n:int, kwargs:dict):
+    """Root search of a quintic from n starting points"""
+    starts = [20*x for x in random_matrix(1, n, seed=n)[0]]
+    coeffs = [-2310, 727, 382, -72, -8, 1]
+    return lambda: func(coeffs, starts, **kwargs)
+
+
+def _stream(func, n:int, kwargs:dict):
+    """Sample of 100 elements of a stream of n elements"""
+    return lambda: func(range(n), 100, **kwargs)
+
+
+def _weighted(func, n:int, kwargs:dict):
+    """Weighted sample of 100 elements of n (element, weight) pairs"""
+    weights = generate_sequence("zipf", n, seed=n)
+    pairs = list(enumerate(weights))
+    return lambda: func(pairs, 100, **kwargs)
+
+
+# Inputs of the benchmarked functions (module-qualified names)
+INPUTS = {
+    "sorting.bubble_sort.bubble_sort": Inputs(
+        _sequence, [250, 500, 1000, 2000]
+        ),
+    "sorting.insertion_sort.insertion_sort": Inputs(
+        _sequence, [250, 500, 1000, 2000]
+        ),
+    "sorting.selection_sort.selection_sort": Inputs(
+        _sequence, [250, 500, 1000, 2000]
+        ),
+    "sorting.merge_sort.merge_sort": Inputs(
+        _sequence, [4000, 8000, 16000, 32000]
+        ),
+    "sorting.quick_sort.quick_sort": Inputs(
+        _sequence, [4000, 8000, 16000, 32000]
+        ),
+    "searching.binary_search.binary_search": Inputs(
+        _search, [10**3, 10**4, 10**5, 10**6]
+        ),
+    "searching.maximum_subarray.maximum_subarray": Inputs(
+        _signed, [4000, 8000, 16000, 32000],
+        {"brute_force": [125, 250, 500, 1000]}
+        ),
+    "series.fibonacci.fibo": Inputs(
+        _index, [1000, 2000, 4000, 8000, 16000],
+        {"recursive": [12, 14, 16, 18, 20], "top-down": [100, 200, 400, 800]}
+        ),
+    "linear_algebra.matrix_base_operations.matrix_add": Inputs(
+        _matrices, [64, 128, 256, 512]
+        ),
+    "linear_algebra.matrix_base_operations.matrix_subtract": Inputs(
+        _matrices, [64, 128, 256, 512]
+        ),
+    "linear_algebra.matrix_base_operations.matrix_multiply": Inputs(
+        _matrices, [32, 64, 128, 256], {"out_of_core": None}
+        ),
+    "linear_algebra.lup_decomposition.lup_decomposition": Inputs(
+        _matrix, [32, 64, 128, 256]
+        ),
+    "linear_algebra.batch_operations.matvec": Inputs(
+        _matvec, [128, 256, 512, 1024]
+        ),
+    "polynomials.polynomial.poly_multiply": Inputs(
+        _polynomials, [256, 512, 1024, 2048],
+        {"schoolbook": [64, 128, 256, 512]}
+        ),
+    "polynomials.horner_rule_polys.horner_eval": Inputs(
+        _point, [64, 256, 1024, 4096]
+        ),
+    "polynomials.horner_rule_polys.estrin_eval": Inputs(
+        _point, [64, 256, 1024, 4096]
+        ),
+    "polynomials.horner_rule_polys.horner_eval_many": Inputs(
+        _points, [10**3, 10**4, 10**5]
+        ),
+    "polynomials.multipoint.multipoint_eval": Inputs(
+        _multipoint, [64, 128, 256, 512]
+        ),
+    "polynomials.multipoint.interpolate": Inputs(
+        _tree, [64, 128, 256, 512]
+        ),
+    "polynomials.root_finding.newton_roots": Inputs(
+        _roots, [1000, 4000, 16000]
+        ),
+    "random_utils.array_randomizers.array_randomize": Inputs(
+        _sequence, [10**4, 4*10**4, 16*10**4]
+        ),
+    "random_utils.reservoir_sampling.reservoir_sample": Inputs(
+        _stream, [10**5, 10**6, 10**7]
+        ),
+    "random_utils.reservoir_sampling.weighted_reservoir_sample": Inputs(
+        _weighted, [25000, 10**5, 4*10**5]
+        ),
+    }
+
+
+def inputs_of(case):
+    """Setup and sizes of a benchmark case
+
+    > Arguments:
+        - case (Case): Benchmark case (see "bench.discovery").
+
+    > Output:
+        - Tuple (setup, sizes), or None if the case has no inputs.
+    """
+    inputs = INPUTS.get(case.key.split("[")[0])
+    if inputs is None:
+        return None
+    sizes = inputs.methods.get(case.method, inputs.sizes)
+    return None if sizes is None else (inputs.setup, sizes)
@@ -0,0 +1,242 @@
+"""
+Operation-Count and Recursion Instrumentation
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-18
+
+Implements an opt-in instrumentation of the recursive kernels of the
+repository (quick sort, merge sort, divide and conquer maximum subarray,
+fibonacci and Strassen's method), collecting comparison, swap and move
+counts, calls and recursion depths, per-phase timings and the peak
+allocation of a block of code. The kernels are looked up as module
+globals (also by their own recursive calls), so instrumented versions
+are swapped in only inside "with profile() as stats:" and the originals
+are restored on exit: code outside the block runs the very same
+functions, with no overhead. Counts are derived from the arguments and
+results of the original kernels, which run unchanged inside the block
+
+"""
+
+# Standard library imports
+import importlib
+import random
+import tracemalloc
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from contextlib import contextmanager
+from time import perf_counter
+
+
+class ProfileStats:
+    """Metrics Collected by "profile"
+
+    > Attributes:
+        - comparisons (int): Element comparisons of the sorts;
+        - swaps (int): Element swaps of the quick sort partitions;
+        - moves (int): Element writes of the merge sort merges;
+        - calls (Counter): Calls of each kernel (recursive ones included);
+        - depth (Counter): Maximum recursion depth of each kernel;
+        - seconds (Counter): Time spent in each kernel or phase (nested
+          calls of a kernel are timed once, by the outermost one);
+        - peak_bytes (int): Peak traced allocation of the block (None
+          if memory was not traced).
+    """
+    __slots__ = ("comparisons", "swaps", "moves", "calls", "depth",
+                 "seconds", "peak_bytes", "_active")
+
+    def __init__(self):
+        self.comparisons = self.swaps = self.moves = 0
+        self.calls, self.depth, self.seconds = Counter(), Counter(), Counter()
+        self.peak_bytes = None
+        self._active = Counter()
+
+    def report(self) -> str:
+        """Table of the collected metrics"""
+        lines = [
+            f"comparisons: {self.comparisons}", f"swaps: {self.swaps}",
+            f"moves: {self.moves}",
+            ]
+        if self.peak_bytes is not None:
+            lines.append(f"peak allocation: {self.peak_bytes} bytes")
+        for name in sorted(self.calls):
+            lines.append(
+                f"{name:<20s} calls: {self.calls[name]:<10d} depth: "
+                f"{self.depth[name]:<6d} seconds: {self.seconds[name]:.6f}"
+                )
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        return (f"ProfileStats(comparisons={self.comparisons}, "
+                f"swaps={self.swaps}, moves={self.moves}, "
+                f"calls={dict(self.calls)}, depth={dict(self.depth)}, "
+                f"peak_bytes={self.peak_bytes})")
+
+
+def _traced(stats:ProfileStats, name:str, func):
+    """Kernel wrapper counting calls and depth and timing the outermost
+    call"""
+    active, calls, depth = stats._active, stats.calls, stats.depth
+
+    def traced(*args, **kwargs):
+        calls[name] += 1
+        active[name] += 1
+        level = active[name]
+        if level > depth[name]:
+            depth[name] = level
+        if level > 1:
+            try:
+                return func(*args, **kwargs)
+            finally:
+                active[name] -= 1
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            stats.seconds[name] += perf_counter() - start
+            active[name] -= 1
+    return traced
+
+
+def _countedPartition(stats:ProfileStats, module, original):
+    """Partitioning subroutine of the quick sort counting comparisons and
+    swaps (the original kernel compares each element of A[low:high] to
+    the pivot once and swaps the elements up to its returned index)"""
+    def partition(A:list, low:int, high:int) -> int:
+        pivot_index = original(A, low, high)
+        stats.comparisons += high - low
+        stats.swaps += pivot_index - low + 1
+        return pivot_index
+    return partition
+
+
+def _countedMergeSort(stats:ProfileStats, module, original):
+    """Merge sort recursion counting comparisons and moves (the sorted
+    halves merged by the original kernel are the results of its two
+    recursive calls, i.e. of the traced kernel, kept on a stack)"""
+    stack = []
+
+    def merge_sort(A:list) -> list:
+        stack.append([])
+        try:
+            A = original(A)
+        finally:
+            halves = stack.pop()
+        if stack:
+            stack[-1].append(A)
+        if len(halves) == 2:
+            stats.comparisons += _mergeComparisons(*halves)
+            stats.moves += len(A)
+        return A
+    return merge_sort
+
+
+def _mergeComparisons(a:list, b:list) -> int:
+    """Comparisons of the merge of two sorted lists (elements placed
+    before one of them runs out, ties taken from the left one)"""
+    if a[-1] <= b[-1]:
+        return len(a) + bisect_left(b, a[-1])
+    return len(b) + bisect_right(a, b[-1])
+
+
+# Instrumented kernels as (module, global, name, counted version) tuples,
+# where the counted version (None for the original) is built from the
+# stats, the module and the original kernel, and is then traced
+_KERNELS = (
+    ("sorting.quick_sort", "_partition_quick_sort", "quick_sort.partition",
+     _countedPartition),
+    ("sorting.quick_sort", "_quick_sort_std", "quick_sort", None),
+    ("sorting.quick_sort", "_quick_sort_randomized", "quick_sort", None),
+    ("sorting.merge_sort", "_merge_sort", "merge_sort", _countedMergeSort),
+    ("searching.maximum_subarray", "_maxSubarray_DaC", "maximum_subarray",
+     None),
+    ("series.fibonacci", "_fibo_recursive", "fibo", None),
+    ("series.fibonacci", "_fibo_bottom_up", "fibo", None),
+    ("series.fibonacci", "_fibo_top_down", "fibo", None),
+    ("series.fibonacci", "_fibo_squaring", "fibo", None),
+    ("linear_algebra.matrix_base_operations", "_matrixMult_Strassen",
+     "strassen", None),
+    ("linear_algebra.matrix_base_operations", "_strassenSquare",
+     "strassen.recursion", None),
+    ("linear_algebra.matrix_base_operations", "_strassenWorkspace",
+     "strassen.workspace", None),
+    ("linear_algebra.matrix_base_operations", "_cutoffPadding",
+     "matmul.padding", None),
+    ("linear_algebra.matrix_base_operations", "_matrixMult_stdFlat",
+     "matmul.leaf", None),
+    ("linear_algebra.matrix_base_operations", "_combineInto",
+     "matmul.sums", None),
+    )
+
+
+@contextmanager
+def profile(memory:bool=True):
+    """Collect Metrics of the Instrumented Kernels Inside a Block
+
+    Kernels are module globals swapped for the whole interpreter, so
+    calls from other threads during the block are counted as well.
+
+    > Arguments:
+        - memory (bool): Trace the peak allocation of the block with
+          "tracemalloc" (slows allocations down while enabled).
+            ---> Defaults to True.
+
+    > Output:
+        - Context manager yielding the ProfileStats of the block.
+    """
+    stats = ProfileStats()
+
+    # Swap the kernels in
+    swapped = []
+    for module_name, attribute, name, counted in _KERNELS:
+        module = importlib.import_module(module_name)
+        original = getattr(module, attribute)
+        kernel = original if counted is None else counted(
+            stats, module, original
+            )
+        swapped.append((module, attribute, original))
+        setattr(module, attribute, _traced(stats, name, kernel))
+
+    # Start tracing allocations (unless already traced by the caller)
+    tracing = memory and not tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.start()
+    if memory:
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+
+    # Run the block and restore the original kernels
+    try:
+        yield stats
+    finally:
+        if memory:
+            stats.peak_bytes = tracemalloc.get_traced_memory()[1] - base
+        if tracing:
+            tracemalloc.stop()
+        for module, attribute, original in reversed(swapped):
+            setattr(module, attribute, original)
+
+
+if __name__ == "__main__":
+
+    # Local application imports
+    from linear_algebra.matrix_base_operations import matrix_multiply
+    from series.fibonacci import fibo
+    from sorting.merge_sort import merge_sort
+    from sorting.quick_sort import quick_sort
+
+    # Profile a few calls for example purposes
+    A = random.sample(range(10000), 2000)
+    M = [[random.random() for _ in range(64)] for _ in range(64)]
+    print("\n>> Instrumentation Examples:")
+    for title, call in [
+            ("Quick Sort", lambda: quick_sort(A)),
+            ("Merge Sort", lambda: merge_sort(A[:])),
+            ("Fibonacci (recursive)", lambda: fibo(18, "recursive")),
+            ("Strassen", lambda: matrix_multiply(M, M, "strassen",
+                                                 cutoff=16)),
+            ]:
+        with profile() as stats:
+            call()
+        print(f"\n   > {title}:\n")
+        print("\n".join(f"     {line}" for line in stats.report().split("\n")))
+    print()
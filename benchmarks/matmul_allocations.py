@@ -0,0 +1,96 @@
+"""
+Memory Allocation Benchmark of Recursive Matrix Multiplication
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-18
+
+Measures the memory allocated while multiplying square matrices with
+the recursive methods ("divide_conquer" and "strassen"):
+    - peak traced memory (with "tracemalloc");
+    - number and total size of the matrices created (Matrix.zeros)
+
+Usage (from the repository root):
+    python -m benchmarks.matmul_allocations
+    python -m benchmarks.matmul_allocations --sizes 64 128 --cutoff 8
+
+"""
+
+# Standard library imports
+import argparse
+import tracemalloc
+
+# Local application imports
+from linear_algebra.matrix import Matrix
+from linear_algebra.matrix_base_operations import matrix_multiply
+from random_utils.workloads import random_matrix
+
+
+def measure(func) -> tuple:
+    """Peak Memory and Matrices Allocated During a Call
+
+    > Arguments:
+        - func (callable): Function to be called without arguments.
+
+    > Output:
+        - Tuple with peak traced memory (bytes), number of matrices
+          created and total number of elements of those matrices.
+    """
+    counts = [0, 0]
+    zeros = Matrix.zeros.__func__
+
+    # Count matrices created through Matrix.zeros during the call
+    def counting_zeros(cls, rows, cols, typecode="d"):
+        counts[0] += 1
+        counts[1] += rows*cols
+        return zeros(cls, rows, cols, typecode)
+
+    Matrix.zeros = classmethod(counting_zeros)
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        Matrix.zeros = classmethod(zeros)
+    return peak, counts[0], counts[1]
+
+
+def run(sizes:list, cutoff:int) -> list:
+    """Measure Allocations for Each Method and Size
+
+    > Arguments:
+        - sizes (list): Square matrix sizes;
+        - cutoff (int): Leaf cutoff of Strassen's method.
+
+    > Output:
+        - List of (size, method, peak, matrices, elements) tuples.
+    """
+    results = []
+    for n in sizes:
+        A, B = (
+            random_matrix(n, n, seed=seed, output="matrix")
+            for seed in (2*n, 2*n+1)
+            )
+        for method in ["divide_conquer", "strassen"]:
+            stats = measure(lambda: matrix_multiply(A, B, method, cutoff=cutoff))
+            results.append((n, method) + stats)
+            print(
+                f"  n = {n:4d}  {method:>14s}:  peak {stats[0]/1024:9.1f} KiB"
+                f"  | {stats[1]:6d} matrices, {stats[2]/(n*n):6.1f} x n**2"
+                " elements", flush=True
+                )
+    return results
+
+
+if __name__ == "__main__":
+
+    # Parse command line options
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[32, 64, 128])
+    parser.add_argument("--cutoff", type=int, default=8)
+    args = parser.parse_args()
+
+    # Run measurements
+    print("\n>> Recursive Matrix Multiplication Allocations:\n")
+    run(args.sizes, args.cutoff)
+    print()
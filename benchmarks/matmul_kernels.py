@@ -0,0 +1,103 @@
+"""
+Benchmark of Standard Matrix Multiplication Kernels
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-18
+
+Times the standard (i-j-k) kernel against the cache-blocked kernel
+for several tile sizes over a sweep of square matrix sizes (both run
+the pure Python kernels, with the "python" backend active)
+
+Usage (from the repository root):
+    python -m benchmarks.matmul_kernels
+    python -m benchmarks.matmul_kernels --sizes 64 128 256 --tiles 32 128
+
+"""
+
+# Standard library imports
+import argparse
+import time
+
+# Local application imports
+from linear_algebra.backends import set_backend
+from linear_algebra.matrix_base_operations import matrix_multiply
+from random_utils.workloads import random_matrix
+
+
+# Square matrix sizes of the default sweep (64 to 2048)
+DEFAULT_SIZES = [64, 128, 256, 512, 1024, 2048]
+
+# Tile sizes of the default sweep
+DEFAULT_TILES = [32, 64, 128, 256]
+
+
+def _time_call(func, repeat:int) -> float:
+    """Best wall-clock time (seconds) over repeated calls"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_sweep(sizes:list, tiles:list, repeat:int=1,
+              budget:float=float("inf")) -> list:
+    """Run the Benchmark Sweep
+
+    > Arguments:
+        - sizes (list): Square matrix sizes;
+        - tiles (list): Tile sizes of the blocked kernel;
+        - repeat (int): Calls per configuration (best time is kept);
+        - budget (float): Skip a kernel on larger sizes once a single
+          call takes more than "budget" seconds.
+
+    > Output:
+        - List of (size, kernel, seconds) tuples.
+    """
+    results = []
+    kernels = [("standard", {"method": "standard"})] + [
+        (f"blocked[{t}]", {"method": "blocked", "tile": t}) for t in tiles
+        ]
+    over_budget = set()
+
+    # Standard products would otherwise run on the NumPy backend
+    set_backend("python")
+    try:
+        for n in sizes:
+            A = random_matrix(n, n, seed=2*n)
+            B = random_matrix(n, n, seed=2*n+1)
+            for name, kwargs in kernels:
+                if name in over_budget:
+                    continue
+                seconds = _time_call(
+                    lambda: matrix_multiply(A, B, **kwargs), repeat
+                    )
+                results.append((n, name, seconds))
+                print(f"  n = {n:5d}  {name:>14s}: {seconds:10.4f} s",
+                      flush=True)
+                if seconds > budget:
+                    over_budget.add(name)
+    finally:
+        set_backend("auto")
+
+    return results
+
+
+if __name__ == "__main__":
+
+    # Parse command line options
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--tiles", type=int, nargs="+", default=DEFAULT_TILES)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument(
+        "--budget", type=float, default=float("inf"),
+        help="skip larger sizes for a kernel once a call exceeds this (s)"
+        )
+    args = parser.parse_args()
+
+    # Run sweep
+    print("\n>> Matrix Multiplication Kernels Benchmark:\n")
+    run_sweep(args.sizes, args.tiles, args.repeat, args.budget)
+    print()
@@ -0,0 +1,132 @@
+"""
+Benchmark of Polynomial Evaluation Methods
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-18
+
+Times the evaluation of random polynomials at a batch of points over a
+sweep of degrees and batch sizes:
+    - "horner": one "horner_eval" call per point;
+    - "estrin": one "estrin_eval" call per point;
+    - "compiled": one call of the "compile_poly" evaluator per point
+      (compiled once per polynomial);
+    - "many[python]": "horner_eval_many" with the "python" backend;
+    - "compiled[map]": "compile_poly" evaluator mapped over the points;
+    - "many[numpy]": "horner_eval_many" with the "numpy" backend;
+    - "estrin[numpy]": one "estrin_eval" call over an ndarray of points;
+    - "compiled[numpy]": one evaluator call over an ndarray of points
+
+Usage (from the repository root):
+    python -m benchmarks.poly_eval
+    python -m benchmarks.poly_eval --degrees 4 64 --batches 1000 100000
+
+"""
+
+# Standard library imports
+import argparse
+import importlib.util
+import random
+import time
+
+# Local application imports
+from linear_algebra.backends import set_backend
+from polynomials.horner_rule_polys import (
+    compile_poly, estrin_eval, horner_eval, horner_eval_many
+    )
+from random_utils.workloads import random_polynomial
+
+
+# Degrees and batch sizes of the default sweep
+DEFAULT_DEGREES = [4, 16, 64, 256]
+DEFAULT_BATCHES = [1000, 100000]
+
+
+def _time_call(func, repeat:int) -> float:
+    """Best wall-clock time (seconds) over repeated calls"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _with_backend(name:str, func):
+    """Function calling "func" with the given backend active"""
+    def call():
+        set_backend(name)
+        try:
+            return func()
+        finally:
+            set_backend("auto")
+    return call
+
+
+def run_sweep(degrees:list, batches:list, repeat:int=1) -> list:
+    """Run the Benchmark Sweep
+
+    > Arguments:
+        - degrees (list): Polynomial degrees;
+        - batches (list): Numbers of points per batch;
+        - repeat (int): Calls per configuration (best time is kept).
+
+    > Output:
+        - List of (degree, batch, method, seconds) tuples.
+    """
+    results = []
+    has_numpy = importlib.util.find_spec("numpy") is not None
+
+    for degree in degrees:
+        rng = random.Random(degree)
+        coeffs = random_polynomial(degree, seed=degree)
+        for batch in batches:
+            xs = [rng.uniform(-1, 1) for _ in range(batch)]
+            poly = compile_poly(coeffs)
+            methods = [
+                ("horner", lambda: [horner_eval(coeffs, x) for x in xs]),
+                ("estrin", lambda: [estrin_eval(coeffs, x) for x in xs]),
+                ("compiled", lambda: [poly(x) for x in xs]),
+                ("many[python]", _with_backend(
+                    "python", lambda: horner_eval_many(coeffs, xs)
+                    )),
+                ("compiled[map]", lambda: list(map(poly, xs))),
+                ]
+            if has_numpy:
+                import numpy
+                X = numpy.array(xs)
+                methods += [
+                    ("many[numpy]", _with_backend(
+                        "numpy", lambda: horner_eval_many(coeffs, X)
+                        )),
+                    ("estrin[numpy]", lambda: estrin_eval(coeffs, X)),
+                    ("compiled[numpy]", lambda: poly(X)),
+                    ]
+
+            for name, func in methods:
+                seconds = _time_call(func, repeat)
+                results.append((degree, batch, name, seconds))
+                print(
+                    f"  degree = {degree:4d}  batch = {batch:7d}"
+                    f"  {name:>15s}: {seconds:10.4f} s", flush=True
+                    )
+
+    return results
+
+
+if __name__ == "__main__":
+
+    # Parse command line options
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "--degrees", type=int, nargs="+", default=DEFAULT_DEGREES
+        )
+    parser.add_argument(
+        "--batches", type=int, nargs="+", default=DEFAULT_BATCHES
+        )
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    # Run sweep
+    print("\n>> Polynomial Evaluation Benchmark:\n")
+    run_sweep(args.degrees, args.batches, args.repeat)
+    print()
@@ -0,0 +1,189 @@
+"""
+Benchmark and Uniformity Check of Array Randomizers
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-18
+
+Times the "array_randomize" methods over a sweep of array sizes:
+    - "permute_sort": sorting random priorities (copy);
+    - "in_place": one "random.randint" call per element (copy);
+    - "fisher_yates[python]": in-place Fisher-Yates, indices drawn
+      with "random.getrandbits";
+    - "fisher_yates[numpy]": in-place Fisher-Yates, indices drawn with
+      a NumPy Generator;
+    - "fisher_yates[ndarray]": in-place Fisher-Yates of an ndarray;
+    - "random.shuffle": standard library reference
+
+and checks that each method draws every permutation of a small array
+with the same probability (chi-squared test over the n! permutations)
+
+Usage (from the repository root):
+    python -m benchmarks.shuffle
+    python -m benchmarks.shuffle --sizes 1000 1000000 --trials 100000
+
+"""
+
+# Standard library imports
+import argparse
+import importlib.util
+import math
+import random
+import time
+
+# Local application imports
+from linear_algebra.backends import set_backend
+from random_utils.array_randomizers import array_randomize
+
+
+# Array sizes of the default sweep
+DEFAULT_SIZES = [1000, 100000, 1000000]
+
+# Array size and number of shuffles of the default uniformity check
+DEFAULT_PERMUTED = 4
+DEFAULT_TRIALS = 240000
+
+# Standard normal quantile of the chi-squared test (significance 0.001)
+_Z_QUANTILE = 3.090
+
+
+def _time_call(func, repeat:int) -> float:
+    """Best wall-clock time (seconds) over repeated calls"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _with_backend(name:str, func):
+    """Function calling "func" with the given backend active"""
+    def call(*args):
+        set_backend(name)
+        try:
+            return func(*args)
+        finally:
+            set_backend("auto")
+    return call
+
+
+def _methods() -> list:
+    """(name, shuffle) pairs, shuffle(A) returning the rearranged list"""
+    methods = [
+        ("permute_sort", lambda A: array_randomize(A, "permute_sort")),
+        ("in_place", lambda A: array_randomize(A, "in_place")),
+        ("fisher_yates[python]", _with_backend(
+            "python", lambda A: array_randomize(A, "fisher_yates")
+            )),
+        ]
+    if importlib.util.find_spec("numpy") is not None:
+        import numpy
+        methods += [
+            ("fisher_yates[numpy]", _with_backend(
+                "numpy", lambda A: array_randomize(A, "fisher_yates")
+                )),
+            ("fisher_yates[ndarray]", _with_backend(
+                "numpy", lambda A: array_randomize(
+                    numpy.array(A), "fisher_yates"
+                    ).tolist()
+                )),
+            ]
+    return methods + [("random.shuffle", lambda A: random.shuffle(A) or A)]
+
+
+def chi_squared_check(shuffle, n:int, trials:int) -> tuple:
+    """Chi-Squared Uniformity Test of a Shuffle
+
+    Shuffles range(n) "trials" times and compares the counts of each
+    of the n! permutations with their expected count. The critical
+    value (significance 0.001) follows the Wilson-Hilferty
+    approximation of the chi-squared quantile.
+
+    > Arguments:
+        - shuffle (function): shuffle(A) returning the rearranged list;
+        - n (int): Size of the shuffled array;
+        - trials (int): Number of shuffles.
+
+    > Output:
+        - (statistic, critical value) tuple, uniform if statistic is
+          lower than the critical value.
+    """
+    counts = {}
+    for _ in range(trials):
+        key = tuple(shuffle(list(range(n))))
+        counts[key] = counts.get(key, 0) + 1
+
+    # Statistic over every permutation (missing ones count as zeros)
+    cells = math.factorial(n)
+    expected = trials / cells
+    statistic = sum((c - expected)**2 / expected for c in counts.values())
+    statistic += (cells - len(counts)) * expected
+
+    # Critical value with cells-1 degrees of freedom
+    dof = cells - 1
+    scale = 2 / (9*dof)
+    critical = dof * (1 - scale + _Z_QUANTILE*math.sqrt(scale))**3
+    return statistic, critical
+
+
+def run_sweep(sizes:list, repeat:int=1) -> list:
+    """Run the Benchmark Sweep
+
+    > Arguments:
+        - sizes (list): Array sizes;
+        - repeat (int): Calls per configuration (best time is kept).
+
+    > Output:
+        - List of (size, method, seconds) tuples.
+    """
+    results = []
+    for n in sizes:
+        A = list(range(n))
+        for name, shuffle in _methods():
+            seconds = _time_call(lambda: shuffle(A), repeat)
+            results.append((n, name, seconds))
+            print(
+                f"  n = {n:8d}  {name:>21s}: {seconds:10.4f} s"
+                f"  ({n/seconds/1e6:6.2f} M elements/s)", flush=True
+                )
+    return results
+
+
+def run_checks(n:int, trials:int) -> list:
+    """Run the Uniformity Checks
+
+    > Arguments:
+        - n (int): Size of the shuffled array;
+        - trials (int): Number of shuffles per method.
+
+    > Output:
+        - List of (method, statistic, critical value) tuples.
+    """
+    results = []
+    for name, shuffle in _methods():
+        statistic, critical = chi_squared_check(shuffle, n, trials)
+        results.append((name, statistic, critical))
+        verdict = "uniform" if statistic < critical else "NOT UNIFORM"
+        print(
+            f"  {name:>21s}: chi2 = {statistic:8.2f}"
+            f"  (critical {critical:.2f})  {verdict}", flush=True
+            )
+    return results
+
+
+if __name__ == "__main__":
+
+    # Parse command line options
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--permuted", type=int, default=DEFAULT_PERMUTED)
+    parser.add_argument("--trials", type=int, default=DEFAULT_TRIALS)
+    args = parser.parse_args()
+
+    # Run uniformity checks and sweep
+    print("\n>> Shuffle Uniformity Check:\n")
+    run_checks(args.permuted, args.trials)
+    print("\n>> Shuffle Benchmark:\n")
+    run_sweep(args.sizes, args.repeat)
+    print()
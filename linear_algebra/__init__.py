@@ -0,0 +1,40 @@
+"""
+Linear Algebra
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-18
+
+Package with the dense, sparse, batched and out-of-core matrix
+operations, their backends and the LUP decomposition (submodules are
+imported on first access)
+
+"""
+
+# Standard library imports
+import importlib
+
+
+# Submodules of the package
+__all__ = [
+    "backends",
+    "batch_operations",
+    "fused_operations",
+    "lup_decomposition",
+    "matrix",
+    "matrix_base_operations",
+    "matrix_chain",
+    "matrix_file",
+    "parallel_multiply",
+    "sparse_matrix",
+    ]
+
+
+def __getattr__(name:str):
+    """Import a submodule on first access"""
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
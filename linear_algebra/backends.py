@@ -0,0 +1,241 @@
+"""
+Computational Backends for 2D Matrices Operations
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-18
+
+Implements a pluggable backend layer for "matrix_add",
+"matrix_subtract" and "matrix_multiply". A backend receives the
+operands of an operation and either returns an ndarray with the
+results or declines (returns NotImplemented), in which case the
+pure-Python implementation runs. Backends:
+    - "python": always declines (pure-Python loops only);
+    - "numpy": vectorized kernels for numeric operands;
+    - "auto": "numpy" when NumPy is installed, "python" otherwise.
+
+NumPy is only imported the first time the "numpy" backend receives
+numeric operands, so the pure-Python path has no extra startup cost.
+Other vectorized paths of the repository get NumPy from "numpy_module"
+and check that integer results fit in int64 (NumPy integer arithmetic
+wraps on overflow) with "int_bound" and "fits_int64".
+
+"""
+
+# Standard library imports
+import importlib.util
+import sys
+from array import array
+
+# Local application imports
+from linear_algebra.matrix import OBJECT, Matrix, fits_int64, infer_typecode
+
+
+class PythonBackend:
+    """Pure-Python Backend (declines every operation)"""
+
+    name = "python"
+
+    def add(self, m:tuple):
+        return NotImplemented
+
+    def subtract(self, m:tuple):
+        return NotImplemented
+
+    def multiply(self, A, B):
+        return NotImplemented
+
+
+class NumpyBackend:
+    """NumPy Backend
+
+    Handles operands whose elements are all int64 or float64 numbers
+    (nested lists, Matrix or ndarrays). Integer operations that could
+    overflow int64 are declined, so results always match the
+    pure-Python implementation.
+    """
+
+    name = "numpy"
+
+    def add(self, m:tuple):
+        X = _numericArrays(m)
+        if X is None or not _fitsInt64(X, "add"):
+            return NotImplemented
+        return numpy_module().add.reduce(X)
+
+    def subtract(self, m:tuple):
+        X = _numericArrays(m)
+        if X is None or not _fitsInt64(X, "add"):
+            return NotImplemented
+        np = numpy_module()
+        if len(X) == 2:
+            return np.subtract(X[0], X[1])
+        return np.subtract(X[0], np.add.reduce(X[1:]))
+
+    def multiply(self, A, B):
+        X = _numericArrays((A, B))
+        if X is None or not _fitsInt64(X, "multiply"):
+            return NotImplemented
+        return X[0] @ X[1]
+
+
+# Registered backends and name of the active one
+_BACKENDS = {"python": PythonBackend(), "numpy": NumpyBackend()}
+_active = "auto"
+
+# NumPy module (imported on first use) and whether it is installed
+_np = None
+_np_installed = None
+
+
+def register_backend(name:str, backend) -> None:
+    """Register a Computational Backend
+
+    > Arguments:
+        - name (str): Backend name (used by "set_backend");
+        - backend: Object with "add(m)", "subtract(m)" and
+          "multiply(A, B)" methods, each returning the results or
+          NotImplemented to fall back to the pure-Python path.
+    """
+    _BACKENDS[name] = backend
+
+
+def set_backend(name:str) -> None:
+    """Select the Active Backend
+
+    > Arguments:
+        - name (str): Backend name.
+            ---> Options: "auto", "python", "numpy" or any name given
+                 to "register_backend".
+    """
+    if name != "auto" and name not in _BACKENDS:
+        raise NotImplementedError(f"Backend '{name}' not implemented!\n")
+    global _active
+    _active = name
+
+
+def get_backend():
+    """Active Backend Object (resolving "auto")"""
+    if _active != "auto":
+        return _BACKENDS[_active]
+    if _numpyAvailable():
+        return _BACKENDS["numpy"]
+    return _BACKENDS["python"]
+
+
+def to_ndarray(X):
+    """Convert a Matrix, nested list or ndarray into an ndarray
+
+    Typed matrices (and their views) are wrapped without copying.
+    """
+    np = numpy_module()
+    if not isinstance(X, Matrix):
+        return np.asarray(X)
+    if X.typecode == OBJECT:
+        return np.array(X.tolist(), dtype=object)
+    if X.rows == 0 or X.cols == 0:
+        return np.zeros(X.shape, dtype=X.typecode)
+
+    # Strided view over the buffer of the matrix
+    flat = np.frombuffer(X.data, dtype=X.typecode)[X.offset:]
+    return np.lib.stride_tricks.as_strided(
+        flat, shape=X.shape,
+        strides=(X.row_stride*flat.itemsize, X.col_stride*flat.itemsize)
+        )
+
+
+def is_ndarray(X) -> bool:
+    """Check whether X is an ndarray (without importing NumPy)"""
+    np = sys.modules.get("numpy")
+    return np is not None and isinstance(X, np.ndarray)
+
+
+def from_ndarray(R, *operands, as_ndarray:bool=False):
+    """Convert Backend Results to the Type of the Operands
+
+    > Arguments:
+        - R (ndarray): Backend results;
+        - operands: Operands of the operation;
+        - as_ndarray (bool): Return the ndarray itself.
+
+    > Output:
+        - ndarray if asked (or if any operand is an ndarray), Matrix if
+          any operand is a Matrix, nested list otherwise.
+    """
+    if as_ndarray or any(is_ndarray(X) for X in operands):
+        return R
+    if any(isinstance(X, Matrix) for X in operands):
+        typecode = "q" if R.dtype.kind in "iu" else "d"
+        data = array(typecode, R.astype(typecode).tobytes())
+        return Matrix(data, R.shape[0], R.shape[1])
+    return R.tolist()
+
+
+def numpy_module():
+    """NumPy Module (imported on first use)"""
+    global _np
+    if _np is None:
+        import numpy
+        _np = numpy
+    return _np
+
+
+def int_bound(X) -> int:
+    """Largest Absolute Value of an Integer ndarray (Python integer, 0
+    for empty arrays)"""
+    return max(-int(X.min()), int(X.max())) if X.size else 0
+
+
+def _numericArrays(m:tuple):
+    """int64/float64 ndarrays of the operands (None if not numeric)"""
+    X = []
+    for A in m:
+        # Typed matrices and numeric ndarrays are wrapped directly
+        if isinstance(A, Matrix):
+            if A.typecode == OBJECT:
+                return None
+            X.append(to_ndarray(A))
+        elif is_ndarray(A):
+            if A.dtype.kind not in "iuf":
+                return None
+            X.append(A)
+
+        # Nested lists are scanned (before importing NumPy) first
+        else:
+            typecode = infer_typecode([x for row in A for x in row])
+            if typecode == OBJECT:
+                return None
+            X.append(numpy_module().array(A, dtype=typecode))
+    return X
+
+
+def _fitsInt64(X:list, operation:str) -> bool:
+    """Check whether integer results are bounded by int64
+
+    > Arguments:
+        - X (list): Operands (ndarrays);
+        - operation (str): "add" (also subtract) or "multiply".
+
+    > Output:
+        - True if any operand holds floats or if the largest possible
+          result fits in int64.
+    """
+    if any(x.dtype.kind == "f" for x in X):
+        return True
+
+    # Largest absolute value of each operand
+    bounds = [int_bound(x) for x in X]
+
+    # Largest possible absolute value of the results
+    if operation == "multiply":
+        bound = bounds[0] * bounds[1] * X[0].shape[1]
+    else:
+        bound = sum(bounds)
+    return fits_int64(bound)
+
+
+def _numpyAvailable() -> bool:
+    """Check whether NumPy can be imported (without importing it)"""
+    global _np_installed
+    if _np_installed is None:
+        _np_installed = importlib.util.find_spec("numpy") is not None
+    return _np_installed
@@ -0,0 +1,235 @@
+"""
+Batched Matrix-Vector and Matrix-Matrix Products
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-18
+
+Implements products over batches of operands (one transform applied
+to many vectors, stacks of small matrix products). Shapes are checked
+once per batch and the products run in a single loop, instead of
+paying the checks and method dispatch of "matrix_multiply" for every
+item. With the "numpy" backend active (see "linear_algebra.backends"),
+numeric batches are computed with a single "einsum" call
+
+"""
+
+# Standard library imports
+from itertools import chain
+from operator import mul
+
+# Local application imports
+from linear_algebra.backends import (
+    fits_int64, get_backend, int_bound, is_ndarray, numpy_module
+    )
+from linear_algebra.matrix import (
+    OBJECT, Matrix, infer_typecode, matrix_shape
+    )
+
+
+def matvec(A, x, as_ndarray:bool=False):
+    """Matrix-Vector Product (y = Ax)
+
+    Theta Notation:
+        - Matrix-vector product yields "m*n" time complexity.
+
+    > Arguments:
+        - A (matrix): Nested list, Matrix or ndarray (m x n);
+        - x (vector): List, array or ndarray with n elements;
+        - as_ndarray (bool): Return results as a NumPy ndarray.
+            ---> Defaults to False.
+
+    > Output:
+        - List with m elements (ndarray if asked or if an operand is an
+          ndarray).
+    """
+    X = x.reshape(1, -1) if is_ndarray(x) else [x]
+    return matvec_many(A, X, as_ndarray)[0]
+
+
+def matvec_many(A, X, as_ndarray:bool=False):
+    """Matrix-Vector Products of one Matrix and a Batch of Vectors
+
+    Theta Notation:
+        - Batched products yield "k*m*n" time complexity for k vectors.
+
+    > Arguments:
+        - A (matrix): Nested list, Matrix or ndarray (m x n);
+        - X (matrix): Batch of k vectors with n elements each (list of
+          vectors, Matrix or ndarray with one vector per row);
+        - as_ndarray (bool): Return results as a NumPy ndarray.
+            ---> Defaults to False.
+
+    > Output:
+        - Results with one vector (m elements) per row: Matrix if X is
+          a Matrix, ndarray if asked (or if an operand is an ndarray),
+          list of lists otherwise.
+    """
+    # Check if dimensions match (once for the whole batch)
+    m, n = matrix_shape(A)
+    if isinstance(X, Matrix) or is_ndarray(X):
+        mismatch = len(X) and matrix_shape(X)[1] != n
+    else:
+        mismatch = any(len(x) != n for x in X)
+    if mismatch:
+        raise ValueError("Matrices dimensions do not match!\n")
+
+    # Vectorized path: Y[k, i] = sum_j A[i, j]*X[k, j]
+    arrays = _numericBatch([A, X], [2, 2], n) if len(X) else None
+    if arrays is not None:
+        Y = numpy_module().einsum("ij,kj->ki", *arrays)
+        return _batchResult(Y, X, as_ndarray or is_ndarray(A))
+
+    # Rows of A extracted once and reused for every vector
+    rows = _rows(A)
+    Y = [[sum(map(mul, row, x)) for row in rows] for x in _vectors(X)]
+
+    # Return results
+    if as_ndarray or is_ndarray(A) or is_ndarray(X):
+        return numpy_module().array(Y).reshape(len(Y), m)
+    if isinstance(X, Matrix):
+        return Matrix.from_list(Y) if Y else Matrix.zeros(0, m)
+    return Y
+
+
+def batch_multiply(As, Bs, as_ndarray:bool=False):
+    """Pairwise Products of two Stacks of 2D Matrices (C[k] = A[k] B[k])
+
+    Theta Notation:
+        - Batched products yield "k*m*n*p" time complexity for k pairs.
+
+    > Arguments:
+        - As (list): Stack of k matrices with shape m x n (list of
+          nested lists or Matrix, or a 3D ndarray);
+        - Bs (list): Stack of k matrices with shape n x p;
+        - as_ndarray (bool): Return results as a 3D NumPy ndarray.
+            ---> Defaults to False.
+
+    > Output:
+        - List with k products (Matrix for Matrix operands), or a 3D
+          ndarray if asked (or if a stack is an ndarray).
+    """
+    # Check if dimensions match (once for the whole batch)
+    if len(As) != len(Bs):
+        raise ValueError("Stacks must have the same length!\n")
+    if not len(As):
+        return numpy_module().zeros((0, 0, 0)) if as_ndarray else []
+    (m, n), (nb, p) = matrix_shape(As[0]), matrix_shape(Bs[0])
+    if n != nb or any(matrix_shape(A) != (m, n) for A in As) or any(
+            matrix_shape(B) != (n, p) for B in Bs):
+        raise ValueError("Matrices dimensions do not match!\n")
+
+    # Vectorized path over the whole stack
+    arrays = _numericBatch([As, Bs], [3, 3], n)
+    if arrays is not None:
+        C = numpy_module().einsum("kij,kjl->kil", *arrays)
+        if as_ndarray or is_ndarray(As) or is_ndarray(Bs):
+            return C
+        if isinstance(As[0], Matrix) or isinstance(Bs[0], Matrix):
+            return [Matrix.from_list(c) for c in C.tolist()]
+        return C.tolist()
+
+    # Products of each pair (columns of B extracted once per pair)
+    C = [
+        [[sum(map(mul, a, b)) for b in cols] for a in _rows(A)]
+        for A, cols in zip(As, (list(zip(*_rows(B))) for B in Bs))
+        ]
+
+    # Return results
+    if as_ndarray or is_ndarray(As) or is_ndarray(Bs):
+        return numpy_module().array(C).reshape(len(C), m, p)
+    if isinstance(As[0], Matrix) or isinstance(Bs[0], Matrix):
+        return [Matrix.from_list(c) if m else Matrix.zeros(0, p) for c in C]
+    return C
+
+
+def _rows(A) -> list:
+    """Rows of a 2D matrix (as lists, or as-is for nested lists)"""
+    if isinstance(A, Matrix) or is_ndarray(A):
+        return A.tolist()
+    return A
+
+
+def _vectors(X):
+    """Vectors of a batch (rows of a Matrix or ndarray)"""
+    if isinstance(X, Matrix) or is_ndarray(X):
+        return X.tolist()
+    return X
+
+
+def _numericBatch(operands:list, depths:list, n:int):
+    """int64/float64 ndarrays of batched operands (products only)
+
+    > Arguments:
+        - operands (list): Operands (matrices, vector batches or stacks);
+        - depths (list): Nesting depth of each operand (2 for matrices
+          and vector batches, 3 for stacks);
+        - n (int): Length of the dot products.
+
+    > Output:
+        - List of ndarrays, or None if the "numpy" backend is not
+          active, if an operand is not numeric or if integer products
+          could overflow int64.
+    """
+    if getattr(get_backend(), "name", None) != "numpy":
+        return None
+
+    arrays = []
+    for X, depth in zip(operands, depths):
+        # Numeric ndarrays are used directly
+        if is_ndarray(X):
+            if X.dtype.kind not in "iuf":
+                return None
+            arrays.append(X)
+            continue
+
+        # Other operands are scanned (before converting) first
+        X = _nested(X)
+        flat = X
+        for _ in range(depth-1):
+            flat = chain.from_iterable(flat)
+        typecode = infer_typecode(list(flat))
+        if typecode == OBJECT:
+            return None
+        arrays.append(numpy_module().array(X, dtype=typecode))
+
+    # Integer products that could overflow int64 run in pure Python
+    if all(x.dtype.kind in "iu" for x in arrays):
+        bounds = [int_bound(x) for x in arrays]
+        if not fits_int64(bounds[0] * bounds[1] * n):
+            return None
+    return arrays
+
+
+def _nested(X):
+    """Nested lists of a Matrix or of a stack of Matrix"""
+    if isinstance(X, Matrix):
+        return X.tolist()
+    if len(X) and isinstance(X[0], Matrix):
+        return [A.tolist() for A in X]
+    return X
+
+
+def _batchResult(Y, X, as_ndarray:bool):
+    """Convert vectorized batch results to the type of the batch"""
+    if as_ndarray or is_ndarray(X):
+        return Y
+    if isinstance(X, Matrix):
+        typecode = "q" if Y.dtype.kind in "iu" else "d"
+        return Matrix.from_list(Y.tolist(), typecode)
+    return Y.tolist()
+
+
+if __name__ == "__main__":
+
+    # Declare transform, vectors and stacks
+    A = [[0, -1], [1, 0]]
+    X = [[1, 0], [0, 1], [2, 3]]
+    As = [[[1, 2], [3, 4]], [[0, 1], [1, 0]]]
+    Bs = [[[1, 0], [0, 1]], [[5, 6], [7, 8]]]
+
+    print("\n>> Batched Products Example:")
+    print(f"\nA: {A}")
+    print(f"  > matvec(A, [1, 2]): {matvec(A, [1, 2])}")
+    print(f"  > matvec_many(A, {X}): {matvec_many(A, X)}")
+    print(f"\nAs: {As}\nBs: {Bs}")
+    print(f"  > batch_multiply(As, Bs): {batch_multiply(As, Bs)}\n")
@@ -0,0 +1,213 @@
+"""
+Fused In-Place Operations for 2D Matrices
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-18
+
+Implements in-place and fused operations that write linear
+combinations of matrices (e.g. "p5 + p4 - p2 + p6") into a
+preallocated output in a single pass, without allocating
+intermediate matrices
+
+"""
+
+# Standard library imports
+import re
+from functools import lru_cache
+
+# Local application imports
+from linear_algebra.matrix import Matrix, matrix_shape
+
+
+# Term of a linear expression: sign, optional coefficient and a name
+_TERM = re.compile(
+    r"\s*([+-])?\s*(?:(\d+(?:\.\d*)?|\.\d+)\s*\*\s*)?([A-Za-z_]\w*)\s*"
+    )
+
+
+def matrix_combine_into(out, terms:list):
+    """Linear Combination of 2D Matrices into a Preallocated Output
+
+    Theta Notation:
+        - Linear combination yields "n**2" (quadratic) time complexity.
+
+    Every element of "out" is computed in one pass over the operands
+    (out = c1*X1 + c2*X2 + ...). "out" may also appear as an operand.
+
+    > Arguments:
+        - out (matrix): Matrix (or view) or nested list to write into;
+        - terms (list): List of (coefficient, matrix) tuples.
+
+    > Output:
+        - The output matrix "out".
+    """
+    # Check if there are terms to combine
+    if not terms:
+        raise ValueError("Not enough matrices to make computation!\n")
+
+    # Check if matrices dimensions match
+    shape = matrix_shape(out)
+    if any(matrix_shape(X) != shape for _, X in terms):
+        raise ValueError("Matrices dimensions do not match!\n")
+
+    # Return results
+    return _combineInto(out, terms)
+
+
+def matrix_add_into(out, *m):
+    """Addition of 2D Matrices into a Preallocated Output
+
+    > Arguments:
+        - out (matrix): Matrix (or view) or nested list to write into;
+        - m (list): List of 2D matrices.
+
+    > Output:
+        - The output matrix "out" (out = m1 + m2 + ...).
+    """
+    return matrix_combine_into(out, [(1, X) for X in m])
+
+
+def matrix_subtract_into(out, *m):
+    """Subtraction of 2D Matrices into a Preallocated Output
+
+    > Arguments:
+        - out (matrix): Matrix (or view) or nested list to write into;
+        - m (list): List of 2D matrices.
+
+    > Output:
+        - The output matrix "out" (out = m1 - m2 - ...).
+    """
+    return matrix_combine_into(
+        out, [(1, m[0])] + [(-1, X) for X in m[1:]] if m else []
+        )
+
+
+def matrix_axpy(alpha, X, Y):
+    """Scaled Accumulation of 2D Matrices (Y += alpha*X)
+
+    > Arguments:
+        - alpha (number): Scale factor;
+        - X (matrix): Matrix to scale;
+        - Y (matrix): Matrix (or view) or nested list to accumulate into.
+
+    > Output:
+        - The accumulated matrix "Y".
+    """
+    return matrix_combine_into(Y, [(1, Y), (alpha, X)])
+
+
+def matrix_eval_into(out, expr:str, **operands):
+    """Evaluate a Linear Matrix Expression into a Preallocated Output
+
+    > Arguments:
+        - out (matrix): Matrix (or view) or nested list to write into;
+        - expr (str): Sum of optionally scaled names.
+            ---> Example: "p5 + p4 - p2 + 2*p6";
+        - operands: Matrices referenced by the names of the expression.
+
+    > Output:
+        - The output matrix "out".
+    """
+    # Map names of the (parsed and cached) expression to matrices
+    try:
+        terms = [(c, operands[name]) for c, name in _parseExpression(expr)]
+    except KeyError as error:
+        raise ValueError(f"Operand {error} not provided!\n") from None
+
+    # Return results
+    return matrix_combine_into(out, terms)
+
+
+def _combineInto(out, terms:list):
+    """Unchecked Linear Combination into "out" (row by row, one pass)
+
+    > Arguments:
+        - out (matrix): Matrix (or view) or nested list to write into;
+        - terms (list): List of (coefficient, matrix) tuples with the
+          same shape as "out".
+
+    > Output:
+        - The output matrix "out".
+    """
+    coefs = tuple(c for c, _ in terms)
+    kernel = _rowKernel(coefs, tuple(map(type, coefs)))
+    operands = [X for _, X in terms]
+
+    # Flat output matrix
+    if isinstance(out, Matrix):
+        for i in range(out.rows):
+            out.set_row(i, kernel(*[
+                X.row(i) if isinstance(X, Matrix) else X[i] for X in operands
+                ]))
+
+    # Nested list output
+    else:
+        for i, row in enumerate(out):
+            row[:] = kernel(*[
+                X.row(i) if isinstance(X, Matrix) else X[i] for X in operands
+                ])
+
+    return out
+
+
+@lru_cache(maxsize=256)
+def _rowKernel(coefs:tuple, types:tuple):
+    """Compiled One-Pass Kernel for a Row of a Linear Combination
+
+    For coefficients (1, 1, -1) the generated kernel is:
+        lambda r0, r1, r2: [x0 + x1 - x2 for (x0, x1, x2) in zip(r0, r1, r2)]
+
+    > Arguments:
+        - coefs (tuple): Coefficients of the terms;
+        - types (tuple): Types of the coefficients (part of the cache
+          key, as 2 == 2.0 == True would share a kernel otherwise).
+
+    > Output:
+        - Function mapping one row per term to the combined row.
+    """
+    expr, constants = [], {}
+    for k, c in enumerate(coefs):
+        # Integer unit coefficients are folded into the sign of the term
+        # (1.0*x promotes integers to floats, so it is kept)
+        if type(c) is int and c == 1:
+            term = f"x{k}"
+        elif type(c) is int and c == -1:
+            term = f"-x{k}"
+        else:
+            term, constants[f"c{k}"] = f"c{k}*x{k}", c
+        expr.append(term if not expr else (
+            f"- {term[1:]}" if term.startswith("-") else f"+ {term}"
+            ))
+
+    # Build and compile the kernel source
+    rows = ", ".join(f"r{k}" for k in range(len(coefs)))
+    names = ", ".join(f"x{k}" for k in range(len(coefs)))
+    source = f"lambda {rows}: [{' '.join(expr)} for ({names},) in zip({rows})]"
+    return eval(source, constants)
+
+
+@lru_cache(maxsize=256)
+def _parseExpression(expr:str) -> tuple:
+    """Parse "a + 2*b - c" into ((1, "a"), (2, "b"), (-1, "c"))
+
+    Cached by the text of the expression, where "2.0*b" and "2*b"
+    differ, and the parsed coefficients keep their types (int or
+    float) for the kernels of "_combineInto".
+    """
+    terms, pos = [], 0
+    while pos < len(expr):
+        match = _TERM.match(expr, pos)
+
+        # Every term but the first one needs an explicit sign
+        if not match or (terms and not match.group(1)):
+            raise ValueError(f"Invalid expression: '{expr}'\n")
+
+        sign, number, name = match.groups()
+        c = float(number) if number and "." in number else int(number or 1)
+        terms.append((-c if sign == "-" else c, name))
+        pos = match.end()
+
+    # Check if the expression has terms
+    if not terms:
+        raise ValueError(f"Invalid expression: '{expr}'\n")
+    return tuple(terms)
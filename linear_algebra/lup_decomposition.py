@@ -0,0 +1,270 @@
+"""
+LUP Decomposition and Linear Systems Solver
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-18
+
+Implements the LUP decomposition (PA = LU) of square matrices and the
+solution of linear systems Ax = b by forward and back substitution, as
+described on Chapter 28 of the book "Introduction to Algorithms" by
+Thomas H. Cormen et al. (2009). A factorization costs "n**3" and each
+solve against it costs "n**2", so factorizations are returned as
+reusable objects (and optionally cached)
+
+"""
+
+# Standard library imports
+from collections import OrderedDict
+from operator import mul
+
+# Local application imports
+from linear_algebra.matrix import Matrix, matrix_shape
+
+
+# Cached factorizations (least recently used first) and cache size
+_cache = OrderedDict()
+_CACHE_SIZE = 32
+
+
+class LUPFactorization:
+    """LUP Factorization (PA = LU) of a Square Matrix
+
+    L (unit lower triangular) and U (upper triangular) are stored on a
+    single nested list, "LU", as in CLRS: elements below the diagonal
+    belong to L and the remaining ones to U.
+
+    > Attributes:
+        - LU (list): Nested list with L and U;
+        - pi (list): Permutation (row i of PA is row pi[i] of A);
+        - n (int): Order of the matrix.
+    """
+
+    __slots__ = ("LU", "pi", "n")
+
+    def __init__(self, LU:list, pi:list):
+        self.LU, self.pi, self.n = LU, pi, len(LU)
+
+    @property
+    def L(self) -> list:
+        """Nested list with the unit lower triangular matrix L"""
+        return [
+            row[:i] + [1] + [0]*(self.n-i-1) for i, row in enumerate(self.LU)
+            ]
+
+    @property
+    def U(self) -> list:
+        """Nested list with the upper triangular matrix U"""
+        return [[0]*i + row[i:] for i, row in enumerate(self.LU)]
+
+    @property
+    def P(self) -> list:
+        """Nested list with the permutation matrix P"""
+        return [[int(j == p) for j in range(self.n)] for p in self.pi]
+
+    def determinant(self):
+        """Determinant of A (product of the pivots, signed by P)"""
+        det = -1 if _inversions(self.pi) % 2 else 1
+        for i in range(self.n):
+            det *= self.LU[i][i]
+        return det
+
+    def solve(self, B):
+        """Solve AX = B (Theta(n**2) per right-hand side)
+
+        > Arguments:
+            - B: Right-hand side vector (list) or matrix (nested list
+              or Matrix) with one right-hand side per column.
+
+        > Output:
+            - Solution with the same type and shape as B.
+        """
+        # Single right-hand side
+        if not isinstance(B, Matrix) and (not B or not isinstance(B[0], list)):
+            if len(B) != self.n:
+                raise ValueError("Matrices dimensions do not match!\n")
+            return back_substitution(
+                self.LU, forward_substitution(self.LU, self.pi, B)
+                )
+
+        # Check if matrices dimensions match
+        rows, cols = matrix_shape(B)
+        if rows != self.n:
+            raise ValueError("Matrices dimensions do not match!\n")
+
+        # Solve for each column of B
+        columns = B.T.tolist() if isinstance(B, Matrix) else list(zip(*B))
+        X = [list(x) for x in zip(*[self.solve(list(b)) for b in columns])]
+        if isinstance(B, Matrix):
+            return Matrix.from_list(X, "d") if X else Matrix.zeros(0, cols)
+        return X
+
+    def __repr__(self) -> str:
+        return f"LUPFactorization(n={self.n})"
+
+
+def lup_decomposition(A, cache:bool=False) -> LUPFactorization:
+    """LUP Decomposition of a Square Matrix (PA = LU)
+
+    Theta Notation:
+        - LUP decomposition yields "n**3" (cubic) time complexity.
+
+    > Arguments:
+        - A (matrix): Nested list or Matrix representing a square matrix;
+        - cache (bool): Reuse (and store) the factorization of a matrix
+          with the same elements.
+            ---> Defaults to False.
+
+    > Output:
+        - LUPFactorization of A.
+    """
+    rows, cols = matrix_shape(A)
+    if rows != cols:
+        raise ValueError("Matrix must be square!\n")
+
+    # Copy of A (factorized in-place)
+    LU = A.tolist() if isinstance(A, Matrix) else [list(row) for row in A]
+
+    # Cached factorization (keyed by the elements of A, so changes made
+    # to A after it was cached are never missed)
+    if cache:
+        key = tuple(map(tuple, LU))
+        if key in _cache:
+            _cache.move_to_end(key)
+            return _cache[key]
+
+    # Factorize and store
+    F = LUPFactorization(*_lupDecomposition(LU))
+    if cache:
+        _cache[key] = F
+        if len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+    return F
+
+
+def _lupDecomposition(A:list) -> tuple:
+    """In-Place LUP Decomposition (CLRS "LUP-DECOMPOSITION")
+
+    > Arguments:
+        - A (matrix): Nested list (overwritten with L and U).
+
+    > Output:
+        - Tuple with nested list LU and permutation pi.
+    """
+    n = len(A)
+    pi = list(range(n))
+
+    for k in range(n):
+        # Select the pivot with the largest absolute value
+        p = max(range(k, n), key=lambda i: abs(A[i][k]))
+        if A[p][k] == 0:
+            raise ValueError("Matrix is singular!\n")
+
+        # Exchange rows k and p
+        pi[k], pi[p] = pi[p], pi[k]
+        A[k], A[p] = A[p], A[k]
+
+        # Compute multipliers (column k of L) and the Schur complement
+        pivot = A[k]
+        for i in range(k+1, n):
+            row = A[i]
+            row[k] = l = row[k] / pivot[k]
+            if l:
+                row[k+1:] = [a - l*b for a, b in zip(row[k+1:], pivot[k+1:])]
+
+    return A, pi
+
+
+def forward_substitution(LU:list, pi:list, b:list) -> list:
+    """Solve Ly = Pb (L is the unit lower triangular part of LU)
+
+    Theta Notation:
+        - Forward substitution yields "n**2" (quadratic) time complexity.
+
+    > Arguments:
+        - LU (list): Nested list with L and U;
+        - pi (list): Permutation of the rows;
+        - b (list): Right-hand side vector.
+
+    > Output:
+        - List with the solution y.
+    """
+    y = []
+    for i, row in enumerate(LU):
+        y.append(b[pi[i]] - sum(map(mul, row[:i], y)))
+    return y
+
+
+def back_substitution(LU:list, y:list) -> list:
+    """Solve Ux = y (U is the upper triangular part of LU)
+
+    Theta Notation:
+        - Back substitution yields "n**2" (quadratic) time complexity.
+
+    > Arguments:
+        - LU (list): Nested list with L and U;
+        - y (list): Right-hand side vector.
+
+    > Output:
+        - List with the solution x.
+    """
+    n = len(LU)
+    x = [0]*n
+    for i in range(n-1, -1, -1):
+        row = LU[i]
+        x[i] = (y[i] - sum(map(mul, row[i+1:], x[i+1:]))) / row[i]
+    return x
+
+
+def solve(A, B, cache:bool=False):
+    """Solve the Linear System AX = B
+
+    Theta Notation:
+        - Solve yields "n**3" (cubic) time complexity ("n**2" per
+          right-hand side when the factorization is cached).
+
+    > Arguments:
+        - A (matrix): Nested list or Matrix representing a square matrix;
+        - B: Right-hand side vector (list) or matrix (nested list or
+          Matrix) with one right-hand side per column;
+        - cache (bool): Reuse the cached factorization of A.
+            ---> Defaults to False.
+
+    > Output:
+        - Solution with the same type and shape as B.
+    """
+    return lup_decomposition(A, cache).solve(B)
+
+
+def clear_lup_cache() -> None:
+    """Remove every cached factorization"""
+    _cache.clear()
+
+
+def _inversions(pi:list) -> int:
+    """Number of transpositions needed to sort a permutation"""
+    seen, swaps = [False]*len(pi), 0
+    for i in range(len(pi)):
+        j, size = i, 0
+        while not seen[j]:
+            seen[j], j, size = True, pi[j], size + 1
+        swaps += max(size-1, 0)
+    return swaps
+
+
+if __name__ == "__main__":
+
+    # Declare a system (CLRS section 28.1 example)
+    A = [[1, 2, 0], [3, 4, 4], [5, 6, 3]]
+    b = [3, 7, 8]
+    F = lup_decomposition(A)
+
+    print("\n>> LUP Decomposition Example:")
+    print(f"\nA: {A}")
+    print(f"  > L: {F.L}")
+    print(f"  > U: {F.U}")
+    print(f"  > P: {F.P}")
+    print(f"  > det(A): {F.determinant()}")
+    print(f"\nSolve Ax = b, b = {b}")
+    print(f"  > x: {F.solve(b)}")
+    print(f"\nSolve AX = B, B = {[[3, 1], [7, 0], [8, 2]]}")
+    print(f"  > X: {solve(A, [[3, 1], [7, 0], [8, 2]])}\n")
@@ -0,0 +1,363 @@
+"""
+Flat Array-Backed 2D Matrix
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-18
+
+Implements a 2D matrix type that stores its elements on a flat
+row-major buffer (typed "array" for numeric data) described by a shape,
+strides and an offset, so submatrices are O(1) views that share the
+buffer of the original matrix
+
+"""
+
+# Standard library imports
+from array import array
+
+
+# Typecode used for matrices backed by a plain list (any Python object)
+OBJECT = "O"
+
+# Bounds of the signed 64-bit integers stored by array("q")
+_INT64_MIN, _INT64_MAX = -(1 << 63), (1 << 63) - 1
+
+
+class Matrix:
+    """Flat Array-Backed 2D Matrix
+
+    Element [i, j] lives at "data[offset + i*row_stride + j*col_stride]".
+    Slicing a matrix (M[r0:r1, c0:c1]) returns a view, so changes made
+    through the view are visible on the original matrix.
+
+    > Attributes:
+        - data: Flat buffer (array("d"), array("q"), memoryview or list);
+        - rows (int): Number of rows;
+        - cols (int): Number of columns;
+        - row_stride (int): Buffer step between two consecutive rows;
+        - col_stride (int): Buffer step between two consecutive columns;
+        - offset (int): Buffer position of the element [0, 0].
+    """
+
+    __slots__ = ("data", "rows", "cols", "row_stride", "col_stride", "offset")
+
+    def __init__(self, data, rows:int, cols:int, row_stride:int=None,
+                 col_stride:int=1, offset:int=0):
+        # Row-major layout by default
+        if row_stride is None:
+            row_stride = cols * col_stride
+
+        # Check if the buffer holds every element of the matrix
+        if rows and cols:
+            last = offset + (rows-1)*row_stride + (cols-1)*col_stride
+            if offset < 0 or last >= len(data):
+                raise ValueError("Buffer is too small for matrix shape!\n")
+
+        self.data = data
+        self.rows, self.cols = rows, cols
+        self.row_stride, self.col_stride = row_stride, col_stride
+        self.offset = offset
+
+    # ----------------------------------------------------------------
+    # Constructors
+    # ----------------------------------------------------------------
+
+    @classmethod
+    def zeros(cls, rows:int, cols:int, typecode:str="d") -> "Matrix":
+        """Matrix Filled with Zeros
+
+        > Arguments:
+            - rows (int): Number of rows;
+            - cols (int): Number of columns;
+            - typecode (str): Element type.
+                ---> Options: "d" (float64), "q" (int64), "O" (object);
+                ---> Defaults to "d".
+
+        > Output:
+            - Contiguous matrix of zeros.
+        """
+        return cls(_buffer(typecode, rows*cols), rows, cols)
+
+    @classmethod
+    def from_list(cls, A:list, typecode:str=None) -> "Matrix":
+        """Matrix from Nested List
+
+        > Arguments:
+            - A (matrix): Nested list representing a 2D matrix;
+            - typecode (str): Element type.
+                ---> Options: "d", "q", "O";
+                ---> Defaults to None (inferred from the elements).
+
+        > Output:
+            - Contiguous matrix with a copy of the elements of A.
+        """
+        rows = len(A)
+        cols = len(A[0]) if rows else 0
+
+        # Check if every row has the same length
+        if any(len(row) != cols for row in A):
+            raise ValueError("Rows must have the same length!\n")
+
+        # Flatten elements and build buffer
+        flat = [x for row in A for x in row]
+        if typecode is None:
+            typecode = infer_typecode(flat)
+        if typecode == OBJECT:
+            return cls(flat, rows, cols)
+        return cls(array(typecode, flat), rows, cols)
+
+    # ----------------------------------------------------------------
+    # Shape and layout
+    # ----------------------------------------------------------------
+
+    @property
+    def shape(self) -> tuple:
+        """Tuple with number of rows and columns"""
+        return self.rows, self.cols
+
+    @property
+    def strides(self) -> tuple:
+        """Tuple with row and column strides (in elements)"""
+        return self.row_stride, self.col_stride
+
+    @property
+    def typecode(self) -> str:
+        """Element type ("d", "q" or "O" for list-backed matrices)"""
+        if isinstance(self.data, array):
+            return self.data.typecode
+        if isinstance(self.data, memoryview):
+            return self.data.format
+        return OBJECT
+
+    def is_contiguous(self) -> bool:
+        """Check whether elements are packed row-major on the buffer"""
+        return self.col_stride == 1 and (
+            self.row_stride == self.cols or self.rows <= 1
+            )
+
+    def __len__(self) -> int:
+        return self.rows
+
+    # ----------------------------------------------------------------
+    # Element access and views
+    # ----------------------------------------------------------------
+
+    def view(self, row_start:int, row_stop:int,
+             col_start:int, col_stop:int) -> "Matrix":
+        """Submatrix View (O(1), shares buffer)
+
+        > Arguments:
+            - row_start, row_stop (int): Row bounds (stop excluded);
+            - col_start, col_stop (int): Column bounds (stop excluded).
+
+        > Output:
+            - Matrix view over the same buffer.
+        """
+        # Check view bounds
+        if not (0 <= row_start <= row_stop <= self.rows and
+                0 <= col_start <= col_stop <= self.cols):
+            raise IndexError("View bounds out of range!\n")
+
+        return Matrix(
+            self.data, row_stop-row_start, col_stop-col_start,
+            self.row_stride, self.col_stride,
+            self.offset + row_start*self.row_stride + col_start*self.col_stride
+            )
+
+    @property
+    def T(self) -> "Matrix":
+        """Transposed view (O(1), shares buffer)"""
+        return Matrix(
+            self.data, self.cols, self.rows,
+            self.col_stride, self.row_stride, self.offset
+            )
+
+    def row(self, i:int) -> list:
+        """List with a copy of the elements of row i"""
+        start = self.offset + i*self.row_stride
+        stop = start + self.cols*self.col_stride
+        return list(self.data[start:stop:self.col_stride])
+
+    def col(self, j:int) -> list:
+        """List with a copy of the elements of column j"""
+        start = self.offset + j*self.col_stride
+        stop = start + self.rows*self.row_stride
+        return list(self.data[start:stop:self.row_stride])
+
+    def set_row(self, i:int, values) -> None:
+        """Overwrite the elements of row i with the given values"""
+        start = self.offset + i*self.row_stride
+        stop = start + self.cols*self.col_stride
+        self.data[start:stop:self.col_stride] = _buffer_from(
+            self.typecode, values
+            )
+
+    def __getitem__(self, key):
+        # Row access (M[i]) returns a copy of the row as a list
+        if not isinstance(key, tuple):
+            if key < 0:
+                key += self.rows
+            if not 0 <= key < self.rows:
+                raise IndexError("Row index out of range!\n")
+            return self.row(key)
+
+        i, j = key
+
+        # Element access (M[i, j])
+        if not isinstance(i, slice) and not isinstance(j, slice):
+            return self.data[self._index(i, j)]
+
+        # Submatrix view (M[r0:r1, c0:c1])
+        r0, r1 = _slice_bounds(i, self.rows)
+        c0, c1 = _slice_bounds(j, self.cols)
+        return self.view(r0, r1, c0, c1)
+
+    def __setitem__(self, key, value) -> None:
+        i, j = key
+        self.data[self._index(i, j)] = value
+
+    def _index(self, i:int, j:int) -> int:
+        """Buffer position of element [i, j] (negative indices allowed)"""
+        if i < 0:
+            i += self.rows
+        if j < 0:
+            j += self.cols
+        if not (0 <= i < self.rows and 0 <= j < self.cols):
+            raise IndexError("Matrix index out of range!\n")
+        return self.offset + i*self.row_stride + j*self.col_stride
+
+    def __iter__(self):
+        for i in range(self.rows):
+            yield self.row(i)
+
+    # ----------------------------------------------------------------
+    # Copies and conversions
+    # ----------------------------------------------------------------
+
+    def assign(self, source) -> None:
+        """Copy elements of a matrix (or nested list) of the same shape"""
+        if matrix_shape(source) != self.shape:
+            raise ValueError("Matrices dimensions do not match!\n")
+        for i in range(self.rows):
+            self.set_row(i, source[i])
+
+    def copy(self, typecode:str=None) -> "Matrix":
+        """Contiguous copy (optionally converted to another typecode)"""
+        tc = self.typecode if typecode is None else typecode
+        C = Matrix.zeros(self.rows, self.cols, tc)
+        C.assign(self)
+        return C
+
+    def tolist(self) -> list:
+        """Nested list with a copy of the matrix elements"""
+        return [self.row(i) for i in range(self.rows)]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (Matrix, list)):
+            return matrix_shape(other) == self.shape and all(
+                self.row(i) == list(other[i]) for i in range(self.rows)
+                )
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"Matrix({self.tolist()}, typecode='{self.typecode}')"
+
+
+def as_matrix(A, typecode:str=None) -> Matrix:
+    """Convert a Nested List into a Matrix (Matrices are returned as-is)
+
+    > Arguments:
+        - A (matrix): Nested list or Matrix;
+        - typecode (str): Element type for nested lists.
+            ---> Defaults to None (inferred from the elements).
+
+    > Output:
+        - Matrix.
+    """
+    if isinstance(A, Matrix):
+        return A
+    return Matrix.from_list(A, typecode)
+
+
+def promote_typecode(*m) -> str:
+    """Common Element Type of a Group of Matrices
+
+    Nested lists count as object ("O") matrices, so mixing them with
+    typed matrices never truncates their elements.
+
+    > Arguments:
+        - m: Matrices (any type with a "typecode") or nested lists.
+
+    > Output:
+        - "O" if any operand is object-backed, "d" if any operand holds
+          floats, "q" otherwise.
+    """
+    codes = {getattr(X, "typecode", OBJECT) for X in m}
+    if OBJECT in codes:
+        return OBJECT
+    if "d" in codes:
+        return "d"
+    return "q"
+
+
+def matrix_shape(A) -> tuple:
+    """Shape of a nested list or of any matrix with a "shape" attribute"""
+    if isinstance(A, Matrix):
+        return A.rows, A.cols
+    if hasattr(A, "shape"):
+        return tuple(A.shape)
+    return len(A), (len(A[0]) if len(A) else 0)
+
+
+def infer_typecode(values:list) -> str:
+    """Narrowest Typecode Able to Store the Given Values
+
+    > Arguments:
+        - values (list): Matrix elements.
+
+    > Output:
+        - "q" for int64 integers, "d" for floats (possibly mixed with
+          integers) and "O" otherwise (including integers that do not
+          fit in 64 bits, which would lose precision as floats).
+    """
+    kinds = set(map(type, values))
+    if kinds <= {int, float}:
+        if float in kinds:
+            return "d"
+        if not values or (fits_int64(min(values))
+                          and fits_int64(max(values))):
+            return "q"
+    return OBJECT
+
+
+def fits_int64(x:int) -> bool:
+    """Check whether an integer fits in int64 (e.g. the bound of the
+    results of an integer NumPy computation)"""
+    return _INT64_MIN <= x <= _INT64_MAX
+
+
+def _buffer(typecode:str, size:int):
+    """Flat buffer of zeros for the given typecode"""
+    if typecode == OBJECT:
+        return [0]*size
+    return array(typecode, bytes(array(typecode).itemsize*size))
+
+
+def _buffer_from(typecode:str, values):
+    """Flat buffer with the given values, suitable for slice assignment"""
+    if typecode == OBJECT:
+        return values if isinstance(values, list) else list(values)
+    if isinstance(values, array) and values.typecode == typecode:
+        return values
+    return array(typecode, values)
+
+
+def _slice_bounds(s, size:int) -> tuple:
+    """Start and stop of a (unit step) slice or of a single index"""
+    if isinstance(s, slice):
+        start, stop, step = s.indices(size)
+        if step != 1:
+            raise ValueError("Matrix views do not support slice steps!\n")
+        return start, max(start, stop)
+    if s < 0:
+        s += size
+    return s, s+1
@@ -2,12 +2,51 @@
 Base operations for 2D Matrices
 
 Author: Marcus Moresco Boeno
-Last Update: 2020-10-23
+Last Update: 2026-10-18
 
-Implements functions for basic operations with 2D matrices
+Implements functions for basic operations with 2D matrices, given
+either as nested lists or as flat array-backed matrices (Matrix)
 
 """
 
+# Standard library imports
+import random
+import time
+from operator import add, mul
+
+# Local application imports
+from linear_algebra.backends import from_ndarray, get_backend, to_ndarray
+from linear_algebra.fused_operations import _combineInto
+from linear_algebra.matrix import (
+    OBJECT, Matrix, as_matrix, matrix_shape, promote_typecode
+    )
+from linear_algebra.sparse_matrix import is_sparse, sparse_add, sparse_multiply
+
+
+# Block size below which Strassen's method uses the standard kernel
+# (tuned for the running interpreter by "calibrate_strassen_cutoff")
+_STRASSEN_CUTOFF = 128
+
+# Strassen's base products as (coefficient, quadrant) terms of their
+# operands, with quadrants indexed as 0: x11, 1: x12, 2: x21, 3: x22
+_STRASSEN_PRODUCTS = (
+    (((1, 0),), ((1, 1), (-1, 3))),          # p1 = a11.(b12 - b22)
+    (((1, 0), (1, 1)), ((1, 3),)),           # p2 = (a11 + a12).b22
+    (((1, 2), (1, 3)), ((1, 0),)),           # p3 = (a21 + a22).b11
+    (((1, 3),), ((1, 2), (-1, 0))),          # p4 = a22.(b21 - b11)
+    (((1, 0), (1, 3)), ((1, 0), (1, 3))),    # p5 = (a11 + a22).(b11 + b22)
+    (((1, 1), (-1, 3)), ((1, 2), (1, 3))),   # p6 = (a12 - a22).(b21 + b22)
+    (((1, 0), (-1, 2)), ((1, 0), (1, 1))),   # p7 = (a11 - a21).(b11 + b12)
+    )
+
+# Quadrants of C as (coefficient, product) terms (products 0 to 6)
+_STRASSEN_COMBINE = (
+    ((1, 4), (1, 3), (-1, 1), (1, 5)),       # c11 = p5 + p4 - p2 + p6
+    ((1, 0), (1, 1)),                        # c12 = p1 + p2
+    ((1, 2), (1, 3)),                        # c21 = p3 + p4
+    ((1, 4), (1, 0), (-1, 2), (-1, 6)),      # c22 = p5 + p1 - p3 - p7
+    )
+
 
 def _matrixMult_std(A:list, B:list) -> list:
     """Standard Multiplication of 2D Matrices
@@ -22,8 +61,8 @@ def _matrixMult_std(A:list, B:list) -> list:
     > Output:
         - Matrix with multiplication results.    
     """
-    # Make a deep copy of B
-    C = [row[:] for row in B]
+    # Create output matrix (m x p)
+    C = [[0]*len(B[0]) for _ in range(len(A))]
 
     # Iterate over rows of A
     for i in range(len(A)):
@@ -39,201 +78,480 @@ def _matrixMult_std(A:list, B:list) -> list:
     return C
 
 
-def _matrixMult_DaC(A:list, B:list) -> list:
+def _matrixMult_blocked(A, B, tile:int=128):
+    """Cache-Blocked (Tiled) Multiplication of 2D Matrices
+
+    Theta Notation:
+        - Blocked approach yields "n**3" (cubic) time complexity.
+
+    B is transposed once, so each entry of a tile is a dot product of
+    two contiguous rows, and C is updated one (tile x tile) block at a
+    time while the matching tiles of A and B stay in cache.
+    
+    > Arguments:
+        - A (matrix): Nested list or Matrix representing a 2D matrix;
+        - B (matrix): Nested list or Matrix representing a 2D matrix;
+        - tile (int): Tile size.
+            ---> Defaults to 128.
+    
+    > Output:
+        - Matrix with multiplication results.    
+    """
+    # Check if tile size is valid
+    if tile < 1:
+        raise ValueError(f"Tile size (tile = {tile}) must be positive!\n")
+
+    # Rows of A and columns of B (rows of B transposed)
+    if _isFlat(A, B):
+        X, Y = as_matrix(A, OBJECT), as_matrix(B, OBJECT)
+        C = _blockedKernel(X.tolist(), Y.T.tolist(), tile)
+        return Matrix.from_list(C, promote_typecode(A, B))
+    return _blockedKernel(A, [list(col) for col in zip(*B)], tile)
+
+
+def _blockedKernel(A:list, Bt:list, tile:int) -> list:
+    """Tiled Product of A and the Transpose of Bt
+
+    > Arguments:
+        - A (matrix): Nested list with the rows of A (m x n);
+        - Bt (matrix): Nested list with the columns of B (p x n);
+        - tile (int): Tile size.
+    
+    > Output:
+        - Nested list with multiplication results (m x p).
+    """
+    m, p = len(A), len(Bt)
+    n = len(A[0]) if m else 0
+
+    # Create output matrix (m x p)
+    C = [[0]*p for _ in range(m)]
+
+    # Iterate over tiles of the inner dimension
+    for kk in range(0, n, tile):
+        kend = min(kk+tile, n)
+
+        # Slice the current inner tile of A rows and B columns once
+        A_k = [row[kk:kend] for row in A]
+        Bt_k = [col[kk:kend] for col in Bt]
+
+        # Iterate over (tile x tile) blocks of C
+        for ii in range(0, m, tile):
+            iend = min(ii+tile, m)
+            for jj in range(0, p, tile):
+                jend = min(jj+tile, p)
+                cols = Bt_k[jj:jend]
+
+                # Accumulate dot products into the block of C
+                for i in range(ii, iend):
+                    a, crow = A_k[i], C[i]
+                    crow[jj:jend] = map(
+                        add, crow[jj:jend], [sum(map(mul, a, b)) for b in cols]
+                        )
+
+    # Return results
+    return C
+
+
+def _matrixMult_DaC(A, B):
     """Divide and Conquer Approach for 2D Matrices Multiplication
 
     Theta Notation:
         - DaC approach yields "n**3" (cubic) time complexity.
+
+    Operands are padded once to a power-of-two square matrix and the
+    recursion works on O(1) quadrant views of the padded buffers.
     
     > Arguments:
-        - A (matrix): Nested list representing a 2D matrix;
-        - B (matrix): Nested list representing a 2D matrix.
+        - A (matrix): Nested list or Matrix representing a 2D matrix;
+        - B (matrix): Nested list or Matrix representing a 2D matrix.
     
     > Output:
         - Matrix with multiplication results.    
     """
+    # Get output dimensions
+    m, p = matrix_shape(A)[0], matrix_shape(B)[1]
+
+    # Apply padding (only once, for the whole recursion)
+    X, Y = _cutoffPadding(A, B, 2)
+
+    # Accumulate quadrant products straight into the output matrix
+    C = Matrix.zeros(X.rows, X.rows, promote_typecode(A, B))
+    _dacAccumulate(X, Y, C)
+
+    # Return results
+    return _likeInputs(C, m, p, A, B)
+
+
+def _dacAccumulate(X:Matrix, Y:Matrix, C:Matrix) -> None:
+    """Divide and Conquer Step over Quadrant Views (C += X.Y)
+
+    > Arguments:
+        - X (Matrix): Square power-of-two matrix (or view);
+        - Y (Matrix): Square power-of-two matrix (or view);
+        - C (Matrix): Output matrix (or view) to accumulate into.
     
+    > Output:
+        - No outputs, the function accumulates into C.
+    """
     # Conquer Step
-    if len(A) == 2:
-        # Return standard multiplication for 2x2 square matrix
-        return _matrixMult_std(A, B)
+    if X.rows <= 2:
+        _matrixMult_stdFlat(X, Y, C, accumulate=True)
+        return
+
+    # Divide Step (views, no copies)
+    mid = X.rows//2
+    a11, a12, a21, a22 = _quadrants(X, mid)
+    b11, b12, b21, b22 = _quadrants(Y, mid)
+    c11, c12, c21, c22 = _quadrants(C, mid)
+
+    # Combine Step (sub-products are accumulated into C quadrants)
+    _dacAccumulate(a11, b11, c11)
+    _dacAccumulate(a12, b21, c11)
+    _dacAccumulate(a11, b12, c12)
+    _dacAccumulate(a12, b22, c12)
+    _dacAccumulate(a21, b11, c21)
+    _dacAccumulate(a22, b21, c21)
+    _dacAccumulate(a21, b12, c22)
+    _dacAccumulate(a22, b22, c22)
+
+
+def _matrixMult_Strassen(A, B, cutoff:int=None):
+    """Strassen's Method for 2D Matrices Multiplication
 
-    # Divide and Combine Steps
-    else:
+    Theta Notation:
+        - Strassen's approach yields "n**lg(7)" time complexity.
 
-        # Get matrices dimensions
-        n, m, p, q = len(A[0]), len(A), len(B[0]), len(B)
+    Operands are padded once to a square matrix of size c*2**k (with
+    c <= cutoff), the recursion works on O(1) quadrant views of the
+    padded buffers and switches to the standard kernel on blocks of
+    size c. The result is trimmed once at the end.
+    
+    > Arguments:
+        - A (matrix): Nested list or Matrix representing a 2D matrix;
+        - B (matrix): Nested list or Matrix representing a 2D matrix;
+        - cutoff (int): Block size below which the standard kernel is
+          used instead of recursing.
+            ---> Defaults to None (value tuned by
+                 "calibrate_strassen_cutoff").
+    
+    > Output:
+        - Matrix with multiplication results.    
+    """
+    # Get leaf cutoff
+    if cutoff is None:
+        cutoff = _STRASSEN_CUTOFF
+    elif cutoff < 1:
+        raise ValueError(f"Cutoff (cutoff = {cutoff}) must be positive!\n")
 
-        # Get max dimension to apply padding
-        l = max([n, m, p, q])
-        if l%2 != 0:
-            l += 1
-        
-        # Apply padding
-        A_pad, B_pad = _squarePadding(A, l, 0), _squarePadding(B, l, 0)
+    # Get output dimensions
+    m, p = matrix_shape(A)[0], matrix_shape(B)[1]
 
-        # Divide Step
-        mid = len(A_pad)//2
-        
-        # Dividing A matrix
-        a11 = [X[:mid] for X in A_pad[:mid]]
-        a12 = [X[mid:] for X in A_pad[:mid]]
-        a21 = [X[:mid] for X in A_pad[mid:]]
-        a22 = [X[mid:] for X in A_pad[mid:]]
-
-        # Dividing B matrix
-        b11 = [X[:mid] for X in B_pad[:mid]]
-        b12 = [X[mid:] for X in B_pad[:mid]]
-        b21 = [X[:mid] for X in B_pad[mid:]]
-        b22 = [X[mid:] for X in B_pad[mid:]]
-            
-        # Creating C Matrix elements
-        c11 = matrix_add(
-            _matrixMult_DaC(a11, b11),
-            _matrixMult_DaC(a12, b21)
-            )
-        c12 = matrix_add(
-            _matrixMult_DaC(a11, b12), 
-            _matrixMult_DaC(a12, b22)
-            )
-        c21 = matrix_add(
-            _matrixMult_DaC(a21, b11), 
-            _matrixMult_DaC(a22, b21)
+    # Apply padding (only once, for the whole recursion)
+    X, Y = _cutoffPadding(A, B, cutoff)
+
+    # Return results
+    return _likeInputs(_strassenSquare(X, Y, cutoff), m, p, A, B)
+
+
+def _strassenSquare(X:Matrix, Y:Matrix, cutoff:int, C:Matrix=None,
+                    workspace:list=None) -> Matrix:
+    """Strassen's Recursion over Quadrant Views
+
+    Operands of the base products and the products themselves are
+    written into a workspace preallocated once for every level of the
+    recursion, and each quadrant of C is computed by a single fused
+    pass (e.g. c11 = p5 + p4 - p2 + p6), so no intermediate matrix is
+    allocated during the recursion.
+
+    > Arguments:
+        - X (Matrix): Square matrix (or view) of size c*2**k;
+        - Y (Matrix): Square matrix (or view) of size c*2**k;
+        - cutoff (int): Leaf block size (c <= cutoff);
+        - C (Matrix): Output matrix (or view) to write into.
+            ---> Defaults to None (a new matrix is created);
+        - workspace (list): Scratch matrices of each recursion level.
+            ---> Defaults to None (created by "_strassenWorkspace").
+    
+    > Output:
+        - Matrix with multiplication results (C).
+    """
+    n = X.rows
+    if C is None:
+        C = Matrix.zeros(n, n, promote_typecode(X, Y))
+
+    # Conquer Step
+    if n <= cutoff:
+        return _matrixMult_stdFlat(X, Y, C)
+
+    # Scratch matrices of this level (operands and seven products)
+    if workspace is None:
+        workspace = _strassenWorkspace(n, cutoff, C.typecode)
+    L, R, P = workspace[0]
+
+    # Divide Step (views, no copies)
+    a, b = _quadrants(X, n//2), _quadrants(Y, n//2)
+
+    # Base multiplications
+    for k, (left, right) in enumerate(_STRASSEN_PRODUCTS):
+        _strassenSquare(
+            _strassenOperand(left, a, L), _strassenOperand(right, b, R),
+            cutoff, P[k], workspace[1:]
             )
-        c22 = matrix_add(
-            _matrixMult_DaC(a21, b12), 
-            _matrixMult_DaC(a22, b22)
+
+    # Combine Step (one fused pass per quadrant of C)
+    for c, terms in zip(_quadrants(C, n//2), _STRASSEN_COMBINE):
+        _combineInto(c, [(coef, P[k]) for coef, k in terms])
+
+    # Return results
+    return C
+
+
+def _strassenOperand(terms:tuple, quadrants:tuple, out:Matrix=None) -> Matrix:
+    """Operand of a Strassen's Base Product
+
+    > Arguments:
+        - terms (tuple): (coefficient, quadrant index) tuples;
+        - quadrants (tuple): Quadrant views of X (or Y);
+        - out (Matrix): Scratch matrix for sums of quadrants.
+            ---> Defaults to None (a new matrix is created).
+    
+    > Output:
+        - Quadrant view itself for single-quadrant operands, "out" with
+          the combined quadrants otherwise.
+    """
+    if len(terms) == 1:
+        return quadrants[terms[0][1]]
+    if out is None:
+        out = Matrix.zeros(*quadrants[0].shape, quadrants[0].typecode)
+    return _combineInto(out, [(coef, quadrants[k]) for coef, k in terms])
+
+
+def _strassenWorkspace(n:int, cutoff:int, typecode:str) -> list:
+    """Preallocate Scratch Matrices for Strassen's Recursion
+
+    > Arguments:
+        - n (int): Size of the padded operands;
+        - cutoff (int): Leaf block size;
+        - typecode (str): Element type of the products.
+    
+    > Output:
+        - List with one (L, R, [P1, ..., P7]) tuple per recursion level,
+          where L and R hold the operands of the base products.
+    """
+    workspace = []
+    while n > cutoff:
+        n //= 2
+        workspace.append((
+            Matrix.zeros(n, n, typecode), Matrix.zeros(n, n, typecode),
+            [Matrix.zeros(n, n, typecode) for _ in range(7)],
+            ))
+    return workspace
+
+
+def _strassenOperands(X:Matrix, Y:Matrix) -> list:
+    """Divide Step of Strassen's Method (new operand matrices)
+
+    > Arguments:
+        - X (Matrix): Square matrix (or view) of even size;
+        - Y (Matrix): Square matrix (or view) of even size.
+    
+    > Output:
+        - List with the operand pairs of the seven base products.
+    """
+    a, b = _quadrants(X, X.rows//2), _quadrants(Y, Y.rows//2)
+    return [
+        (_strassenOperand(left, a), _strassenOperand(right, b))
+        for left, right in _STRASSEN_PRODUCTS
+        ]
+
+
+def _strassenCombine(p:list, n:int, typecode:str) -> Matrix:
+    """Combine Step of Strassen's Method (new output matrix)
+
+    > Arguments:
+        - p (list): Results of the seven base products (p1 to p7);
+        - n (int): Size of the output matrix;
+        - typecode (str): Element type of the output matrix.
+    
+    > Output:
+        - New matrix with multiplication results.
+    """
+    C = Matrix.zeros(n, n, typecode)
+    for c, terms in zip(_quadrants(C, n//2), _STRASSEN_COMBINE):
+        _combineInto(c, [(coef, p[k]) for coef, k in terms])
+    return C
+
+
+def calibrate_strassen_cutoff(size:int=256, candidates:tuple=(32, 64, 128),
+                              repeat:int=1, typecode:str="d") -> int:
+    """Tune the Leaf Cutoff of Strassen's Method
+
+    Times Strassen's method on a random (size x size) matrix for each
+    candidate cutoff, and the standard kernel alone (cutoff = size).
+    The fastest cutoff becomes the default of the "strassen" method.
+    
+    > Arguments:
+        - size (int): Size of the square test matrices;
+        - candidates (tuple): Cutoffs to try;
+        - repeat (int): Runs per cutoff (best time is kept);
+        - typecode (str): Element type of the test matrices.
+            ---> Defaults to "d".
+    
+    > Output:
+        - Selected cutoff.
+    """
+    global _STRASSEN_CUTOFF
+
+    # Build random test matrices
+    rng = random.Random(size)
+    A, B = (
+        Matrix.from_list(
+            [[rng.randint(-9, 9) for _ in range(size)] for _ in range(size)],
+            typecode
             )
+        for _ in range(2)
+        )
 
-        # Combine Step
-        C = [a+b for a,b in zip(c11, c12)] + [a+b for a,b in zip(c21, c22)]
+    # Time every candidate cutoff (keeping the best run)
+    timings = {}
+    for cutoff in sorted(set(candidates) | {size}):
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            _matrixMult_Strassen(A, B, cutoff)
+            best = min(best, time.perf_counter() - start)
+        timings[cutoff] = best
 
-        # Return results
-        return [row[:p] for row in C[:q]]
+    # Store and return the fastest cutoff
+    _STRASSEN_CUTOFF = min(timings, key=timings.get)
+    return _STRASSEN_CUTOFF
 
 
-def _matrixMult_Strassen(A:list, B:list) -> list:
-    """Strassen's Method for 2D Matrices Multiplication
+def _matrixMult_stdFlat(A:Matrix, B:Matrix, C:Matrix=None,
+                        accumulate:bool=False) -> Matrix:
+    """Standard Multiplication of Flat Matrices
 
     Theta Notation:
-        - Strassen's approach yields "n**lg(7)" time complexity.
+        - Standard approach yields "n**3" (cubic) time complexity.
     
     > Arguments:
-        - A (matrix): Nested list representing a 2D matrix;
-        - B (matrix): Nested list representing a 2D matrix.
+        - A (Matrix): Flat matrix (or view);
+        - B (Matrix): Flat matrix (or view);
+        - C (Matrix): Output matrix (or view) to write into.
+            ---> Defaults to None (a new matrix is created);
+        - accumulate (bool): Add results to C instead of overwriting it.
+            ---> Defaults to False.
     
     > Output:
-        - Matrix with multiplication results.    
+        - Matrix with multiplication results (C).
     """
+    # Gather columns of B once (strided reads)
+    cols = [B.col(j) for j in range(B.cols)]
+
+    # Compute each row of C from a row of A and the columns of B
+    if C is None:
+        C = Matrix.zeros(A.rows, B.cols, promote_typecode(A, B))
+    for i in range(A.rows):
+        a = A.row(i)
+        row = [sum(map(mul, a, b)) for b in cols]
+        C.set_row(i, list(map(add, C.row(i), row)) if accumulate else row)
+
+    # Return results
+    return C
+
+
+def _elementwiseFlat(m:tuple, subtract:bool=False) -> Matrix:
+    """Addition/Subtraction of Flat Matrices (nested lists allowed)
+
+    Theta Notation:
+        - Addition/Subtraction yields "n**2" (quadratic) time complexity.
     
-    # Conquer Step
-    if len(A) == 2:
-        # Return standard multiplication for 2x2 square matrix
-        return _matrixMult_std(A, B)
+    > Arguments:
+        - m (tuple): 2D matrices with matching dimensions;
+        - subtract (bool): Subtract the remaining matrices from the
+          first one instead of adding all of them.
+            ---> Defaults to False.
+    
+    > Output:
+        - New matrix with results.
+    """
+    C = Matrix.zeros(*matrix_shape(m[0]), promote_typecode(*m))
+    sign = -1 if subtract else 1
+    return _combineInto(C, [(1, m[0])] + [(sign, X) for X in m[1:]])
 
-    # Divide and Combine Steps
-    else:
 
-        # Get matrices dimensions
-        n, m, p, q = len(A[0]), len(A), len(B[0]), len(B)
+def _quadrants(X:Matrix, mid:int) -> tuple:
+    """Views of the four quadrants of a square matrix"""
+    n = X.rows
+    return (
+        X.view(0, mid, 0, mid), X.view(0, mid, mid, n),
+        X.view(mid, n, 0, mid), X.view(mid, n, mid, n),
+        )
 
-        # Get max dimension to apply padding
-        l = max([n, m, p, q])
-        if l%2 != 0:
-            l += 1
-        
-        # Apply padding
-        A_pad, B_pad = _squarePadding(A, l, 0), _squarePadding(B, l, 0)
 
-        # Divide Step
-        mid = len(A_pad)//2
-        
-        # Dividing A matrix
-        a11 = [X[:mid] for X in A_pad[:mid]]
-        a12 = [X[mid:] for X in A_pad[:mid]]
-        a21 = [X[:mid] for X in A_pad[mid:]]
-        a22 = [X[mid:] for X in A_pad[mid:]]
-
-        # Dividing B matrix
-        b11 = [X[:mid] for X in B_pad[:mid]]
-        b12 = [X[mid:] for X in B_pad[:mid]]
-        b21 = [X[:mid] for X in B_pad[mid:]]
-        b22 = [X[mid:] for X in B_pad[mid:]]
-        
-        # Base additions
-        s1 = matrix_subtract(b12, b22)
-        s2 = matrix_add(a11, a12)
-        s3 = matrix_add(a21, a22)
-        s4 = matrix_subtract(b21, b11)
-        s5 = matrix_add(a11, a22)
-        s6 = matrix_add(b11, b22)
-        s7 = matrix_subtract(a12, a22)
-        s8 = matrix_add(b21, b22)
-        s9 = matrix_subtract(a11, a21)
-        s10 = matrix_add(b11, b12)
-
-        # Base multiplications
-        p1 = _matrixMult_Strassen(a11, s1)
-        p2 = _matrixMult_Strassen(s2, b22)
-        p3 = _matrixMult_Strassen(s3, b11)
-        p4 = _matrixMult_Strassen(a22, s4)
-        p5 = _matrixMult_Strassen(s5, s6)
-        p6 = _matrixMult_Strassen(s7, s8)
-        p7 = _matrixMult_Strassen(s9, s10)
-
-        # Creating C Matrix elements
-        c11 = matrix_add(p5, matrix_subtract(p4, p2), p6)
-        c12 = matrix_add(p1, p2)
-        c21 = matrix_add(p3, p4)
-        c22 = matrix_add(p5, matrix_subtract(p1, p3, p7))
-
-        # Combine Step
-        C = [a+b for a,b in zip(c11, c12)] + [a+b for a,b in zip(c21, c22)]
-
-        # Return results
-        return [row[:p] for row in C[:q]]
-
-
-def _squarePadding(A:list, l:int, padding=0) -> list:
-    """Square-Padding Function
-    
-    Rezises matrix to an even-square matrix.
+def _cutoffPadding(A, B, cutoff:int) -> tuple:
+    """Pad Operands Once to the Same Square Size c*2**k (c <= cutoff)
+
+    The smallest k is chosen, so halving the padded size k times yields
+    leaf blocks no bigger than the cutoff. Nested lists are converted
+    into object ("O") matrices, so their elements keep their exact
+    Python types.
     
     > Arguments:
-        - A (matrix): Nested list representing a 2D matrix;
-        - l (int): Resize factor (matrix will become size lxl);
-        - padding (int): Integer to be added to matrix.
-            ---> Defaults to 0.
+        - A (matrix): Nested list or Matrix representing a 2D matrix;
+        - B (matrix): Nested list or Matrix representing a 2D matrix;
+        - cutoff (int): Maximum size of leaf blocks.
     
     > Output:
-        - Resized matrix (do not share content with original matrix).
+        - Tuple with padded matrices (operands are not copied when
+          they already have the right size).
     """
-    # Check if resize factor is valid
-    if len(A) > l or len(A[0]) > l:
-        # Raise an error if the resize factor is out of bounds 
-        raise ValueError(f"Resize factor (l = {l}) is out of bounds\n")
+    # Find number of halvings (k) and leaf block size (c)
+    n, k = max(matrix_shape(A) + matrix_shape(B)), 0
+    while -(-n >> k) > cutoff:
+        k += 1
+    l = -(-n >> k) << k
     
-    # Check if resizing is necessary
-    elif len(A) == l and len(A[0]) == l:
-        # Return a deep copy of the original matrix
-        return [row[:] for row in A]
+    # Apply padding
+    return _padMatrix(A, l), _padMatrix(B, l)
+
+
+def _padMatrix(A, l:int) -> Matrix:
+    """Zero-pad a matrix (or nested list) to a lxl Matrix"""
+    X = as_matrix(A, OBJECT)
+    if X.shape == (l, l):
+        return X
     
-    # Resizing when necessary
-    else:
-        # Make a deep copy of A
-        B = [row[:] for row in A]
-        
-        # Adding columns
-        cols_diff = l - len(A[0])
-        for row in B:
-            row.extend(cols_diff*[padding])
-
-        # Adding rows
-        rows_diff = l - len(A)
-        B.extend(rows_diff*[l*[padding]])
-        
-        # Return resized matrix
-        return B
+    # Copy elements into the top-left corner of a matrix of zeros
+    P = Matrix.zeros(l, l, X.typecode)
+    P.view(0, X.rows, 0, X.cols).assign(X)
+    return P
+
+
+def _likeInputs(C:Matrix, m:int, p:int, *operands):
+    """Trim output to mxp and match the type of the operands
+
+    > Output:
+        - Nested list if every operand is a nested list, compact
+          Matrix otherwise.
+    """
+    if C.shape != (m, p):
+        C = C.view(0, m, 0, p)
+    if not _isFlat(*operands):
+        return C.tolist()
+    return C if C.is_contiguous() else C.copy()
+
+
+def _sparseResult(R, as_ndarray:bool):
+    """Results of sparse kernels (densified when an ndarray is asked)"""
+    if not as_ndarray:
+        return R
+    return to_ndarray(R.tolist() if is_sparse(R) else R)
+
+
+def _isFlat(*m) -> bool:
+    """Check whether any operand is a flat Matrix"""
+    return any(isinstance(X, Matrix) for X in m)
 
 
 def _dimChecker(*m:list, operation:str) -> bool:
@@ -243,7 +561,7 @@ def _dimChecker(*m:list, operation:str) -> bool:
     desired operation or not.
     
     > Arguments:
-        - m (list): List of 2D matrices;
+        - m (list): List of 2D matrices (nested lists or Matrix);
         - operation (str): Desired operation.
             ---> Options: "add", "subtract", "multiply".
     
@@ -252,9 +570,9 @@ def _dimChecker(*m:list, operation:str) -> bool:
     """
     # Check conditions for matrices addition and subtraction
     if operation in ["add", "subtract"]:
-        rows, cols = len(m[0]), len(m[0][0])
+        shape = matrix_shape(m[0])
         for i in range(1, len(m)):
-            if len(m[i]) != rows or len(m[i][0]) != cols:
+            if matrix_shape(m[i]) != shape:
                 # Return False when matrices dimension do not match
                 return False
         # Return True when matrices dimensions match
@@ -262,7 +580,7 @@ def _dimChecker(*m:list, operation:str) -> bool:
 
     # Test conditions for matrices multiplication
     elif operation == "multiply":
-        if len(m[0][0]) != len(m[1]):
+        if matrix_shape(m[0])[1] != matrix_shape(m[1])[0]:
             # Return False when matrices dimension do not match
             return False
         # Return True when matrices dimensions match
@@ -273,23 +591,50 @@ def _dimChecker(*m:list, operation:str) -> bool:
         raise NotImplementedError(f"Operation {operation} not implemented!\n")
 
 
-def matrix_add(*m:list) -> list:
+def matrix_add(*m:list, as_ndarray:bool=False) -> list:
     """Addition of 2D Matrices
 
     Theta Notation:
         - Addition yields "n**2" (quadratic) time complexity.
+
+    Numeric operands are added by the active backend when it accepts
+    them (see "linear_algebra.backends"). Sparse operands use the
+    sparse kernels (see "linear_algebra.sparse_matrix").
     
     > Arguments:
-        - m (list): List of 2D matrices.
+        - m (list): List of 2D matrices (nested lists, Matrix,
+          CSRMatrix or ndarrays);
+        - as_ndarray (bool): Return results as a NumPy ndarray.
+            ---> Defaults to False.
     
     > Output:
-        - Matrix with addition results
+        - Matrix with addition results (ndarray if asked or if any
+          operand is an ndarray, Matrix if any operand is a Matrix,
+          nested list otherwise)
     """
     # Check if only one matrix was provided
     if len(m) > 1:
 
         # Check if matrices dimensions match
-        if _dimChecker(m, operation="add"):
+        if _dimChecker(*m, operation="add"):
+
+            # Sparse (CSR) operands use the sparse kernels
+            if is_sparse(*m):
+                return _sparseResult(sparse_add(m), as_ndarray)
+
+            # Vectorized backend (declines non-numeric operands)
+            R = get_backend().add(m)
+            if R is not NotImplemented:
+                return from_ndarray(R, *m, as_ndarray=as_ndarray)
+
+            # Requested ndarray for pure-Python results
+            if as_ndarray:
+                return to_ndarray(matrix_add(*m))
+
+            # Flat matrices are added row by row into a new Matrix
+            if _isFlat(*m):
+                return _elementwiseFlat(m)
+
             # Return results
             #   obs:
             #     - lcs: Elements for a given i,j position
@@ -306,23 +651,50 @@ def matrix_add(*m:list) -> list:
         raise ValueError("Not enough matrices to make computation!\n")
 
 
-def matrix_subtract(*m:list) -> list:
+def matrix_subtract(*m:list, as_ndarray:bool=False) -> list:
     """Subtraction of 2D Matrices
 
     Theta Notation:
         - Subtraction yields "n**2" (quadratic) time complexity.
+
+    Numeric operands are subtracted by the active backend when it
+    accepts them (see "linear_algebra.backends"). Sparse operands use
+    the sparse kernels (see "linear_algebra.sparse_matrix").
     
     > Arguments:
-        - m (list): List of 2D matrices.
+        - m (list): List of 2D matrices (nested lists, Matrix,
+          CSRMatrix or ndarrays);
+        - as_ndarray (bool): Return results as a NumPy ndarray.
+            ---> Defaults to False.
     
     > Output:
-        - Matrix with subtraction results
+        - Matrix with subtraction results (ndarray if asked or if any
+          operand is an ndarray, Matrix if any operand is a Matrix,
+          nested list otherwise)
     """
     # Check if only one matrix was provided
     if len(m) > 1:
 
         # Check if matrices dimensions match
-        if _dimChecker(m, operation="subtract"):
+        if _dimChecker(*m, operation="subtract"):
+
+            # Sparse (CSR) operands use the sparse kernels
+            if is_sparse(*m):
+                return _sparseResult(sparse_add(m, subtract=True), as_ndarray)
+
+            # Vectorized backend (declines non-numeric operands)
+            R = get_backend().subtract(m)
+            if R is not NotImplemented:
+                return from_ndarray(R, *m, as_ndarray=as_ndarray)
+
+            # Requested ndarray for pure-Python results
+            if as_ndarray:
+                return to_ndarray(matrix_subtract(*m))
+
+            # Flat matrices are subtracted row by row into a new Matrix
+            if _isFlat(*m):
+                return _elementwiseFlat(m, subtract=True)
+
             # Return results
             #   obs:
             #     - lcs: Elements for a given i,j position
@@ -339,30 +711,99 @@ def matrix_subtract(*m:list) -> list:
         raise ValueError("Not enough matrices to make computation!\n")
 
 
-def matrix_multiply(A:list, B:list, method="standard") -> list:
+def matrix_multiply(A:list, B:list, method="standard", tile:int=128,
+                    cutoff:int=None, parallel:bool=False,
+                    workers:int=None, as_ndarray:bool=False,
+                    out:str=None, memory:int=None) -> list:
     """Multiplication of 2D Matrices
 
     Theta Notation:
         - "standard" yields "n**3" (cubic) time complexity;
+        - "blocked" yields "n**3" (cubic) time complexity;
         - "divide_conquer" yields "n**3" (cubic) time complexity;
-        - "strassen" yields "n**lg(7)" time complexity.
+        - "strassen" yields "n**lg(7)" time complexity;
+        - "out_of_core" yields "n**3" (cubic) time complexity.
+
+    Serial "standard" products of numeric operands are computed by the
+    active backend when it accepts them (see "linear_algebra.backends");
+    the "blocked" and recursive methods always run their own algorithm. Products with a sparse (CSRMatrix) operand
+    always use the sparse kernels (see "linear_algebra.sparse_matrix"),
+    whatever the method. The "out_of_core" method streams tiles of
+    memory-mapped operands into an output matrix file (see
+    "linear_algebra.matrix_file").
     
     > Arguments:
-        - A (matrix): Nested list representing a 2D matrix;
-        - B (matrix): Nested list representing a 2D matrix.
+        - A (matrix): Nested list, Matrix or CSRMatrix (2D matrix);
+        - B (matrix): Nested list, Matrix or CSRMatrix (2D matrix);
         - method (str): Method to multiply matrices.
-            ---> Options: "standard", "divide_conquer", "strassen";
+            ---> Options: "standard", "blocked", "divide_conquer",
+                          "strassen", "out_of_core";
             ---> Defaults to "standard".
+        - tile (int): Tile size for the "blocked" method.
+            ---> Defaults to 128.
+        - cutoff (int): Leaf block size for the "strassen" method.
+            ---> Defaults to None (see "calibrate_strassen_cutoff").
+        - parallel (bool): Compute blocks of C on a process pool over
+          shared memory ("standard", "blocked" and "strassen" only).
+            ---> Defaults to False.
+        - workers (int): Number of worker processes (implies parallel).
+            ---> Defaults to None (os.cpu_count() when parallel).
+        - as_ndarray (bool): Return results as a NumPy ndarray.
+            ---> Defaults to False;
+        - out (str): Output matrix file path ("out_of_core" only).
+            ---> Defaults to None;
+        - memory (int): Bound (in bytes) of the tiles held in memory
+          ("out_of_core" only).
+            ---> Defaults to None (64 MiB).
     
     > Output:
-        - Matrix with multiplication results
+        - Matrix with multiplication results (Matrix if any operand is
+          a Matrix, nested list otherwise; Matrix over the mapped
+          output file for "out_of_core")
     """
     # Check if matrices dimensions match
     if _dimChecker(A, B, operation="multiply"):
 
+        # Sparse (CSR) operands use the sparse kernels
+        if is_sparse(A, B):
+            return _sparseResult(sparse_multiply(A, B), as_ndarray)
+
+        # Tiles streamed from (and to) memory-mapped matrix files
+        if method == "out_of_core":
+            if out is None:
+                raise ValueError("Output file path (out) not provided!\n")
+            from linear_algebra.matrix_file import out_of_core_multiply
+            C = out_of_core_multiply(A, B, out, memory)
+            return to_ndarray(C) if as_ndarray else C
+
+        # Requested ndarray (results computed as below)
+        if as_ndarray:
+            return to_ndarray(matrix_multiply(
+                A, B, method, tile, cutoff, parallel, workers
+                ))
+
+        # Multi-process multiplication over shared memory
+        if parallel or workers is not None:
+            from linear_algebra.parallel_multiply import parallel_multiply
+            return parallel_multiply(A, B, method, workers, tile, cutoff)
+
+        # Vectorized backend (declines non-numeric operands)
+        if method == "standard":
+            R = get_backend().multiply(A, B)
+            if R is not NotImplemented:
+                return from_ndarray(R, A, B)
+
         # Standard 2D Multiplication
         if method == "standard":
+            if _isFlat(A, B):
+                return _matrixMult_stdFlat(
+                    as_matrix(A, OBJECT), as_matrix(B, OBJECT)
+                    )
             return _matrixMult_std(A, B)
+
+        # Cache-Blocked Approach
+        elif method == "blocked":
+            return _matrixMult_blocked(A, B, tile)
         
         # Divide and Conquer Approach
         elif method == "divide_conquer":
@@ -370,7 +811,7 @@ def matrix_multiply(A:list, B:list, method="standard") -> list:
         
         # Strassen's Approach
         elif method == "strassen":
-            return _matrixMult_Strassen(A, B)
+            return _matrixMult_Strassen(A, B, cutoff)
         
         # Method not implemented
         else:
@@ -398,6 +839,7 @@ if __name__ == "__main__":
     print(f"Matrix C: {C}")
     print(f"Matrix D: {D}\n")
     print(f"  > Standard Approach (A.B): {matrix_multiply(A, B, 'standard')}")
+    print(f"  > Blocked Approach (A.B): {matrix_multiply(A, B, 'blocked')}")
     print("  > Divide and Conquer Approach (A.B): {}".format(
         matrix_multiply(A, B, 'divide_conquer')
         )
@@ -407,6 +849,7 @@ if __name__ == "__main__":
         )
     )
     print(f"  > Standard Approach (C.D): {matrix_multiply(C, D, 'standard')}")
+    print(f"  > Blocked Approach (C.D): {matrix_multiply(C, D, 'blocked')}")
     print("  > Divide and Conquer Approach (C.D): {}".format(
         matrix_multiply(C, D, 'divide_conquer')
         )
@@ -429,3 +872,11 @@ if __name__ == "__main__":
     print(f"Matrix E: {E}")
     print(f"Matrix F: {F}\n")
     print(f"  > B-E-F: {matrix_subtract(B, E, F)}\n")
+
+    # Flat array-backed matrices
+    print(">> Flat Matrix Example:")
+    M = Matrix.from_list(C)
+    print(f"\nMatrix M: {M}")
+    print(f"View M[1:, 1:]: {M[1:, 1:]}\n")
+    print(f"  > Strassen's Approach (M.D): {matrix_multiply(M, D, 'strassen')}")
+    print(f"  > M[1:, 1:] + M[:2, :2]: {matrix_add(M[1:, 1:], M[:2, :2])}\n")
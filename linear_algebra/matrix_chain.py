@@ -0,0 +1,156 @@
+"""
+Matrix-Chain Multiplication
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-18
+
+Implements functions that multiply a chain of 2D matrices following
+the optimal parenthesization found by the dynamic programming
+algorithm described on Chapter 15 of the book "Introduction to
+Algorithms" by Thomas H. Cormen et al. (2009)
+
+"""
+
+# Standard library imports
+from collections import namedtuple
+from functools import lru_cache
+
+# Local application imports
+from linear_algebra.matrix import matrix_shape
+from linear_algebra.matrix_base_operations import matrix_multiply
+
+
+# Multiplication plan of a chain of matrices
+#   - cost (int): Scalar multiplications of the optimal order;
+#   - naive_cost (int): Scalar multiplications of the left-to-right order;
+#   - order (int or tuple): Optimal parenthesization as nested pairs of
+#     matrix indices (e.g. ((0, 1), 2) means (A0.A1).A2).
+ChainPlan = namedtuple("ChainPlan", ["cost", "naive_cost", "order"])
+
+
+@lru_cache(maxsize=1024)
+def _matrixChainOrder(dims:tuple) -> ChainPlan:
+    """Dynamic Programming for the Matrix-Chain Order (cached by shapes)
+
+    Theta Notation:
+        - Matrix-Chain Order yields "n**3" (cubic) time complexity on
+          the length of the chain.
+
+    > Arguments:
+        - dims (tuple): Dimensions p0, p1, ..., pn, where matrix Ai has
+          shape (p[i], p[i+1]).
+
+    > Output:
+        - Multiplication plan.
+    """
+    n = len(dims) - 1
+
+    # m[i][j]: minimum cost of Ai..Aj; s[i][j]: index of the best split
+    m = [[0]*n for _ in range(n)]
+    s = [[0]*n for _ in range(n)]
+
+    # Iterate over chain lengths
+    for length in range(2, n+1):
+        for i in range(n-length+1):
+            j = i + length - 1
+            m[i][j] = float("inf")
+            for k in range(i, j):
+                q = m[i][k] + m[k+1][j] + dims[i]*dims[k+1]*dims[j+1]
+                if q < m[i][j]:
+                    m[i][j], s[i][j] = q, k
+
+    # Cost of multiplying from left to right
+    naive_cost = sum(dims[0]*dims[k]*dims[k+1] for k in range(1, n))
+
+    # Return plan
+    return ChainPlan(m[0][n-1], naive_cost, _optimalOrder(s, 0, n-1))
+
+
+def _optimalOrder(s:list, i:int, j:int):
+    """Optimal parenthesization of Ai..Aj as nested pairs of indices"""
+    if i == j:
+        return i
+    return (_optimalOrder(s, i, s[i][j]), _optimalOrder(s, s[i][j]+1, j))
+
+
+def _chainDims(mats:tuple) -> tuple:
+    """Chain dimensions (p0, ..., pn), checking consecutive shapes"""
+    # Check if there are matrices to multiply
+    if not mats:
+        raise ValueError("Not enough matrices to make computation!\n")
+
+    shapes = [matrix_shape(A) for A in mats]
+    for (_, cols), (rows, _) in zip(shapes, shapes[1:]):
+        if cols != rows:
+            raise ValueError("Matrices dimensions do not match!\n")
+    return tuple(rows for rows, _ in shapes) + (shapes[-1][1],)
+
+
+def matrix_chain_plan(*mats) -> ChainPlan:
+    """Optimal Multiplication Plan of a Chain of 2D Matrices
+
+    Plans are cached by the tuple of shapes, so recurring pipelines
+    skip the dynamic programming step.
+
+    > Arguments:
+        - mats: 2D matrices (or anything with a "shape"), in order.
+
+    > Output:
+        - ChainPlan with estimated costs and optimal order.
+    """
+    return _matrixChainOrder(_chainDims(mats))
+
+
+def format_chain_order(order) -> str:
+    """Parenthesization of a plan order (e.g. "((A0A1)A2)")"""
+    if isinstance(order, int):
+        return f"A{order}"
+    return f"({format_chain_order(order[0])}{format_chain_order(order[1])})"
+
+
+def matrix_chain_multiply(*mats, method:str="blocked"):
+    """Multiplication of a Chain of 2D Matrices
+
+    Theta Notation:
+        - Planning yields "n**3" (cubic) time complexity on the length
+          of the chain (skipped for cached shapes);
+        - Products yield "cost" scalar multiplications (see
+          "matrix_chain_plan").
+
+    > Arguments:
+        - mats: 2D matrices (nested lists, Matrix or CSRMatrix), in
+          order;
+        - method (str): Method of "matrix_multiply" for each product.
+            ---> Defaults to "blocked" (fastest pure-Python kernel,
+                 routed to the active backend when it applies).
+
+    > Output:
+        - Matrix with multiplication results.
+    """
+    plan = matrix_chain_plan(*mats)
+
+    # Multiply following the optimal parenthesization
+    def multiply(order):
+        if isinstance(order, int):
+            return mats[order]
+        return matrix_multiply(multiply(order[0]), multiply(order[1]), method)
+
+    # Return results
+    return multiply(plan.order)
+
+
+if __name__ == "__main__":
+
+    # Declare a chain of matrices (CLRS figure 15.5 dimensions)
+    dims = [30, 35, 15, 5, 10, 20, 25]
+    mats = [
+        [[1]*dims[k+1] for _ in range(dims[k])] for k in range(len(dims)-1)
+        ]
+    plan = matrix_chain_plan(*mats)
+
+    print("\n>> Matrix-Chain Multiplication Example:")
+    print(f"\nDimensions: {dims}")
+    print(f"  > Optimal order: {format_chain_order(plan.order)}")
+    print(f"  > Optimal cost: {plan.cost} scalar multiplications")
+    print(f"  > Left-to-right cost: {plan.naive_cost} scalar multiplications")
+    print(f"  > Result[0][0]: {matrix_chain_multiply(*mats)[0][0]}\n")
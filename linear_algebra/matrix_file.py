@@ -0,0 +1,239 @@
+"""
+Memory-Mapped 2D Matrices on Disk
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-18
+
+Implements a binary on-disk format for numeric 2D matrices and an
+out-of-core multiplication that streams tiles of memory-mapped
+operands, so matrices larger than the available memory can be
+multiplied. File layout (little-endian):
+    - header (24 bytes): magic b"ALGMAT", format version (uint8),
+      typecode ("d" or "q"), rows (uint64) and columns (uint64);
+    - data: rows*cols elements (float64 or int64), row-major.
+
+"""
+
+# Standard library imports
+import mmap
+import struct
+from array import array
+from operator import add, mul
+
+# Local application imports
+from linear_algebra.matrix import (
+    Matrix, as_matrix, matrix_shape, promote_typecode
+    )
+
+
+# File header (magic, version, typecode, rows, cols)
+_HEADER = struct.Struct("<6sBcQQ")
+_MAGIC = b"ALGMAT"
+_VERSION = 1
+
+# Approximate bytes per element of a tile held as a Python list
+# (pointer on the list plus the float or int object)
+_ELEMENT_BYTES = 32
+
+# Default working-set bound of the out-of-core multiplication (64 MiB)
+_MEMORY = 64 << 20
+
+
+def save_matrix(path:str, A, typecode:str=None) -> None:
+    """Write a 2D Matrix to a Binary Matrix File (row by row)
+
+    > Arguments:
+        - path (str): Output file path;
+        - A (matrix): Nested list or Matrix representing a 2D matrix;
+        - typecode (str): Element type.
+            ---> Options: "d" (float64), "q" (int64);
+            ---> Defaults to None (typecode of a typed Matrix, "d"
+                 otherwise).
+    """
+    if typecode is None:
+        typecode = A.typecode if isinstance(A, Matrix) else "d"
+    _checkTypecode(typecode)
+
+    rows, cols = matrix_shape(A)
+    with open(path, "wb") as file:
+        file.write(_HEADER.pack(
+            _MAGIC, _VERSION, typecode.encode(), rows, cols
+            ))
+        for row in A:
+            array(typecode, row).tofile(file)
+
+
+def open_matrix(path:str, mode:str="r") -> Matrix:
+    """Memory-Map a Binary Matrix File
+
+    Elements are read from (and written to) the file on demand, so the
+    matrix takes no memory beyond the pages the OS keeps cached.
+
+    > Arguments:
+        - path (str): Matrix file path;
+        - mode (str): Access mode.
+            ---> Options: "r" (read-only), "r+" (read and write);
+            ---> Defaults to "r".
+
+    > Output:
+        - Matrix over a typed view of the mapped file.
+    """
+    if mode not in ["r", "r+"]:
+        raise ValueError(f"Invalid mode '{mode}'!\n")
+
+    with open(path, "rb" if mode == "r" else "r+b") as file:
+        magic, version, typecode, rows, cols = _HEADER.unpack(
+            file.read(_HEADER.size)
+            )
+
+        # Check file header
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"'{path}' is not a matrix file!\n")
+        typecode = typecode.decode()
+        _checkTypecode(typecode)
+
+        # Map the whole file (the mapping outlives the file object)
+        size = _HEADER.size + 8*rows*cols
+        access = mmap.ACCESS_READ if mode == "r" else mmap.ACCESS_WRITE
+        buffer = mmap.mmap(file.fileno(), size, access=access)
+
+    data = memoryview(buffer)[_HEADER.size:].cast(typecode)
+    return Matrix(data, rows, cols)
+
+
+def create_matrix(path:str, rows:int, cols:int,
+                  typecode:str="d") -> Matrix:
+    """Create a Binary Matrix File Filled with Zeros and Map it
+
+    > Arguments:
+        - path (str): Output file path;
+        - rows (int): Number of rows;
+        - cols (int): Number of columns;
+        - typecode (str): Element type ("d" or "q").
+            ---> Defaults to "d".
+
+    > Output:
+        - Writable Matrix over the mapped file.
+    """
+    _checkTypecode(typecode)
+    with open(path, "wb") as file:
+        file.write(_HEADER.pack(
+            _MAGIC, _VERSION, typecode.encode(), rows, cols
+            ))
+        file.truncate(_HEADER.size + 8*rows*cols)
+    return open_matrix(path, "r+")
+
+
+def close_matrix(M:Matrix) -> None:
+    """Flush and Unmap a Matrix Returned by "open_matrix"
+
+    Views of M (and M itself) must not be used afterwards.
+    """
+    buffer, writable = M.data.obj, not M.data.readonly
+    M.data.release()
+    if not buffer.closed:
+        if writable:
+            buffer.flush()
+        buffer.close()
+
+
+def out_of_core_multiply(A, B, out:str, memory:int=None,
+                         tile:int=None) -> Matrix:
+    """Out-of-Core (Tiled) Multiplication of 2D Matrices
+
+    Theta Notation:
+        - Out-of-core approach yields "n**3" (cubic) time complexity.
+
+    Tiles of A and B are read from their buffers (typically mapped
+    files, see "open_matrix") and each (tile x tile) block of C is
+    accumulated in memory and written once to the output file, so only
+    three tiles are held at a time. Operands given as paths are mapped
+    for the multiplication only (unmapped before returning).
+
+    > Arguments:
+        - A (matrix): Matrix, nested list (of int64 or float64
+          numbers) or path of a matrix file, with shape m x n;
+        - B (matrix): Matrix, nested list or path of a matrix file, with
+          shape n x p;
+        - out (str): Path of the output matrix file (m x p);
+        - memory (int): Bound (in bytes) of the tiles held in memory.
+            ---> Defaults to None (64 MiB);
+        - tile (int): Tile size (overrides the size derived from
+          "memory").
+            ---> Defaults to None.
+
+    > Output:
+        - Matrix over the mapped output file.
+    """
+    # Operands opened here are closed on return
+    opened = []
+    try:
+        A, B = (_operand(X, opened) for X in (A, B))
+        return _outOfCoreProduct(A, B, out, memory, tile)
+    finally:
+        for M in opened:
+            close_matrix(M)
+
+
+def _operand(X, opened:list) -> Matrix:
+    """Matrix of an operand of the out-of-core multiplication (files are
+    mapped and appended to "opened", nested lists are converted to a
+    typed Matrix)"""
+    if isinstance(X, str):
+        M = open_matrix(X)
+        opened.append(M)
+        return M
+    return as_matrix(X)
+
+
+def _outOfCoreProduct(A:Matrix, B:Matrix, out:str, memory:int,
+                      tile:int) -> Matrix:
+    """Tiled product of "out_of_core_multiply" (operands as Matrix)"""
+    # Check if matrices dimensions match
+    (m, n), (nb, p) = matrix_shape(A), matrix_shape(B)
+    if n != nb:
+        raise ValueError("Matrices dimensions do not match!\n")
+
+    # Largest square tile such that tiles of A, B and C fit in memory
+    if tile is None:
+        memory = _MEMORY if memory is None else memory
+        tile = int((memory / (3*_ELEMENT_BYTES)) ** 0.5)
+    if tile < 1:
+        raise ValueError(f"Tile size (tile = {tile}) must be positive!\n")
+
+    # Output file (elements of integer operands stay integers)
+    typecode = promote_typecode(A, B)
+    _checkTypecode(typecode)
+    C = create_matrix(out, m, p, typecode)
+
+    # Iterate over (tile x tile) blocks of C
+    for ii in range(0, m, tile):
+        iend = min(ii+tile, m)
+        for jj in range(0, p, tile):
+            jend = min(jj+tile, p)
+            block = [[0]*(jend-jj) for _ in range(iend-ii)]
+
+            # Accumulate products of the tiles along the inner dimension
+            for kk in range(0, n, tile):
+                kend = min(kk+tile, n)
+                A_tile = A[ii:iend, kk:kend].tolist()
+                Bt_tile = B[kk:kend, jj:jend].T.tolist()
+                for a, crow in zip(A_tile, block):
+                    crow[:] = map(
+                        add, crow, [sum(map(mul, a, b)) for b in Bt_tile]
+                        )
+
+            # Write block of C to the output file
+            C[ii:iend, jj:jend].assign(block)
+
+    # Return results
+    return C
+
+
+def _checkTypecode(typecode:str) -> None:
+    """Check whether elements can be stored on a matrix file"""
+    if typecode not in ["d", "q"]:
+        raise ValueError(
+            f"Matrix files store float64 ('d') or int64 ('q') elements, "
+            f"not '{typecode}'!\n"
+            )
@@ -0,0 +1,303 @@
+"""
+Parallel Multiplication of 2D Matrices
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-18
+
+Implements multi-process matrix multiplication over shared memory.
+Operands and results are copied once into "multiprocessing.shared_memory"
+blocks, so worker processes only receive block names and index ranges
+(operands are never pickled per task):
+    - "standard"/"blocked": row blocks of C are computed by the pool;
+    - "strassen": the seven independent base products of the top
+      recursion levels are computed by the pool.
+
+"""
+
+# Standard library imports
+import multiprocessing
+import os
+import sys
+from multiprocessing import resource_tracker, shared_memory
+
+# Local application imports
+from linear_algebra import matrix_base_operations as base
+from linear_algebra.matrix import OBJECT, Matrix, as_matrix, promote_typecode
+
+
+# Columns of B (transposed once) cached by the current worker process
+_columns = {}
+
+
+def parallel_multiply(A, B, method:str="standard", workers:int=None,
+                      tile:int=128, cutoff:int=None):
+    """Multi-Process Multiplication of 2D Matrices
+
+    Elements must be numbers that fit in array("q") or array("d"), as
+    they are stored on shared memory buffers; int64 results that
+    overflow raise an OverflowError.
+
+    > Arguments:
+        - A (matrix): Nested list or Matrix representing a 2D matrix;
+        - B (matrix): Nested list or Matrix representing a 2D matrix;
+        - method (str): Method to multiply matrices.
+            ---> Options: "standard", "blocked", "strassen";
+            ---> Defaults to "standard".
+        - workers (int): Number of worker processes.
+            ---> Defaults to None (os.cpu_count()).
+        - tile (int): Tile size of the row-block kernel.
+            ---> Defaults to 128.
+        - cutoff (int): Leaf block size for the "strassen" method.
+            ---> Defaults to None (tuned default of the serial method).
+
+    > Output:
+        - Matrix with multiplication results (Matrix if any operand is
+          a Matrix, nested list otherwise).
+    """
+    # Get number of workers
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"Number of workers ({workers}) must be positive!\n")
+
+    # Check if elements can be stored on shared memory
+    X, Y = as_matrix(A), as_matrix(B)
+    typecode = promote_typecode(X, Y)
+    if typecode == OBJECT:
+        raise ValueError("Parallel multiplication needs numeric matrices!\n")
+
+    # Row blocks of the standard (cache-blocked) kernel
+    if method in ["standard", "blocked"]:
+        C = _parallelRows(X, Y, typecode, workers, tile)
+
+    # Top-level base products of Strassen's method
+    elif method == "strassen":
+        if cutoff is None:
+            cutoff = base._STRASSEN_CUTOFF
+        C = _parallelStrassen(X, Y, typecode, workers, cutoff)
+
+    # Method not implemented
+    else:
+        raise NotImplementedError(
+            f"Method '{method}' has no parallel implementation!\n"
+            )
+
+    # Return results
+    return base._likeInputs(C, X.rows, Y.cols, A, B)
+
+
+def _parallelRows(X:Matrix, Y:Matrix, typecode:str, workers:int,
+                  tile:int) -> Matrix:
+    """Row-Block Parallel Multiplication
+
+    > Arguments:
+        - X (Matrix): Left operand (m x n);
+        - Y (Matrix): Right operand (n x p);
+        - typecode (str): Element type of the shared buffers;
+        - workers (int): Number of worker processes;
+        - tile (int): Tile size of the blocked kernel.
+
+    > Output:
+        - New matrix with multiplication results.
+    """
+    m, n, p = X.rows, X.cols, Y.cols
+
+    # Copy operands into a shared memory block (C is left as zeros)
+    shm, (Xs, Ys, Cs) = _sharedMatrices([(m, n), (n, p), (m, p)], typecode)
+    try:
+        Xs.assign(X)
+        Ys.assign(Y)
+
+        # Split rows of C in a few blocks per worker (load balancing)
+        step = max(1, -(-m // (4*workers)))
+        tasks = [
+            (shm.name, typecode, m, n, p, start, min(start+step, m), tile)
+            for start in range(0, m, step)
+            ]
+
+        # Compute row blocks of C
+        with multiprocessing.Pool(workers) as pool:
+            pool.map(_rowsTask, tasks)
+
+        # Copy results out of shared memory
+        return Cs.copy()
+
+    finally:
+        _releaseShared(shm, Xs, Ys, Cs)
+
+
+def _rowsTask(task:tuple) -> None:
+    """Worker Task: Rows [start, stop) of C = X.Y on Shared Memory"""
+    name, typecode, m, n, p, start, stop, tile = task
+
+    # Attach to shared buffer
+    shm, data = _attach(name, typecode)
+    try:
+        X = Matrix(data, m, n)
+        Y = Matrix(data, n, p, offset=m*n)
+        C = Matrix(data, m, p, offset=m*n + n*p)
+
+        # Transpose B once per worker process
+        if name not in _columns:
+            _columns.clear()
+            _columns[name] = Y.T.tolist()
+
+        # Compute block of rows and write it into C
+        rows = base._blockedKernel(
+            [X.row(i) for i in range(start, stop)], _columns[name], tile
+            )
+        for i, row in enumerate(rows, start):
+            C.set_row(i, row)
+    finally:
+        _detach(shm, data)
+
+
+def _parallelStrassen(X:Matrix, Y:Matrix, typecode:str, workers:int,
+                      cutoff:int) -> Matrix:
+    """Strassen's Method with Parallel Top-Level Base Products
+
+    The recursion is expanded serially for as many levels as needed to
+    give every worker a product (7 products per level, up to 2 levels),
+    and each of those products runs on a worker process.
+
+    > Arguments:
+        - X (Matrix): Left operand;
+        - Y (Matrix): Right operand;
+        - typecode (str): Element type of the shared buffers;
+        - workers (int): Number of worker processes;
+        - cutoff (int): Leaf block size.
+
+    > Output:
+        - New matrix with multiplication results.
+    """
+    # Apply padding once (numeric buffers, for the whole recursion)
+    X, Y = base._cutoffPadding(X, Y, cutoff)
+
+    # Number of recursion levels expanded before distributing products
+    depth = 1
+    while 7**depth < workers and depth < 2:
+        depth += 1
+
+    # Workers must share the resource tracker of this process: a worker
+    # forked before it starts launches its own, which unlinks the blocks
+    # attached by that worker when it exits
+    resource_tracker.ensure_running()
+
+    blocks = []
+    try:
+        with multiprocessing.Pool(workers) as pool:
+            plan = _strassenPlan(X, Y, typecode, cutoff, depth, pool, blocks)
+            C = _strassenCollect(plan, typecode)
+
+        # Copy results out of shared memory (single-product plans)
+        return C.copy() if isinstance(C.data, memoryview) else C
+    finally:
+        for shm, views in blocks:
+            _releaseShared(shm, *views)
+
+
+def _strassenPlan(X:Matrix, Y:Matrix, typecode:str, cutoff:int, depth:int,
+                  pool, blocks:list):
+    """Expand Strassen's Recursion and Submit Leaf Products to the Pool
+
+    > Output:
+        - Tree of submitted products: a (AsyncResult, Matrix) tuple for
+          products computed by workers, or a list with seven subtrees.
+    """
+    n = X.rows
+
+    # Submit product to the pool (operands copied once to shared memory)
+    if depth == 0 or n <= cutoff:
+        shm, views = _sharedMatrices([(n, n)]*3, typecode)
+        blocks.append((shm, views))
+        views[0].assign(X)
+        views[1].assign(Y)
+        task = (shm.name, typecode, n, cutoff)
+        return pool.apply_async(_strassenTask, (task,)), views[2]
+
+    # Expand one more level of the recursion
+    return [
+        _strassenPlan(x, y, typecode, cutoff, depth-1, pool, blocks)
+        for x, y in base._strassenOperands(X, Y)
+        ]
+
+
+def _strassenCollect(plan, typecode:str) -> Matrix:
+    """Wait for Submitted Products and Combine them Bottom-Up"""
+    if isinstance(plan, tuple):
+        result, C = plan
+        result.get()
+        return C
+    p = [_strassenCollect(node, typecode) for node in plan]
+    return base._strassenCombine(p, 2*p[0].rows, typecode)
+
+
+def _strassenTask(task:tuple) -> None:
+    """Worker Task: Serial Strassen Product on Shared Memory"""
+    name, typecode, n, cutoff = task
+
+    # Attach to shared buffer
+    shm, data = _attach(name, typecode)
+    try:
+        X = Matrix(data, n, n)
+        Y = Matrix(data, n, n, offset=n*n)
+        C = Matrix(data, n, n, offset=2*n*n)
+
+        # Compute product and write it into C
+        C.assign(base._strassenSquare(X, Y, cutoff))
+    finally:
+        _detach(shm, data)
+
+
+def _sharedMatrices(shapes:list, typecode:str) -> tuple:
+    """Matrices of Zeros Stored Back-to-Back on one Shared Memory Block
+
+    > Arguments:
+        - shapes (list): List of (rows, cols) tuples;
+        - typecode (str): Element type ("d" or "q").
+
+    > Output:
+        - Tuple with SharedMemory block and list of matrices.
+    """
+    size = sum(r*c for r, c in shapes)
+    shm = shared_memory.SharedMemory(create=True, size=max(1, 8*size))
+    data = shm.buf.cast(typecode)
+
+    # Create matrices over consecutive regions of the buffer
+    matrices, offset = [], 0
+    for rows, cols in shapes:
+        matrices.append(Matrix(data, rows, cols, offset=offset))
+        offset += rows*cols
+    return shm, matrices
+
+
+def _releaseShared(shm, *matrices) -> None:
+    """Release buffer views, close and unlink a shared memory block"""
+    for M in matrices:
+        if isinstance(M.data, memoryview):
+            M.data.release()
+    shm.close()
+    shm.unlink()
+
+
+def _attach(name:str, typecode:str) -> tuple:
+    """Attach a worker to a shared memory block created by the parent
+
+    The parent process owns the block (and its unlink): attachments are
+    not tracked where Python allows it, and are otherwise registered with
+    the resource tracker shared with the parent, where they are no-ops.
+
+    > Output:
+        - Tuple with SharedMemory block and typed view of its buffer.
+    """
+    if sys.version_info >= (3, 13):
+        shm = shared_memory.SharedMemory(name=name, track=False)
+    else:
+        shm = shared_memory.SharedMemory(name=name)
+    return shm, shm.buf.cast(typecode)
+
+
+def _detach(shm, data:memoryview) -> None:
+    """Release the typed view and close a worker attachment"""
+    data.release()
+    shm.close()
@@ -0,0 +1,412 @@
+"""
+Sparse 2D Matrices (CSR) and Sparse Operations
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-18
+
+Implements a Compressed Sparse Row (CSR) matrix, a coordinate (COO)
+builder to assemble it, and the sparse kernels used by "matrix_add",
+"matrix_subtract" and "matrix_multiply" when any operand is sparse:
+    - sparse x sparse products use Gustavson's row-by-row algorithm;
+    - sparse x dense and dense x sparse products only visit nonzeros;
+    - sums of sparse matrices merge the nonzeros of each row.
+
+"""
+
+# Standard library imports
+from array import array
+from bisect import bisect_left
+from itertools import repeat
+from operator import add, mul
+
+# Local application imports
+from linear_algebra.matrix import (
+    OBJECT, Matrix, infer_typecode, matrix_shape, promote_typecode
+    )
+
+
+class CSRMatrix:
+    """Compressed Sparse Row 2D Matrix
+
+    Nonzeros of row i are "data[indptr[i]:indptr[i+1]]", at columns
+    "indices[indptr[i]:indptr[i+1]]" (sorted in ascending order).
+
+    > Attributes:
+        - rows (int): Number of rows;
+        - cols (int): Number of columns;
+        - indptr (array): Row pointers (rows + 1 entries);
+        - indices (array): Column index of each nonzero;
+        - data: Values of the nonzeros (array("d"), array("q") or list).
+    """
+
+    __slots__ = ("rows", "cols", "indptr", "indices", "data")
+
+    def __init__(self, rows:int, cols:int, indptr, indices, data):
+        # Check if the compressed structure is consistent
+        if len(indptr) != rows+1 or len(indices) != len(data):
+            raise ValueError("Inconsistent CSR structure!\n")
+        if indptr[0] != 0 or indptr[-1] != len(data):
+            raise ValueError("Inconsistent CSR structure!\n")
+
+        self.rows, self.cols = rows, cols
+        self.indptr, self.indices, self.data = indptr, indices, data
+
+    # ----------------------------------------------------------------
+    # Constructors
+    # ----------------------------------------------------------------
+
+    @classmethod
+    def from_dense(cls, A, typecode:str=None) -> "CSRMatrix":
+        """Sparse Matrix from a Dense Matrix (zeros are dropped)
+
+        > Arguments:
+            - A (matrix): Nested list or Matrix;
+            - typecode (str): Element type ("d", "q" or "O").
+                ---> Defaults to None (inferred from the nonzeros).
+
+        > Output:
+            - CSR matrix.
+        """
+        rows, cols = matrix_shape(A)
+        indptr, indices, values = array("q", [0]), array("q"), []
+        for i in range(rows):
+            row = A.row(i) if isinstance(A, Matrix) else A[i]
+            for j, x in enumerate(row):
+                if x != 0:
+                    indices.append(j)
+                    values.append(x)
+            indptr.append(len(values))
+        return cls(rows, cols, indptr, indices, _values(values, typecode))
+
+    @classmethod
+    def from_rows(cls, rows:int, cols:int, row_items,
+                  typecode:str=None) -> "CSRMatrix":
+        """Sparse Matrix from (column, value) Pairs of Each Row
+
+        > Arguments:
+            - rows (int), cols (int): Matrix shape;
+            - row_items: Iterable with, for each row, a list of
+              (column, value) pairs sorted by column;
+            - typecode (str): Element type.
+                ---> Defaults to None (inferred from the nonzeros).
+
+        > Output:
+            - CSR matrix.
+        """
+        indptr, indices, values = array("q", [0]), array("q"), []
+        for items in row_items:
+            for j, x in items:
+                indices.append(j)
+                values.append(x)
+            indptr.append(len(values))
+        return cls(rows, cols, indptr, indices, _values(values, typecode))
+
+    # ----------------------------------------------------------------
+    # Shape and element access
+    # ----------------------------------------------------------------
+
+    @property
+    def shape(self) -> tuple:
+        """Tuple with number of rows and columns"""
+        return self.rows, self.cols
+
+    @property
+    def nnz(self) -> int:
+        """Number of stored nonzeros"""
+        return len(self.data)
+
+    @property
+    def typecode(self) -> str:
+        """Element type ("d", "q" or "O" for list-backed values)"""
+        if isinstance(self.data, array):
+            return self.data.typecode
+        return OBJECT
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def row_items(self, i:int):
+        """Iterator of (column, value) pairs of the nonzeros of row i"""
+        start, stop = self.indptr[i], self.indptr[i+1]
+        return zip(self.indices[start:stop], self.data[start:stop])
+
+    def row(self, i:int) -> list:
+        """Dense list with the elements of row i"""
+        row = [0]*self.cols
+        for j, x in self.row_items(i):
+            row[j] = x
+        return row
+
+    def __getitem__(self, key):
+        # Row access (S[i]) returns a dense copy of the row
+        if not isinstance(key, tuple):
+            return self.row(key)
+
+        # Element access (S[i, j]) by binary search on the row
+        i, j = key
+        if not (0 <= i < self.rows and 0 <= j < self.cols):
+            raise IndexError("Matrix index out of range!\n")
+        start, stop = self.indptr[i], self.indptr[i+1]
+        k = bisect_left(self.indices, j, start, stop)
+        if k < stop and self.indices[k] == j:
+            return self.data[k]
+        return 0
+
+    # ----------------------------------------------------------------
+    # Conversions
+    # ----------------------------------------------------------------
+
+    def transpose(self) -> "CSRMatrix":
+        """Transposed matrix (new CSR, counting sort on columns)"""
+        # Count nonzeros per column to get the new row pointers
+        indptr = array("q", [0]*(self.cols+1))
+        for j in self.indices:
+            indptr[j+1] += 1
+        for j in range(self.cols):
+            indptr[j+1] += indptr[j]
+
+        # Scatter nonzeros (rows are visited in order, so columns of
+        # the transposed matrix come out sorted)
+        nxt = array("q", indptr[:-1])
+        indices = array("q", [0]*self.nnz)
+        data = _values([0]*self.nnz, self.typecode)
+        for i in range(self.rows):
+            for j, x in self.row_items(i):
+                k = nxt[j]
+                indices[k], data[k] = i, x
+                nxt[j] += 1
+        return CSRMatrix(self.cols, self.rows, indptr, indices, data)
+
+    @property
+    def T(self) -> "CSRMatrix":
+        """Transposed matrix"""
+        return self.transpose()
+
+    def tolist(self) -> list:
+        """Dense nested list with the matrix elements"""
+        return [self.row(i) for i in range(self.rows)]
+
+    def to_matrix(self, typecode:str=None) -> Matrix:
+        """Dense flat Matrix with the matrix elements"""
+        M = Matrix.zeros(
+            self.rows, self.cols,
+            self.typecode if typecode is None else typecode
+            )
+        for i in range(self.rows):
+            for j, x in self.row_items(i):
+                M[i, j] = x
+        return M
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, CSRMatrix):
+            return self.shape == other.shape and all(
+                list(self.row_items(i)) == list(other.row_items(i))
+                for i in range(self.rows)
+                )
+        if isinstance(other, (Matrix, list)):
+            return matrix_shape(other) == self.shape and all(
+                self.row(i) == list(other[i]) for i in range(self.rows)
+                )
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return (
+            f"CSRMatrix(shape={self.shape}, nnz={self.nnz}, "
+            f"typecode='{self.typecode}')"
+            )
+
+
+class COOBuilder:
+    """Coordinate (COO) Builder of Sparse Matrices
+
+    Collects (row, column, value) triples in any order and converts
+    them into a CSR matrix, summing duplicated coordinates.
+
+    > Attributes:
+        - rows (int), cols (int): Matrix shape;
+        - row_idx (array), col_idx (array): Coordinates of the entries;
+        - values (list): Values of the entries.
+    """
+
+    __slots__ = ("rows", "cols", "row_idx", "col_idx", "values")
+
+    def __init__(self, rows:int, cols:int):
+        self.rows, self.cols = rows, cols
+        self.row_idx, self.col_idx, self.values = array("q"), array("q"), []
+
+    def add(self, i:int, j:int, value) -> None:
+        """Add an entry (values of repeated coordinates are summed)"""
+        if not (0 <= i < self.rows and 0 <= j < self.cols):
+            raise IndexError("Matrix index out of range!\n")
+        self.row_idx.append(i)
+        self.col_idx.append(j)
+        self.values.append(value)
+
+    def extend(self, triples) -> None:
+        """Add (row, column, value) triples"""
+        for i, j, value in triples:
+            self.add(i, j, value)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def to_csr(self, typecode:str=None) -> CSRMatrix:
+        """Convert Entries into a CSR Matrix
+
+        > Arguments:
+            - typecode (str): Element type.
+                ---> Defaults to None (inferred from the values).
+
+        > Output:
+            - CSR matrix (duplicates summed, explicit zeros dropped).
+        """
+        # Bucket entries by row, summing duplicated columns
+        buckets = [{} for _ in range(self.rows)]
+        for i, j, x in zip(self.row_idx, self.col_idx, self.values):
+            row = buckets[i]
+            row[j] = row[j] + x if j in row else x
+
+        # Sort columns of each row
+        return CSRMatrix.from_rows(
+            self.rows, self.cols,
+            (sorted((j, x) for j, x in row.items() if x != 0)
+             for row in buckets),
+            typecode
+            )
+
+
+def is_sparse(*m) -> bool:
+    """Check whether any operand is a sparse (CSR) matrix"""
+    return any(isinstance(X, CSRMatrix) for X in m)
+
+
+def sparse_add(m:tuple, subtract:bool=False):
+    """Addition/Subtraction with Sparse Operands
+
+    Theta Notation:
+        - Sparse sums yield "nnz" (linear) time complexity;
+        - Mixed sums yield "n**2" (quadratic) time complexity.
+
+    > Arguments:
+        - m (tuple): 2D matrices with matching dimensions (at least one
+          of them sparse);
+        - subtract (bool): Subtract the remaining matrices from the
+          first one instead of adding all of them.
+            ---> Defaults to False.
+
+    > Output:
+        - CSR matrix if every operand is sparse, dense matrix otherwise
+          (Matrix if any operand is a Matrix, nested list otherwise).
+    """
+    signs = [1] + [-1 if subtract else 1]*(len(m)-1)
+    rows, cols = matrix_shape(m[0])
+
+    # Merge nonzeros of every row (all operands sparse)
+    if all(isinstance(X, CSRMatrix) for X in m):
+        merged = []
+        for i in range(rows):
+            acc = {}
+            for sign, X in zip(signs, m):
+                for j, x in X.row_items(i):
+                    acc[j] = acc[j] + sign*x if j in acc else sign*x
+            merged.append(sorted((j, x) for j, x in acc.items() if x != 0))
+        return CSRMatrix.from_rows(rows, cols, merged, promote_typecode(*m))
+
+    # Add sparse rows into dense rows (mixed operands)
+    out = []
+    for i in range(rows):
+        acc = [0]*cols
+        for sign, X in zip(signs, m):
+            if isinstance(X, CSRMatrix):
+                for j, x in X.row_items(i):
+                    acc[j] += sign*x
+            else:
+                row = X.row(i) if isinstance(X, Matrix) else X[i]
+                if sign == -1:
+                    row = [-x for x in row]
+                acc = list(map(add, acc, row))
+        out.append(acc)
+    return _dense(out, m)
+
+
+def sparse_multiply(A, B):
+    """Multiplication with Sparse Operands
+
+    Theta Notation:
+        - Sparse x sparse yields "flops" time complexity (number of
+          nonzero products, Gustavson's algorithm);
+        - Sparse x dense yields "nnz(A)*p" time complexity;
+        - Dense x sparse yields "m*n + m*nnz(B)/n" time complexity.
+
+    > Arguments:
+        - A (matrix): Left operand (CSRMatrix, Matrix or nested list);
+        - B (matrix): Right operand (CSRMatrix, Matrix or nested list).
+
+    > Output:
+        - CSR matrix if both operands are sparse, dense matrix otherwise
+          (Matrix if any operand is a Matrix, nested list otherwise).
+    """
+    # Sparse x Sparse (Gustavson)
+    if isinstance(A, CSRMatrix) and isinstance(B, CSRMatrix):
+        return _gustavson(A, B)
+
+    # Sparse x Dense
+    if isinstance(A, CSRMatrix):
+        p = matrix_shape(B)[1]
+        Brows = B.tolist() if isinstance(B, Matrix) else B
+        out = []
+        for i in range(A.rows):
+            acc = [0]*p
+            for k, a in A.row_items(i):
+                acc = list(map(add, acc, map(mul, repeat(a), Brows[k])))
+            out.append(acc)
+        return _dense(out, (A, B))
+
+    # Dense x Sparse
+    out = []
+    for i in range(matrix_shape(A)[0]):
+        acc = [0]*B.cols
+        row = A.row(i) if isinstance(A, Matrix) else A[i]
+        for k, a in enumerate(row):
+            if a != 0:
+                for j, b in B.row_items(k):
+                    acc[j] += a*b
+        out.append(acc)
+    return _dense(out, (A, B))
+
+
+def _gustavson(A:CSRMatrix, B:CSRMatrix) -> CSRMatrix:
+    """Gustavson's Row-by-Row Sparse Product
+
+    Each row of C is accumulated in a dense buffer of B.cols entries,
+    tagged by a marker array, so only touched columns are visited.
+    """
+    acc, marker = [0]*B.cols, [-1]*B.cols
+    out = []
+    for i in range(A.rows):
+        touched = []
+        for k, a in A.row_items(i):
+            for j, b in B.row_items(k):
+                if marker[j] != i:
+                    marker[j] = i
+                    acc[j] = a*b
+                    touched.append(j)
+                else:
+                    acc[j] += a*b
+        touched.sort()
+        out.append([(j, acc[j]) for j in touched if acc[j] != 0])
+    return CSRMatrix.from_rows(A.rows, B.cols, out, promote_typecode(A, B))
+
+
+def _dense(rows:list, operands:tuple):
+    """Dense results as a Matrix (if any operand is one) or nested list"""
+    if any(isinstance(X, Matrix) for X in operands):
+        return Matrix.from_list(rows, promote_typecode(*operands))
+    return rows
+
+
+def _values(values:list, typecode:str=None):
+    """Buffer for the values of the nonzeros"""
+    if typecode is None:
+        typecode = infer_typecode(values)
+    return values if typecode == OBJECT else array(typecode, values)
@@ -0,0 +1,33 @@
+"""
+Polynomials
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-18
+
+Package with the polynomial arithmetic, evaluation, interpolation and
+root finding (submodules are imported on first access)
+
+"""
+
+# Standard library imports
+import importlib
+
+
+# Submodules of the package
+__all__ = [
+    "horner_rule_polys",
+    "multipoint",
+    "polynomial",
+    "root_finding",
+    ]
+
+
+def __getattr__(name:str):
+    """Import a submodule on first access"""
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
@@ -2,37 +2,291 @@
 Horner's Rule to Evaluate Polynomials in Python
 
 Author: Marcus Moresco Boeno
-Date: 2020-10-07
+Last Update: 2026-10-18
 
-Implements a function that evaluates a polynomial using the
-Horner's Rule algorithm as described on Chapter 2 of the book 
-"Introduction to Algorithms" by Thomas H. Cormen et al. (2009)
+Implements functions that evaluate a polynomial using the
+Horner's Rule algorithm as described on Chapter 2 of the book
+"Introduction to Algorithms" by Thomas H. Cormen et al. (2009), at one
+point or at many points at once (optionally along with derivatives),
+and using Estrin's scheme (which splits the evaluation into independent
+halves of lower degree), as well as compiled evaluators specialized
+for fixed coefficients
 
 """
 
+# Standard library imports
+from functools import lru_cache
+
+# Local application imports
+from linear_algebra.backends import (
+    fits_int64, get_backend, int_bound, is_ndarray, numpy_module
+    )
+
 
 def horner_eval(coeffs, x):
     """Horner Rule for Polynomial Evaluation
-    
+
+    Theta Notation:
+        - Horner's rule yields "n" (linear) time complexity.
+
     > Arguments:
-        - lst (list): List of ordered coefficients.
-    
+        - coeffs (list): List of ordered coefficients (coeffs[i]
+          multiplies x**i);
+        - x (number): Point of evaluation.
+
     > Output:
         - Polynomial evaluation for a given x.
     """
+    # Iterate over coefficients (from the leading one)
+    y = coeffs[-1]
+    for i in range(len(coeffs)-2, -1, -1):
+        y = coeffs[i] + x*y
 
-    # Iterate over coefficients
-    i = len(coeffs)-1
-    while i >= 0:
-        if i == len(coeffs)-1:
-            y = coeffs[i]
-        else:
-            y = coeffs[i] + x*y
-        i -= 1
-    
     # Return evaluation
     return y
-    
+
+
+def horner_derivatives(coeffs, x, k:int=1) -> list:
+    """Horner Rule for a Polynomial and its Derivatives
+
+    Theta Notation:
+        - Horner's rule with derivatives yields "n*k" time complexity.
+
+    Runs k+1 Horner recurrences in the same pass over the coefficients
+    (the j-th one accumulates the j-th Taylor coefficient of p at x,
+    p^(j)(x)/j!), instead of one pass per derivative.
+
+    > Arguments:
+        - coeffs (list): List of ordered coefficients (coeffs[i]
+          multiplies x**i);
+        - x (number): Point of evaluation (or ndarray of points);
+        - k (int): Number of derivatives.
+            ---> Defaults to 1.
+
+    > Output:
+        - List with p(x), p'(x), ..., p^(k)(x).
+    """
+    # Check if the number of derivatives is valid
+    if k < 0:
+        raise ValueError(f"Number of derivatives (k = {k}) is negative!\n")
+
+    # Taylor coefficients of p at x
+    d = [coeffs[-1]] + [0]*k
+    for i in range(len(coeffs)-2, -1, -1):
+        for j in range(min(k, len(coeffs)-1-i), 0, -1):
+            d[j] = d[j]*x + d[j-1]
+        d[0] = d[0]*x + coeffs[i]
+
+    # Scale Taylor coefficients into derivatives (j! * d[j])
+    factorial = 1
+    for j in range(2, k+1):
+        factorial *= j
+        d[j] = factorial*d[j]
+    return d
+
+
+def horner_eval_many(coeffs, xs, as_ndarray:bool=False):
+    """Horner Rule for Polynomial Evaluation at Many Points
+
+    Theta Notation:
+        - Multi-point Horner's rule yields "n*k" time complexity for k
+          points.
+
+    Numeric points are evaluated with NumPy (one vectorized Horner step
+    per coefficient) when the "numpy" backend is active (see
+    "linear_algebra.backends"); integer evaluations that could overflow
+    int64 run in pure Python.
+
+    > Arguments:
+        - coeffs (list): List of ordered coefficients (coeffs[i]
+          multiplies x**i);
+        - xs (list): Points of evaluation (list, array or ndarray);
+        - as_ndarray (bool): Return results as a NumPy ndarray.
+            ---> Defaults to False.
+
+    > Output:
+        - List with one evaluation per point (ndarray if asked or if xs
+          is an ndarray).
+    """
+    # Vectorized path
+    X = _numericPoints(coeffs, xs)
+    if X is not None:
+        Y = numpy_module().full(X.shape, coeffs[-1], dtype=X.dtype)
+        for c in reversed(coeffs[:-1]):
+            Y *= X
+            Y += c
+        return Y if as_ndarray or is_ndarray(xs) else Y.tolist()
+
+    # Pure-Python path (coefficients bound to locals of the kernel)
+    lead, rest = coeffs[-1], coeffs[-2::-1]
+
+    def kernel(x, lead=lead, rest=rest):
+        y = lead
+        for c in rest:
+            y = y*x + c
+        return y
+
+    Y = list(map(kernel, xs))
+    return numpy_module().array(Y) if as_ndarray or is_ndarray(xs) else Y
+
+
+def estrin_eval(coeffs, x):
+    """Estrin's Scheme for Polynomial Evaluation
+
+    Theta Notation:
+        - Estrin's scheme yields "n" (linear) time complexity, with
+          "lg(n)" dependent steps (instead of "n" for Horner's rule).
+
+    Coefficients are combined in pairs (c0 + c1*x, c2 + c3*x, ...),
+    then the pairs in pairs with x**2, then with x**4, and so on. Each
+    level is made of independent products, so rounding errors grow
+    with lg(n) and, for ndarray points, each level is one vectorized
+    operation over all the pairs.
+
+    > Arguments:
+        - coeffs (list): List of ordered coefficients (coeffs[i]
+          multiplies x**i);
+        - x (number): Point of evaluation (or ndarray of points).
+
+    > Output:
+        - Polynomial evaluation for a given x.
+    """
+    terms, power = list(coeffs), x
+
+    # Combine pairs of terms until a single term remains
+    while len(terms) > 1:
+        if len(terms) % 2:
+            terms.append(0)
+        terms = [
+            terms[i] + power*terms[i+1] for i in range(0, len(terms), 2)
+            ]
+        power = power*power
+
+    # Return evaluation
+    return terms[0]
+
+
+def compile_poly(coeffs):
+    """Compiled Evaluator Specialized for Fixed Coefficients
+
+    Generates straight-line Horner's rule code for the coefficients,
+    with numbers folded into the code as constants, zero coefficients
+    skipped and unit coefficients dropped. For coefficients
+    [-2310, 727, 0, 1] the generated function is:
+
+        def poly(x):
+            y = x*x + 727
+            y = y*x - 2310
+            return y
+
+    Evaluators are cached (by the coefficients and their types), so
+    compiling recurring coefficients is a lookup.
+
+    > Arguments:
+        - coeffs (list): List of ordered coefficients (coeffs[i]
+          multiplies x**i).
+
+    > Output:
+        - Function evaluating the polynomial at x (a number or, with
+          the same operations element-wise, an ndarray).
+    """
+    coeffs = tuple(coeffs)
+    return _compilePoly(coeffs, tuple(map(type, coeffs)))
+
+
+@lru_cache(maxsize=256)
+def _compilePoly(coeffs:tuple, types:tuple):
+    """Generate and compile the evaluator of "compile_poly"
+
+    > Arguments:
+        - coeffs (tuple): Ordered coefficients;
+        - types (tuple): Types of the coefficients (part of the cache
+          key only, so that 1 and 1.0 get distinct evaluators).
+
+    > Output:
+        - Compiled function.
+    """
+    constants = {}
+
+    # Source of a coefficient: literal for finite numbers, bound name
+    # for anything else (fractions, complex numbers, nan, inf, ...)
+    def value(k, c):
+        if type(c) in (int, float) and abs(c) < float("inf"):
+            return repr(c)
+        constants[f"c{k}"] = c
+        return f"c{k}"
+
+    # Source of "acc * x**p" (unit integer factors dropped)
+    def scaled(acc, p):
+        power = "*".join(["x"]*p) if p <= 3 else f"x**{p}"
+        if acc in ["1", "-1"]:
+            return power if acc == "1" else f"-{power}"
+        return f"{acc}*{power}"
+
+    # Trim zero leading coefficients
+    n = len(coeffs)
+    while n > 1 and not coeffs[n-1]:
+        n -= 1
+
+    # One multiply-add per nonzero coefficient, zero coefficients are
+    # folded into the power of x of the next step
+    acc, pending, lines = value(n-1, coeffs[n-1]), 0, []
+    for k in range(n-2, -1, -1):
+        pending += 1
+        c = coeffs[k]
+        if c:
+            term = value(k, c)
+            term = f"- {term[1:]}" if term.startswith("-") else f"+ {term}"
+            lines.append(f"y = {scaled(acc, pending)} {term}")
+            acc, pending = "y", 0
+    if pending or not lines:
+        lines.append(f"y = {scaled(acc, pending) if pending else acc}")
+
+    # Build and compile the evaluator source
+    source = "def poly(x):\n    " + "\n    ".join(lines + ["return y"])
+    exec(source, constants)
+    return constants["poly"]
+
+
+def _numericPoints(coeffs, xs):
+    """int64/float64 ndarray of the points (None for pure Python)
+
+    > Arguments:
+        - coeffs (list): Coefficients;
+        - xs (list): Points of evaluation.
+
+    > Output:
+        - ndarray of points, or None if the "numpy" backend is not
+          active, if coefficients or points are not numeric or if
+          integer evaluations could overflow int64.
+    """
+    if getattr(get_backend(), "name", None) != "numpy" or not len(xs):
+        return None
+    np = numpy_module()
+
+    # Types of the coefficients and of the points
+    if not all(type(c) in (int, float) for c in coeffs):
+        return None
+    if is_ndarray(xs):
+        if xs.dtype.kind not in "iuf":
+            return None
+        X = xs
+    else:
+        kinds = set(map(type, xs))
+        if not kinds <= {int, float}:
+            return None
+        X = np.array(xs, dtype="d" if float in kinds else object)
+
+    # Floats: evaluated in float64
+    if X.dtype.kind == "f" or any(type(c) is float for c in coeffs):
+        return X.astype("d", copy=False)
+
+    # Integers: bound |p(x)| by sum(|c|) * max(|x|, 1)**degree
+    bound = max(1, int_bound(X))
+    if not fits_int64(sum(map(abs, coeffs)) * bound**(len(coeffs)-1)):
+        return None
+    return X.astype("q")
+
 
 if __name__ == "__main__":
 
@@ -41,4 +295,7 @@ if __name__ == "__main__":
     print("\n>> Horner's Rule Example:")
     print(f"\nPolynomial Coeffs: {pol_coeffs}")
     print(f"Eval for p({2}): {horner_eval(pol_coeffs, 2)}")
-    print(f"Eval for p({3}): {horner_eval(pol_coeffs, 3)}\n")
\ No newline at end of file
+    print(f"Eval for p({3}): {horner_eval(pol_coeffs, 3)}")
+    print(f"Eval for p([0, ..., 5]): {horner_eval_many(pol_coeffs, range(6))}")
+    print(f"Estrin eval for p({3}): {estrin_eval(pol_coeffs, 3)}")
+    print(f"p, p', p'' for x = {3}: {horner_derivatives(pol_coeffs, 3, 2)}\n")
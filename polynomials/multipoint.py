@@ -0,0 +1,362 @@
+"""
+Fast Multipoint Evaluation and Interpolation of Polynomials
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-18
+
+Implements the evaluation of a polynomial at n points and the
+interpolation of a polynomial through n points with a subproduct tree
+(the products of the linear factors (x - x_i) over a binary tree of the
+points), which take "n*lg(n)**2" operations on top of the fast
+polynomial products of "polynomials.polynomial" (instead of "n**2" for
+n calls of Horner's rule). Trees depend only on the points, so they are
+built once and cached for points that recur.
+
+Remainder trees are numerically unstable in floating point (errors
+grow with the coefficients of the tree nodes), so trees are only used
+for exact data (integers and fractions). Floating point data is
+interpolated with Newton's divided differences, in "n**2" operations.
+Exact coefficients of the tree nodes grow to about n*lg(max|x_i|) bits,
+so the bound above counts big-integer operations, each one costlier as
+the tree is climbed: in CPython, remainder trees were slower than n
+calls of Horner's rule at every size measured (up to n = 2048 for
+integer points, 30x slower there), so "multipoint_eval" evaluates with
+Horner's rule unless the remainder tree is requested (method="tree")
+
+"""
+
+# Standard library imports
+from collections import OrderedDict
+from fractions import Fraction
+from math import gcd
+
+# Local application imports
+from polynomials.horner_rule_polys import horner_eval_many
+from polynomials.polynomial import (
+    _KARATSUBA_CUTOFF, Polynomial, poly_multiply
+    )
+
+
+# Cached subproduct trees (least recently used first) and cache size
+_trees = OrderedDict()
+_CACHE_SIZE = 16
+
+
+class SubproductTree:
+    """Subproduct Tree of a Sequence of Points
+
+    levels[0] holds the linear factors (x - x_i) and each node of
+    levels[k+1] is the product of two adjacent nodes of levels[k] (an
+    odd node out is carried to the next level), up to the root, the
+    product of every factor. Nodes are lists of ordered coefficients.
+
+    > Attributes:
+        - points (tuple): Points of the tree;
+        - levels (list): Nodes of each level (from the leaves).
+    """
+
+    __slots__ = ("points", "levels", "_inverses", "_derivatives")
+
+    def __init__(self, points):
+        self.points = tuple(points)
+        if not self.points:
+            raise ValueError("Not enough points to build a tree!\n")
+
+        # Multiply adjacent nodes until the root is reached
+        self.levels = [[[-x, 1] for x in self.points]]
+        while len(self.levels[-1]) > 1:
+            nodes = self.levels[-1]
+            self.levels.append([
+                poly_multiply(nodes[i], nodes[i+1]) if i+1 < len(nodes)
+                else nodes[i] for i in range(0, len(nodes), 2)
+                ])
+
+        # Inverses of reversed nodes and derivative of the root at the
+        # points (computed on demand)
+        self._inverses = {}
+        self._derivatives = None
+
+    @property
+    def root(self) -> list:
+        """Coefficients of the product of every (x - x_i)"""
+        return self.levels[-1][0]
+
+    def evaluate(self, coeffs) -> list:
+        """Evaluate a Polynomial at the Points of the Tree
+
+        Theta Notation:
+            - Remainder tree yields "n*lg(n)**2" time complexity (with
+              fast products).
+
+        The polynomial is reduced modulo the root and the remainders
+        are reduced down the tree, p(x_i) being p mod (x - x_i).
+        Floating point data is evaluated with Horner's rule.
+
+        > Arguments:
+            - coeffs (list): Ordered coefficients (or a Polynomial).
+
+        > Output:
+            - List with one evaluation per point.
+        """
+        coeffs = coeffs.coeffs if isinstance(coeffs, Polynomial) else coeffs
+        if not (_isExact(self.points) and _isExact(coeffs)):
+            return horner_eval_many(coeffs, self.points)
+
+        top = len(self.levels) - 1
+        remainders = [self._remainder(list(coeffs), top, 0)]
+
+        # Reduce the remainders of each level modulo their children
+        for k in range(top-1, -1, -1):
+            nodes, parents = self.levels[k], remainders
+            remainders = []
+            for j in range(len(nodes)):
+                r = parents[j // 2]
+                if j % 2 == 0 and j+1 == len(nodes):
+                    remainders.append(r)
+                else:
+                    remainders.append(self._remainder(r, k, j))
+
+        # Remainders modulo the leaves are constants
+        return [r[0] if r else 0 for r in remainders]
+
+    def interpolate(self, values) -> Polynomial:
+        """Polynomial of Lowest Degree Through (x_i, values[i])
+
+        Theta Notation:
+            - Interpolation yields "n*lg(n)**2" time complexity (with
+              fast products).
+
+        Lagrange's formula: p = sum of w_i * root / (x - x_i), with
+        w_i = values[i] / root'(x_i), is accumulated up the tree.
+        Integer data is interpolated exactly (Fraction coefficients)
+        and floating point data with Newton's divided differences.
+
+        > Arguments:
+            - values (list): One value per point.
+
+        > Output:
+            - Interpolating Polynomial.
+        """
+        if len(values) != len(self.points):
+            raise ValueError("Number of values and points do not match!\n")
+        if not (_isExact(self.points) and _isExact(values)):
+            return _newtonInterpolation(self.points, values)
+
+        # Derivative of the root at the points (reused across calls)
+        if self._derivatives is None:
+            root = self.root
+            self._derivatives = self.evaluate(
+                [i*c for i, c in enumerate(root)][1:]
+                )
+        if any(not d for d in self._derivatives):
+            raise ValueError("Points must be distinct!\n")
+
+        # Combine the weighted leaves up the tree, as numerators over a
+        # common denominator (integer products for integer data)
+        combined = [
+            ([y], d) if type(y) is int and type(d) is int
+            else ([_quotient(y, d)], 1)
+            for y, d in zip(values, self._derivatives)
+            ]
+        for nodes in self.levels[:-1]:
+            combined = [
+                _combineWeighted(combined[i], combined[i+1], *nodes[i:i+2])
+                if i+1 < len(nodes) else combined[i]
+                for i in range(0, len(nodes), 2)
+                ]
+
+        # Return results
+        N, D = combined[0]
+        return Polynomial([_quotient(c, D) for c in N])
+
+    def _remainder(self, a:list, k:int, j:int) -> list:
+        """Remainder of a modulo the node j of level k"""
+        b = self.levels[k][j]
+        if len(a) < len(b):
+            return a
+
+        # Short divisors: schoolbook division
+        if len(b) <= _KARATSUBA_CUTOFF:
+            return (Polynomial(a) % Polynomial(b)).coeffs
+
+        # Quotient from the reversed polynomials (Newton inversion):
+        # rev(q) = rev(a) * rev(b)**-1 mod x**(len(a)-len(b)+1)
+        size = len(a) - len(b) + 1
+        inverse = self._inverses.get((k, j))
+        if inverse is None or len(inverse) < size:
+            inverse = _seriesInverse(b[::-1], size)
+            self._inverses[(k, j)] = inverse
+        q = poly_multiply(a[::-1][:size], inverse[:size])[:size]
+        q = (q + [0]*(size-len(q)))[::-1]
+
+        # Remainder a - q*b (terms below the degree of b)
+        qb = poly_multiply(q, b)
+        return [x - y for x, y in zip(a[:len(b)-1], qb)]
+
+    def __repr__(self) -> str:
+        return f"SubproductTree(n={len(self.points)})"
+
+
+def subproduct_tree(points) -> SubproductTree:
+    """Subproduct Tree of the Points (cached)
+
+    > Arguments:
+        - points (list): Points (hashable numbers).
+
+    > Output:
+        - Cached SubproductTree of the points.
+    """
+    key = tuple(points)
+    if key in _trees:
+        _trees.move_to_end(key)
+        return _trees[key]
+
+    # Build and store
+    tree = _trees[key] = SubproductTree(key)
+    if len(_trees) > _CACHE_SIZE:
+        _trees.popitem(last=False)
+    return tree
+
+
+def multipoint_eval(coeffs, points, method:str="horner") -> list:
+    """Evaluate a Polynomial at Many Points
+
+    Theta Notation:
+        - "horner" yields "n**2" time complexity (n points);
+        - "tree" yields "n*lg(n)**2" time complexity (with fast
+          products).
+
+    Horner's rule (see "horner_eval_many") beats the remainder tree of
+    "SubproductTree.evaluate" on exact data in CPython (see the module
+    notes). The remainder tree descends the cached subproduct tree of
+    the points; floating point data is always evaluated with Horner's
+    rule, the stable choice.
+
+    > Arguments:
+        - coeffs (list): Ordered coefficients (or a Polynomial);
+        - points (list): Points of evaluation;
+        - method (str): Method of evaluation.
+            ---> Options: "horner", "tree";
+            ---> Defaults to "horner".
+
+    > Output:
+        - List with one evaluation per point.
+    """
+    coeffs = coeffs.coeffs if isinstance(coeffs, Polynomial) else coeffs
+
+    # Remainder tree (exact data only)
+    if method == "tree":
+        points = list(points)
+        if points and _isExact(points) and _isExact(coeffs):
+            return subproduct_tree(points).evaluate(coeffs)
+
+    # Method not implemented
+    elif method != "horner":
+        raise NotImplementedError(f"Method '{method}' not implemented!\n")
+
+    # Horner's rule at each point
+    return horner_eval_many(coeffs, points)
+
+
+def interpolate(points, values) -> Polynomial:
+    """Interpolate a Polynomial Through Points (subproduct tree)
+
+    > Arguments:
+        - points (list): Distinct points;
+        - values (list): One value per point.
+
+    > Output:
+        - Interpolating Polynomial (degree lower than len(points)).
+    """
+    # Floating point data does not use (nor cache) a tree
+    if not _isExact(points):
+        if len(values) != len(points):
+            raise ValueError("Number of values and points do not match!\n")
+        return _newtonInterpolation(points, values)
+    return subproduct_tree(points).interpolate(values)
+
+
+def clear_tree_cache() -> None:
+    """Remove every cached subproduct tree"""
+    _trees.clear()
+
+
+def _seriesInverse(f:list, n:int) -> list:
+    """First n coefficients of 1/f as a power series (f[0] != 0)
+
+    Newton's iteration g <- g*(2 - f*g) doubles the number of correct
+    coefficients of g at each step.
+    """
+    g, k = [_quotient(1, f[0])], 1
+    while k < n:
+        k = min(2*k, n)
+        e = [-c for c in poly_multiply(f[:k], g)[:k]]
+        e[0] += 2
+        g = poly_multiply(g, e)[:k]
+    return g
+
+
+def _combineWeighted(left:tuple, right:tuple, P:list, Q:list) -> tuple:
+    """Sum N1/D1 * Q + N2/D2 * P as a numerator over a denominator"""
+    (N1, D1), (N2, D2) = left, right
+    g = gcd(D1, D2)
+    s1, s2 = D2 // g, D1 // g
+    N = _addCoeffs(
+        [c*s1 for c in poly_multiply(N1, Q)],
+        [c*s2 for c in poly_multiply(N2, P)]
+        )
+    return N, s2*D2
+
+
+def _newtonInterpolation(points, values) -> Polynomial:
+    """Interpolation with Newton's divided differences ("n**2")"""
+    x, a = list(points), list(values)
+    n = len(x)
+
+    # Divided differences (a[k] becomes f[x_0, ..., x_k])
+    for k in range(1, n):
+        for i in range(n-1, k-1, -1):
+            if x[i] == x[i-k]:
+                raise ValueError("Points must be distinct!\n")
+            a[i] = (a[i] - a[i-1]) / (x[i] - x[i-k])
+
+    # Expand the Newton form (Horner's rule over polynomials)
+    coeffs = [a[-1]]
+    for k in range(n-2, -1, -1):
+        coeffs = [a[k] - x[k]*coeffs[0]] + [
+            c - x[k]*d for c, d in zip(coeffs[:-1], coeffs[1:])
+            ] + [coeffs[-1]]
+    return Polynomial(coeffs)
+
+
+def _isExact(values) -> bool:
+    """Check whether every value is an integer or a Fraction"""
+    return all(type(v) is int or type(v) is Fraction for v in values)
+
+
+def _addCoeffs(a:list, b:list) -> list:
+    """Coefficients of a + b"""
+    if len(a) < len(b):
+        a, b = b, a
+    return [x + y for x, y in zip(a, b)] + a[len(b):]
+
+
+def _quotient(x, y):
+    """x / y (exact Fraction for integers, as an integer if possible)"""
+    if type(x) is int and type(y) is int:
+        return x // y if x % y == 0 else Fraction(x, y)
+    q = x / y
+    return int(q) if type(q) is Fraction and q.denominator == 1 else q
+
+
+if __name__ == "__main__":
+
+    # Declare a polynomial and points, present results for example purposes
+    p = Polynomial([-2310, 727, 382, -72, -8, 1])
+    points = [0, 1, 2, 3, 4, 5]
+    values = multipoint_eval(p, points)
+
+    print("\n>> Subproduct Tree Example:")
+    print(f"\np: {p}\nPoints: {points}")
+    print(f"  > Evaluations: {values}")
+    print(f"  > Interpolation: {interpolate(points, values)}\n")
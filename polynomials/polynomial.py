@@ -0,0 +1,537 @@
+"""
+Polynomials in Coefficient Representation
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-18
+
+Implements a polynomial type (coefficient representation) with
+addition, multiplication, division with remainder and composition.
+Products are computed with the schoolbook method, Karatsuba's method
+or convolution through the FFT, as described on Chapter 30 of the
+book "Introduction to Algorithms" by Thomas H. Cormen et al. (2009),
+depending on the size of the operands. Integer polynomials are
+multiplied exactly, either with the number-theoretic transform (NTT),
+the FFT over the integers modulo a prime, or by Kronecker substitution
+(a single product of big integers, the fastest in CPython)
+
+"""
+
+# Standard library imports
+import cmath
+import random
+from functools import lru_cache
+from operator import add, sub
+
+# Local application imports
+from linear_algebra.backends import get_backend, numpy_module
+from polynomials.horner_rule_polys import horner_eval, horner_eval_many
+
+
+# Operand sizes (number of coefficients of the shortest operand) from
+# which Karatsuba's method and transforms are used (break-even points
+# of the pure-Python implementations)
+_KARATSUBA_CUTOFF = 64
+_FFT_CUTOFF = 512
+
+# Operand size from which integer products use Kronecker substitution
+_KRONECKER_CUTOFF = 16
+
+
+class Polynomial:
+    """Polynomial in Coefficient Representation
+
+    Coefficients are stored from the lowest degree (coeffs[i]
+    multiplies x**i) without trailing zeros (the zero polynomial has
+    the single coefficient 0).
+
+    > Attributes:
+        - coeffs (list): Ordered coefficients.
+    """
+
+    __slots__ = ("coeffs",)
+
+    def __init__(self, coeffs=(0,)):
+        self.coeffs = _trim(list(coeffs))
+
+    @property
+    def degree(self) -> int:
+        """Degree of the polynomial (-1 for the zero polynomial)"""
+        if len(self.coeffs) == 1 and not self.coeffs[0]:
+            return -1
+        return len(self.coeffs) - 1
+
+    def __len__(self) -> int:
+        return len(self.coeffs)
+
+    def __getitem__(self, i:int):
+        return self.coeffs[i] if 0 <= i < len(self.coeffs) else 0
+
+    # ----------------------------------------------------------------
+    # Arithmetic
+    # ----------------------------------------------------------------
+
+    def __add__(self, other) -> "Polynomial":
+        a, b = self.coeffs, _coeffs(other)
+        if len(a) < len(b):
+            a, b = b, a
+        return Polynomial(list(map(add, a, b)) + a[len(b):])
+
+    __radd__ = __add__
+
+    def __neg__(self) -> "Polynomial":
+        return Polynomial([-c for c in self.coeffs])
+
+    def __sub__(self, other) -> "Polynomial":
+        return self + (-_polynomial(other))
+
+    def __rsub__(self, other) -> "Polynomial":
+        return _polynomial(other) + (-self)
+
+    def __mul__(self, other) -> "Polynomial":
+        if isinstance(other, Polynomial):
+            return Polynomial(poly_multiply(self.coeffs, other.coeffs))
+        return Polynomial([c*other for c in self.coeffs])
+
+    __rmul__ = __mul__
+
+    def __pow__(self, k:int) -> "Polynomial":
+        # Check the exponent (k >> 1 never reaches 0 for negative k)
+        if not isinstance(k, int):
+            raise TypeError(
+                f"Exponent must be an integer, not '{type(k).__name__}'!\n"
+                )
+        if k < 0:
+            raise ValueError(f"Exponent (k = {k}) is negative!\n")
+
+        # Exponentiation by squaring
+        result, base = Polynomial([1]), self
+        while k:
+            if k & 1:
+                result = result * base
+            base, k = base * base, k >> 1
+        return result
+
+    def __divmod__(self, other) -> tuple:
+        """Quotient and remainder of the division by "other"
+
+        Integer coefficients stay integers while every step of the
+        division is exact (e.g. for monic divisors).
+        """
+        b = _coeffs(other)
+        if len(b) == 1 and not b[0]:
+            raise ZeroDivisionError("Polynomial division by zero!\n")
+
+        r, lead = list(self.coeffs), b[-1]
+        q = [0]*max(len(r)-len(b)+1, 1)
+
+        # Cancel the leading term of the remainder at each step
+        for k in range(len(r)-len(b), -1, -1):
+            c = _divide(r[k+len(b)-1], lead)
+            q[k] = c
+            if c:
+                r[k:k+len(b)] = [x - c*y for x, y in zip(r[k:k+len(b)], b)]
+
+        return Polynomial(q), Polynomial(r[:len(b)-1] or [0])
+
+    def __floordiv__(self, other) -> "Polynomial":
+        return divmod(self, other)[0]
+
+    def __mod__(self, other) -> "Polynomial":
+        return divmod(self, other)[1]
+
+    def compose(self, other) -> "Polynomial":
+        """Composition p(q(x)) (Horner's rule over polynomials)"""
+        q = _polynomial(other)
+        result = Polynomial([self.coeffs[-1]])
+        for c in reversed(self.coeffs[:-1]):
+            result = result*q + c
+        return result
+
+    def derivative(self) -> "Polynomial":
+        """Derivative of the polynomial"""
+        return Polynomial([i*c for i, c in enumerate(self.coeffs)][1:] or [0])
+
+    # ----------------------------------------------------------------
+    # Evaluation and conversions
+    # ----------------------------------------------------------------
+
+    def horner_eval(self, x):
+        """Evaluate at x (Horner's rule)"""
+        return horner_eval(self.coeffs, x)
+
+    def eval_many(self, xs, as_ndarray:bool=False):
+        """Evaluate at many points (see "horner_eval_many")"""
+        return horner_eval_many(self.coeffs, xs, as_ndarray)
+
+    def __call__(self, x):
+        """Evaluate at x, or compose with x if it is a Polynomial"""
+        if isinstance(x, Polynomial):
+            return self.compose(x)
+        return horner_eval(self.coeffs, x)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Polynomial):
+            return self.coeffs == other.coeffs
+        if isinstance(other, (int, float, complex)):
+            return self.coeffs == [other]
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"Polynomial({self.coeffs})"
+
+
+def poly_multiply(a:list, b:list, method:str=None) -> list:
+    """Multiplication of Polynomials in Coefficient Representation
+
+    Theta Notation:
+        - "schoolbook" yields "n**2" (quadratic) time complexity;
+        - "karatsuba" yields "n**lg(3)" time complexity;
+        - "fft" and "ntt" yield "n*lg(n)" time complexity;
+        - "kronecker" yields one product of two "n*b" bits integers
+          (b bits per coefficient).
+
+    > Arguments:
+        - a (list): Ordered coefficients of the first polynomial;
+        - b (list): Ordered coefficients of the second polynomial;
+        - method (str): Multiplication method.
+            ---> Options: "schoolbook", "karatsuba", "fft" (floating
+                 point results), "ntt" and "kronecker" (integer
+                 coefficients only, exact results);
+            ---> Defaults to None (integer coefficients: "schoolbook"
+                 for short operands and "kronecker" otherwise; other
+                 coefficients: "schoolbook" for short operands,
+                 "karatsuba" for medium ones and "fft" for long ones).
+
+    > Output:
+        - List with the ordered coefficients of the product.
+    """
+    if not a or not b:
+        return []
+
+    # Select method by size (and exactness of the coefficients)
+    if method is None:
+        size = min(len(a), len(b))
+        if size < _KRONECKER_CUTOFF:
+            method = "schoolbook"
+        elif _isIntegral(a) and _isIntegral(b):
+            method = "kronecker"
+        elif size < _KARATSUBA_CUTOFF:
+            method = "schoolbook"
+        elif size < _FFT_CUTOFF:
+            method = "karatsuba"
+        elif all(isinstance(c, (int, float, complex)) for c in a + b):
+            method = "fft"
+        else:
+            method = "karatsuba"
+
+    # Compute product
+    if method == "schoolbook":
+        return _schoolbook(a, b)
+    elif method == "karatsuba":
+        return _karatsuba(a, b)
+    elif method == "fft":
+        return _fftMultiply(a, b)
+    elif method in ["ntt", "kronecker"]:
+        if not (_isIntegral(a) and _isIntegral(b)):
+            raise ValueError(f"'{method}' requires integer coefficients!\n")
+        if method == "ntt":
+            return _nttMultiply(a, b)
+        return _kroneckerMultiply(a, b)
+    else:
+        raise NotImplementedError(f"Method '{method}' not implemented!\n")
+
+
+def _schoolbook(a:list, b:list) -> list:
+    """Schoolbook product (one shifted, scaled copy of b per term of a)"""
+    c = [0]*(len(a)+len(b)-1)
+    for i, x in enumerate(a):
+        if x:
+            end = i+len(b)
+            c[i:end] = map(add, c[i:end], [x*y for y in b])
+    return c
+
+
+def _karatsuba(a:list, b:list) -> list:
+    """Karatsuba's product (three half-size products per level)
+
+    With a = a0 + x**m a1 and b = b0 + x**m b1:
+        a*b = a0 b0 + x**m ((a0 + a1)(b0 + b1) - a0 b0 - a1 b1)
+              + x**(2m) a1 b1
+    """
+    if min(len(a), len(b)) < _KARATSUBA_CUTOFF:
+        return _schoolbook(a, b)
+
+    m = max(len(a), len(b)) // 2
+    a0, a1, b0, b1 = a[:m], a[m:], b[:m], b[m:]
+
+    # Unbalanced operands: b fits in the lower half of a
+    if not b1:
+        return _shiftedSum(_karatsuba(a0, b), _karatsuba(a1, b), m)
+    if not a1:
+        return _shiftedSum(_karatsuba(a, b0), _karatsuba(a, b1), m)
+
+    # Three half-size products
+    low, high = _karatsuba(a0, b0), _karatsuba(a1, b1)
+    mid = _karatsuba(_addCoeffs(a0, a1), _addCoeffs(b0, b1))
+    mid = list(map(sub, mid, low + [0]*(len(mid)-len(low))))
+    mid = list(map(sub, mid, high + [0]*(len(mid)-len(high))))
+
+    # Combine halves
+    c = [0]*(len(a)+len(b)-1)
+    for shift, part in [(0, low), (m, mid), (2*m, high)]:
+        part = part[:len(c)-shift]
+        c[shift:shift+len(part)] = map(
+            add, c[shift:shift+len(part)], part
+            )
+    return c
+
+
+def _fftMultiply(a:list, b:list) -> list:
+    """Product by FFT convolution (floating point)
+
+    Uses NumPy's real FFT when the "numpy" backend is active and the
+    iterative FFT (CLRS "ITERATIVE-FFT") otherwise.
+    """
+    size = len(a)+len(b)-1
+    n = 1 << (size-1).bit_length()
+
+    # Vectorized transforms
+    if getattr(get_backend(), "name", None) == "numpy" and not any(
+            isinstance(c, complex) for c in a + b):
+        np = numpy_module()
+        fa, fb = np.fft.rfft(a, n), np.fft.rfft(b, n)
+        return np.fft.irfft(fa*fb, n)[:size].tolist()
+
+    # Pure-Python transforms
+    fa = _fft(list(a) + [0]*(n-len(a)))
+    fb = _fft(list(b) + [0]*(n-len(b)))
+    c = _fft([x*y for x, y in zip(fa, fb)], invert=True)
+    if any(isinstance(x, complex) for x in a + b):
+        return [x/n for x in c[:size]]
+    return [(x/n).real for x in c[:size]]
+
+
+def _fft(a:list, invert:bool=False) -> list:
+    """Iterative FFT (bit-reversal permutation plus butterflies)
+
+    > Arguments:
+        - a (list): Coefficients (length is a power of 2);
+        - invert (bool): Use the conjugate roots of unity (the inverse
+          transform, without the 1/n scaling).
+
+    > Output:
+        - List with the (complex) transform of a.
+    """
+    n = len(a)
+    A = _bitReversed(a)
+    sign = 1 if invert else -1
+
+    # Butterflies over blocks of doubling size
+    length = 2
+    while length <= n:
+        half = length // 2
+        w_m = cmath.exp(sign*2j*cmath.pi/length)
+        roots = [w_m**k for k in range(half)]
+        for start in range(0, n, length):
+            for k in range(half):
+                t = roots[k]*A[start+k+half]
+                u = A[start+k]
+                A[start+k], A[start+k+half] = u + t, u - t
+        length *= 2
+    return A
+
+
+def _nttMultiply(a:list, b:list) -> list:
+    """Exact product of integer polynomials with the NTT
+
+    The transform runs modulo a prime p = c*2**k + 1 large enough to
+    hold every coefficient of the product (in absolute value), so the
+    coefficients recovered modulo p are exact.
+    """
+    size = len(a)+len(b)-1
+    n = 1 << (size-1).bit_length()
+
+    # Prime larger than twice the coefficients of the product
+    p, root = _nttPrime(n, (2*_nttBound(a, b)).bit_length() + 1)
+
+    fa = _ntt([x % p for x in a] + [0]*(n-len(a)), p, root)
+    fb = _ntt([x % p for x in b] + [0]*(n-len(b)), p, root)
+    c = _ntt([x*y % p for x, y in zip(fa, fb)], p, pow(root, -1, p))
+
+    # Scale by 1/n and map residues back to signed integers
+    n_inv = pow(n, -1, p)
+    c = [x*n_inv % p for x in c[:size]]
+    return [x - p if x > p // 2 else x for x in c]
+
+
+def _ntt(a:list, p:int, root:int) -> list:
+    """Iterative NTT modulo p ("root" has order len(a) modulo p)"""
+    n = len(a)
+    A = _bitReversed(a)
+
+    # Butterflies over blocks of doubling size
+    length = 2
+    while length <= n:
+        half = length // 2
+        w_m = pow(root, n // length, p)
+        roots = [1]*half
+        for k in range(1, half):
+            roots[k] = roots[k-1]*w_m % p
+        for start in range(0, n, length):
+            for k in range(half):
+                t = roots[k]*A[start+k+half] % p
+                u = A[start+k]
+                A[start+k], A[start+k+half] = (u+t) % p, (u-t) % p
+        length *= 2
+    return A
+
+
+def _kroneckerMultiply(a:list, b:list) -> list:
+    """Exact product of integer polynomials by Kronecker substitution
+
+    Each polynomial is packed into one integer (its value at x = 2**k,
+    with k bits per coefficient, enough for every coefficient of the
+    product), the integers are multiplied by the big-integer product of
+    the interpreter and the product is unpacked.
+    """
+    k = _nttBound(a, b).bit_length() + 2
+    return _unpack(_pack(a, k) * _pack(b, k), k, len(a)+len(b)-1)
+
+
+def _pack(a:list, k:int) -> int:
+    """Value of a at x = 2**k (split in halves to keep shifts short)"""
+    if len(a) == 1:
+        return a[0]
+    m = len(a) // 2
+    return _pack(a[:m], k) + (_pack(a[m:], k) << (k*m))
+
+
+def _unpack(X:int, k:int, size:int) -> list:
+    """Coefficients (|c| < 2**(k-1)) of the value X at x = 2**k"""
+    if size == 1:
+        return [X]
+    m = size // 2
+
+    # Signed value of the lower m coefficients
+    low = X & ((1 << k*m) - 1)
+    if low >> (k*m - 1):
+        low -= 1 << (k*m)
+    return _unpack(low, k, m) + _unpack((X - low) >> (k*m), k, size-m)
+
+
+def _nttBound(a:list, b:list) -> int:
+    """Bound on the absolute value of the coefficients of a*b"""
+    return min(len(a), len(b)) * max(map(abs, a)) * max(map(abs, b))
+
+
+@lru_cache(maxsize=64)
+def _nttPrime(n:int, bits:int) -> tuple:
+    """Prime p = c*n + 1 >= 2**bits and an n-th primitive root of unity
+
+    > Arguments:
+        - n (int): Transform size (a power of 2);
+        - bits (int): Lower bound of the bit length of the prime.
+
+    > Output:
+        - Tuple with the prime and a root of order n modulo p.
+    """
+    c = max(1, (1 << bits) // n)
+    while not _isPrime(c*n + 1):
+        c += 1
+    p = c*n + 1
+
+    # g**c has order n whenever g is a quadratic non-residue modulo p
+    rng = random.Random(p)
+    while True:
+        root = pow(rng.randrange(2, p), c, p)
+        if n == 1 or pow(root, n // 2, p) != 1:
+            return p, root
+
+
+def _isPrime(n:int) -> bool:
+    """Miller-Rabin primality test (deterministic below 3.3e24)"""
+    if n < 2:
+        return False
+    bases = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41]
+    for q in bases:
+        if n % q == 0:
+            return n == q
+
+    d, s = n-1, 0
+    while d % 2 == 0:
+        d, s = d // 2, s + 1
+    for q in bases:
+        x = pow(q, d, n)
+        if x in (1, n-1):
+            continue
+        for _ in range(s-1):
+            x = x*x % n
+            if x == n-1:
+                break
+        else:
+            return False
+    return True
+
+
+def _bitReversed(a:list) -> list:
+    """Copy of a (power of 2 length) in bit-reversed index order"""
+    n = len(a)
+    bits = n.bit_length() - 1
+    return [a[int(f"{i:0{bits}b}"[::-1], 2) if bits else 0] for i in range(n)]
+
+
+def _shiftedSum(low:list, high:list, m:int) -> list:
+    """Coefficients of low + x**m high"""
+    c = low + [0]*max(0, m+len(high)-len(low))
+    c[m:m+len(high)] = map(add, c[m:m+len(high)], high)
+    return c
+
+
+def _addCoeffs(a:list, b:list) -> list:
+    """Coefficients of a + b"""
+    if len(a) < len(b):
+        a, b = b, a
+    return list(map(add, a, b)) + a[len(b):]
+
+
+def _divide(x, y):
+    """x / y, as an integer if the division of integers is exact"""
+    if type(x) is int and type(y) is int and x % y == 0:
+        return x // y
+    return x / y
+
+
+def _isIntegral(a:list) -> bool:
+    """Check whether every coefficient is an integer"""
+    return all(type(c) is int for c in a)
+
+
+def _trim(coeffs:list) -> list:
+    """Coefficients without trailing zeros (at least one coefficient)"""
+    while len(coeffs) > 1 and not coeffs[-1]:
+        coeffs.pop()
+    return coeffs or [0]
+
+
+def _coeffs(p) -> list:
+    """Coefficients of a Polynomial or of a constant"""
+    return p.coeffs if isinstance(p, Polynomial) else [p]
+
+
+def _polynomial(p) -> Polynomial:
+    """Polynomial of a Polynomial or of a constant"""
+    return p if isinstance(p, Polynomial) else Polynomial([p])
+
+
+if __name__ == "__main__":
+
+    # Declare polynomials and present results for example purposes
+    p = Polynomial([-2310, 727, 382, -72, -8, 1])
+    q = Polynomial([-3, 1])
+    print("\n>> Polynomial Example:")
+    print(f"\np: {p}\nq: {q}")
+    print(f"  > p + q: {p + q}")
+    print(f"  > p * q: {p * q}")
+    print(f"  > divmod(p, q): {divmod(p, q)}")
+    print(f"  > p(q(x)): {p(q)}")
+    print(f"  > p(3): {p(3)}\n")
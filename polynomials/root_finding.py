@@ -0,0 +1,188 @@
+"""
+Batched Newton and Halley Root Finding for Polynomials
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-18
+
+Implements Newton's and Halley's iterations for the roots of a
+polynomial from many starting points at once. Values and derivatives
+come from a single Horner pass per iteration ("horner_derivatives")
+and, with the "numpy" backend active (see "linear_algebra.backends"),
+every active starting point is updated by the same vectorized step
+
+"""
+
+# Standard library imports
+from collections import namedtuple
+
+# Local application imports
+from linear_algebra.backends import get_backend, is_ndarray, numpy_module
+from polynomials.horner_rule_polys import horner_derivatives
+
+
+# Results of a root search
+#   - roots (list): Last iterate of each starting point;
+#   - converged (list): Whether each iterate met the tolerance;
+#   - iterations (list): Iterations run for each starting point.
+RootResults = namedtuple("RootResults", ["roots", "converged", "iterations"])
+
+
+def newton_roots(coeffs, starts, method:str="newton", tol:float=1e-12,
+                 max_iter:int=50, as_ndarray:bool=False) -> RootResults:
+    """Newton's or Halley's Iteration from Many Starting Points
+
+    Theta Notation:
+        - Each iteration yields "n*k" time complexity for k active
+          starting points.
+
+    Steps:
+        - "newton": x <- x - p/p' (quadratic convergence);
+        - "halley": x <- x - 2*p*p'/(2*p'**2 - p*p'') (cubic
+          convergence, one more derivative per step).
+
+    A starting point stops once p(x) == 0 or once its step is below
+    tol*max(1, |x|). Points whose step is undefined (a zero
+    derivative) stop without converging. Complex starting points (or
+    coefficients) search complex roots.
+
+    > Arguments:
+        - coeffs (list): List of ordered coefficients (coeffs[i]
+          multiplies x**i);
+        - starts (list): Starting points (list or ndarray);
+        - method (str): Iteration.
+            ---> Options: "newton", "halley";
+            ---> Defaults to "newton".
+        - tol (float): Relative step tolerance.
+            ---> Defaults to 1e-12.
+        - max_iter (int): Maximum number of iterations per point.
+            ---> Defaults to 50.
+        - as_ndarray (bool): Return ndarrays.
+            ---> Defaults to False.
+
+    > Output:
+        - RootResults with roots, convergence flags and iterations
+          (lists, or ndarrays if asked or if starts is an ndarray).
+    """
+    # Check method
+    if method not in ["newton", "halley"]:
+        raise NotImplementedError(f"Method '{method}' not implemented!\n")
+    k = 1 if method == "newton" else 2
+
+    # Vectorized iteration
+    X = _numericStarts(coeffs, starts)
+    if X is not None:
+        results = _newtonVectorized(coeffs, X, k, tol, max_iter)
+        if as_ndarray or is_ndarray(starts):
+            return results
+        return RootResults(*(R.tolist() for R in results))
+
+    # Pure-Python iteration (one starting point at a time)
+    roots, converged, iterations = [], [], []
+    for x in starts:
+        done, it = False, 0
+        while not done and it < max_iter:
+            it += 1
+            step = _step(horner_derivatives(coeffs, x, k))
+            if step is None:
+                break
+            if step == 0:
+                done = True
+                break
+            x -= step
+            done = abs(step) <= tol*max(1, abs(x))
+        roots.append(x)
+        converged.append(done)
+        iterations.append(it)
+
+    # Return results
+    results = RootResults(roots, converged, iterations)
+    if as_ndarray or is_ndarray(starts):
+        return RootResults(*(numpy_module().array(R) for R in results))
+    return results
+
+
+def _step(d:list):
+    """Newton (2 terms) or Halley (3 terms) step (None if undefined)"""
+    if not d[0]:
+        return 0
+    if len(d) == 2:
+        return d[0] / d[1] if d[1] else None
+    denominator = 2*d[1]*d[1] - d[0]*d[2]
+    return 2*d[0]*d[1] / denominator if denominator else None
+
+
+def _newtonVectorized(coeffs, X, k:int, tol:float,
+                      max_iter:int) -> RootResults:
+    """Newton's or Halley's iteration over an ndarray of starts"""
+    np = numpy_module()
+    X = X.copy()
+    converged = np.zeros(X.shape, dtype=bool)
+    iterations = np.zeros(X.shape, dtype=int)
+    active = np.arange(X.size)
+
+    for _ in range(max_iter):
+        if not active.size:
+            break
+        x = X[active]
+        iterations[active] += 1
+        d = horner_derivatives(coeffs, x, k)
+
+        # Steps of the active points (nan where undefined)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if k == 1:
+                step = d[0] / d[1]
+            else:
+                step = 2*d[0]*d[1] / (2*d[1]*d[1] - d[0]*d[2])
+        step = np.where(d[0] == 0, 0, step)
+
+        # Update, then keep iterating the points that did not stop
+        stalled = ~np.isfinite(step)
+        x = np.where(stalled, x, x - step)
+        X[active] = x
+        done = ~stalled & (np.abs(step) <= tol*np.maximum(1, np.abs(x)))
+        converged[active[done]] = True
+        active = active[~(done | stalled)]
+
+    return RootResults(X, converged, iterations)
+
+
+def _numericStarts(coeffs, starts):
+    """float64/complex128 ndarray of the starts (None for pure Python)"""
+    if getattr(get_backend(), "name", None) != "numpy" or not len(starts):
+        return None
+    np = numpy_module()
+
+    # Types of the coefficients and of the starting points
+    numbers = (int, float, complex)
+    if not all(type(c) in numbers for c in coeffs):
+        return None
+    if is_ndarray(starts):
+        if starts.dtype.kind not in "iufc":
+            return None
+        X = starts
+    else:
+        if not all(type(x) in numbers for x in starts):
+            return None
+        X = np.array(starts)
+
+    # Complex search if any coefficient or start is complex
+    if X.dtype.kind == "c" or any(type(c) is complex for c in coeffs):
+        return X.astype(complex)
+    return X.astype(float)
+
+
+if __name__ == "__main__":
+
+    # Declare a polynomial and starting points for example purposes
+    pol_coeffs = [-2310, 727, 382, -72, -8, 1]
+    starts = [-10.0, -4.0, 1.0, 4.0, 10.0]
+    results = newton_roots(pol_coeffs, starts)
+
+    print("\n>> Newton's Method Example:")
+    print(f"\nPolynomial Coeffs: {pol_coeffs}")
+    print(f"Starting points: {starts}")
+    print(f"  > Newton roots: {results.roots}")
+    print(f"  > Iterations: {results.iterations}")
+    results = newton_roots(pol_coeffs, starts, method="halley")
+    print(f"  > Halley roots: {results.roots}")
+    print(f"  > Iterations: {results.iterations}\n")
@@ -2,84 +2,188 @@
 Array Randomizers
 
 Author: Marcus Moresco Boeno
-Last Update: 2020-10-28
+Last Update: 2026-10-18
 
 Implements functions to randomize the order of array elements as 
 described on Chapter 5 of the book "Introduction to Algorithms" 
-by Thomas H. Cormen et al. (2009)
+by Thomas H. Cormen et al. (2009), with random priorities and indices
+drawn in bulk (including an in-place Fisher-Yates shuffle). Random
+numbers come from the stream given as "rng" (see "random_utils.rng")
 
 """
 
-# Standard library imports
-import random
+# Local application imports
+from linear_algebra.backends import get_backend, is_ndarray, numpy_module
+from random_utils.rng import get_rng
 
 
-def _permute_by_sorting(A:list) -> list:
+def _permute_by_sorting(A:list, rng) -> list:
     """Permute Array Elements by Sorting Random Priorities
 
     Big-O Notation:
         - Permutation by Sorting yields "n*lg(n)" time complexity.
+
+    Priorities are 64-bit random keys drawn in bulk. The indices of A
+    are sorted by their keys (argsort of the keys when the "numpy"
+    backend is active) and A is gathered in that order in one pass.
+    Equal keys (probability below n**2/2**65) are put in random order,
+    so every permutation stays equally likely.
     
     > Arguments:
-        - A (list): Array to be randomly rearranged.
+        - A (list): Array to be randomly rearranged;
+        - rng (RandomStream): Random stream.
     
     > Output:
-        - Rearranged array.
+        - Rearranged array (ndarray if A is an ndarray).
     """
-    # Get random element priorities (takes linear time)
-    P = random.sample(range(len(A)**3), len(A))
-    
-    # Returned array through sorting of zip iterator (takes n*lg(n) time)
-    return [x for _,x in sorted(zip(P, A))]
-
-
-def _randomize_inPlace(A:list) -> list:
+    n = len(A)
+
+    # Vectorized path: argsort of uint64 keys
+    if _hasNumpy() and n:
+        np = numpy_module()
+        keys = rng.numpy().integers(0, 1 << 64, size=n, dtype=np.uint64)
+        order = np.argsort(keys)
+        ordered = keys[order]
+        if (ordered[1:] == ordered[:-1]).any():
+            order = np.array(_shuffleTies(order.tolist(), keys.item, rng))
+        if is_ndarray(A):
+            return A[order]
+        return list(map(A.__getitem__, order.tolist()))
+
+    # Get random element priorities (one bulk draw of 64-bit words)
+    keys = rng.words(n)
+
+    # Sort indices by their priorities (takes n*lg(n) time)
+    order = sorted(range(n), key=keys.__getitem__)
+    if len(set(keys)) < n:
+        order = _shuffleTies(order, keys.__getitem__, rng)
+
+    # Return array gathered in the sorted order
+    if is_ndarray(A):
+        return A[order]
+    return list(map(A.__getitem__, order))
+
+
+def _shuffleTies(order:list, key, rng) -> list:
+    """Shuffle the runs of equal keys of a sorted order of indices"""
+    start = 0
+    for i in range(1, len(order)+1):
+        if i < len(order) and key(order[i]) == key(order[start]):
+            continue
+        for j in range(i-1, start, -1):
+            k = start + rng.randbelow(j-start+1)
+            order[j], order[k] = order[k], order[j]
+        start = i
+    return order
+
+
+def _randomize_inPlace(A:list, rng) -> list:
     """Permute Array Elements without Random Priorities
 
     Big-O Notation:
         - Randomize in Place yields "n" (linear) time complexity.
     
     > Arguments:
-        - A (list): Array to be randomly rearranged.
+        - A (list): Array to be randomly rearranged;
+        - rng (RandomStream): Random stream.
     
     > Output:
         - Rearranged array.
     """
+    # NumPy ndarrays: a copy shuffled by the Generator (A[:] is a view)
+    if is_ndarray(A):
+        return _fisher_yates(A.copy(), rng)
+
     # Create a deep copy of A
     X = A[:]
 
-    # Iterating over array elements
+    # Iterating over array elements (swap with one of the remaining)
     for i in range(len(X)):
-        j = random.randint(0, len(X)-1)
+        j = rng.randint(i, len(X)-1)
         X[i], X[j] = X[j], X[i]
     
     # Return rearranged array
     return X
 
 
-def array_randomize(A:list, method="in_place") -> list:
+def _fisher_yates(A, rng):
+    """Fisher-Yates Shuffle (in place, bulk random draws)
+
+    Theta Notation:
+        - Fisher-Yates shuffle yields "n" (linear) time complexity.
+
+    For i from n-1 down to 1, A[i] is swapped with A[j], j uniform in
+    [0, i]. Indices are drawn in batches by the random stream (see
+    "RandomStream.swap_indices"), either from one "getrandbits" call
+    per batch or from a NumPy Generator when the "numpy" backend is
+    active. NumPy ndarrays are shuffled by the Generator itself, under
+    every backend (swapping rows of a 2-D ndarray through views would
+    duplicate them).
+
+    > Arguments:
+        - A (list): Mutable sequence (list, bytearray, array, writable
+          memoryview or ndarray);
+        - rng (RandomStream): Random stream.
+
+    > Output:
+        - The same sequence, rearranged.
+    """
+    # NumPy ndarrays: shuffled by the Generator (along the first axis)
+    if is_ndarray(A):
+        rng.numpy().shuffle(A)
+        return A
+
+    # Swap each position with a random index drawn from its batch
+    i = len(A) - 1
+    for J in rng.swap_indices(len(A)):
+        for j in J:
+            A[i], A[j] = A[j], A[i]
+            i -= 1
+
+    # Return rearranged array
+    return A
+
+
+def _hasNumpy() -> bool:
+    """Check whether the "numpy" backend is active"""
+    return getattr(get_backend(), "name", None) == "numpy"
+
+
+def array_randomize(A:list, method="in_place", rng=None) -> list:
     """Rearrange Array Elements
 
     Big-O Notation:
         - "permute_sort" yields "n*lg(n)" time complexity;
-        - "in_place" yields "n" (linear) time complexity
+        - "in_place" yields "n" (linear) time complexity;
+        - "fisher_yates" yields "n" (linear) time complexity.
+
+    "permute_sort" and "in_place" return a rearranged copy, while
+    "fisher_yates" rearranges A itself (any mutable sequence).
         
     > Arguments:
         - A (list): Array to be randomly rearranged.
         - method (str): Method to get randomized array.
-            ---> Options: "permute_sort", "in_place".
+            ---> Options: "permute_sort", "in_place", "fisher_yates".
             ---> Defaults to "in_place".
+        - rng: Random stream, seed or None (see "random_utils.rng").
+            ---> Defaults to None (global "random" module).
 
     > Output:
         - Rearranged array.
     """
+    rng = get_rng(rng)
+
     # Permute Array Elements by Sorting Random Priorities
     if method == "permute_sort":
-        return _permute_by_sorting(A)
+        return _permute_by_sorting(A, rng)
     
     # Permute Array Elements without Random Priorities
     elif method == "in_place":
-        return _randomize_inPlace(A)
+        return _randomize_inPlace(A, rng)
+
+    # Permute Array Elements in place (bulk random draws)
+    elif method == "fisher_yates":
+        return _fisher_yates(A, rng)
         
     # Method not implemented
     else:
@@ -98,4 +202,7 @@ if __name__ == "__main__":
     print(f"\n   > Permute by Sorting: {array_randomize(A, 'permute_sort')}")
     
     # Permute Array Elements without Random Priorities
-    print(f"   > Randomize in Place: {array_randomize(A, 'in_place')}\n")
+    print(f"   > Randomize in Place: {array_randomize(A, 'in_place')}")
+
+    # Permute Array Elements in place with bulk random draws
+    print(f"   > Fisher-Yates: {array_randomize(A[:], 'fisher_yates')}\n")
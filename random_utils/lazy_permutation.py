@@ -0,0 +1,198 @@
+"""
+Lazy Random Permutations
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-18
+
+Implements a random permutation of range(n) that is never materialized:
+a keyed Feistel network is a bijection on the integers of 2*h bits
+(4**h >= n) and cycle-walking (applying it again while the result is
+out of range) restricts it to a bijection on [0, n). Elements, inverse
+lookups and iteration take constant memory, so ranges too large to
+shuffle (e.g. range(10**10)) can be visited in random order and the
+visit can be split into shards for parallel workers
+
+"""
+
+# Local application imports
+from linear_algebra.backends import get_backend, numpy_module
+from random_utils.rng import get_rng
+
+
+# Rounds of the Feistel network
+_ROUNDS = 6
+
+# Elements computed per vectorized batch of the iteration
+_CHUNK = 4096
+
+# Constants of the round function (SplitMix64 finalizer)
+_MASK64 = (1 << 64) - 1
+_MIX1 = 0xBF58476D1CE4E5B9
+_MIX2 = 0x94D049BB133111EB
+
+
+class LazyPermutation:
+    """Random Permutation of range(n) with Constant Memory
+
+    perm[i] is the i-th element of the permutation and perm.index(x)
+    the position of x, both with an expected number of Feistel
+    evaluations below 4 (cycle-walking over a domain smaller than 4*n).
+    Iterating (or iterating a shard) evaluates batches of positions
+    with NumPy when the "numpy" backend is active and n <= 2**64.
+
+    > Attributes:
+        - n (int): Size of the permuted range.
+    """
+
+    __slots__ = ("n", "_half", "_mask", "_keys")
+
+    def __init__(self, n:int, seed=None):
+        """Keyed Permutation
+
+        > Arguments:
+            - n (int): Size of the permuted range;
+            - seed: Random stream, seed or None of the round keys (see
+              "random_utils.rng"), equal seeds give equal permutations.
+                ---> Defaults to None (global "random" module).
+        """
+        if n < 0:
+            raise ValueError(f"Size of the range (n = {n}) is negative!\n")
+        self.n = n
+
+        # Halves of h bits, with 2*h bits covering n-1
+        self._half = max(1, ((n-1).bit_length() + 1) // 2)
+        self._mask = (1 << self._half) - 1
+
+        # Round keys
+        rng = get_rng(seed)
+        self._keys = tuple(rng.getrandbits(64) for _ in range(_ROUNDS))
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __getitem__(self, i:int) -> int:
+        if i < 0:
+            i += self.n
+        if not 0 <= i < self.n:
+            raise IndexError("Permutation index out of range!\n")
+        x = self._encrypt(i)
+        while x >= self.n:
+            x = self._encrypt(x)
+        return x
+
+    def index(self, x:int) -> int:
+        """Position of x in the Permutation (inverse lookup)
+
+        > Arguments:
+            - x (int): Element of range(n).
+
+        > Output:
+            - i such that perm[i] == x.
+        """
+        if not 0 <= x < self.n:
+            raise ValueError(f"{x} is not in the permutation!\n")
+        i = self._decrypt(x)
+        while i >= self.n:
+            i = self._decrypt(i)
+        return i
+
+    def __contains__(self, x) -> bool:
+        return type(x) is int and 0 <= x < self.n
+
+    def __iter__(self):
+        return self.shard(0, 1)
+
+    def shard(self, k:int, shards:int):
+        """Iterate one Shard of the Permutation
+
+        The shards split the positions into contiguous blocks, so
+        together they visit every element exactly once and each worker
+        only needs (k, shards) and the seed of the permutation.
+
+        > Arguments:
+            - k (int): Index of the shard (0 <= k < shards);
+            - shards (int): Number of shards.
+
+        > Output:
+            - Generator of perm[i] for the positions of shard k.
+        """
+        if not 0 <= k < shards:
+            raise ValueError(f"Shard {k} is not in [0, {shards})!\n")
+        start, stop = k*self.n // shards, (k+1)*self.n // shards
+
+        # Scalar path (also for halves beyond 32 bits, which would wrap
+        # around in uint64 arithmetic)
+        if (getattr(get_backend(), "name", None) != "numpy"
+                or 2*self._half > 64):
+            for i in range(start, stop):
+                yield self[i]
+            return
+
+        # Vectorized path (one batch of positions at a time)
+        np = numpy_module()
+        for first in range(start, stop, _CHUNK):
+            X = np.arange(first, min(first+_CHUNK, stop), dtype=np.uint64)
+            yield from self._encryptMany(X).tolist()
+
+    def _round(self, x:int, key:int) -> int:
+        """Round function (SplitMix64 finalizer of x + key)"""
+        z = (x + key) & _MASK64
+        z = ((z ^ (z >> 30)) * _MIX1) & _MASK64
+        z = ((z ^ (z >> 27)) * _MIX2) & _MASK64
+        return (z ^ (z >> 31)) & self._mask
+
+    def _encrypt(self, x:int) -> int:
+        """One pass of the Feistel network"""
+        left, right = x >> self._half, x & self._mask
+        for key in self._keys:
+            left, right = right, left ^ self._round(right, key)
+        return (left << self._half) | right
+
+    def _decrypt(self, x:int) -> int:
+        """One pass of the inverse Feistel network"""
+        left, right = x >> self._half, x & self._mask
+        for key in reversed(self._keys):
+            left, right = right ^ self._round(left, key), left
+        return (left << self._half) | right
+
+    def _encryptMany(self, X):
+        """Permutation of an ndarray of positions (cycle-walking, uint64
+        arithmetic, so halves of at most 32 bits)"""
+        np = numpy_module()
+        half, mask = np.uint64(self._half), np.uint64(self._mask)
+        s30, s27, s31 = np.uint64(30), np.uint64(27), np.uint64(31)
+        mix1, mix2 = np.uint64(_MIX1), np.uint64(_MIX2)
+        keys = [np.uint64(key) for key in self._keys]
+
+        # Walk the elements out of range until all of them are in
+        pending = np.arange(X.size)
+        while pending.size:
+            x = X[pending]
+            left, right = x >> half, x & mask
+            for key in keys:
+                z = right + key
+                z = (z ^ (z >> s30)) * mix1
+                z = (z ^ (z >> s27)) * mix2
+                left, right = right, left ^ ((z ^ (z >> s31)) & mask)
+            X[pending] = (left << half) | right
+            pending = pending[X[pending] >= self.n]
+        return X
+
+    def __repr__(self) -> str:
+        return f"LazyPermutation(n={self.n})"
+
+
+if __name__ == "__main__":
+
+    # Declare permutations and present results for example purposes
+    perm = LazyPermutation(10, seed=2026)
+    print("\n>> Lazy Permutation Examples:")
+    print(f"\nPermutation of range(10): {list(perm)}")
+    print(f"   > perm[3] = {perm[3]}, perm.index({perm[3]}) = "
+          f"{perm.index(perm[3])}")
+    print(f"   > Shards: {[list(perm.shard(k, 3)) for k in range(3)]}")
+
+    # Huge range (never materialized)
+    huge = LazyPermutation(10**10, seed=2026)
+    print(f"\nFirst elements of a permutation of range(10**10): "
+          f"{[huge[i] for i in range(5)]}\n")
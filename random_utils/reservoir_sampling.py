@@ -0,0 +1,190 @@
+"""
+Reservoir Sampling of Streams
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-18
+
+Implements functions that draw k elements from a stream of unknown
+length in a single pass and O(k) memory:
+    - "reservoir_sample": uniform sample, with Li's Algorithm L (which
+      draws how many elements to skip instead of one random number per
+      element);
+    - "weighted_reservoir_sample": sample without replacement with
+      probabilities proportional to weights, with Efraimidis and
+      Spirakis' A-ExpJ (exponential jumps over the cumulative weight)
+
+Skipped elements are consumed by "itertools.islice" (uniform sampling)
+or in chunks whose cumulative weights are searched with "bisect"
+(weighted sampling), so they cost no Python-level work per element.
+Random numbers come from the stream given as "rng" (see
+"random_utils.rng")
+
+"""
+
+# Standard library imports
+import heapq
+from bisect import bisect_right
+from itertools import accumulate, islice
+from math import exp, floor, log, log1p
+
+# Local application imports
+from random_utils.rng import get_rng
+
+
+# Elements per chunk of the weighted sampler
+_CHUNK = 4096
+
+
+def reservoir_sample(iterable, k:int, rng=None) -> list:
+    """Uniform Reservoir Sampling (Algorithm L)
+
+    Theta Notation:
+        - Algorithm L yields "n" time complexity (one pass over the
+          stream), with "k*(1 + lg(n/k))" random draws.
+
+    The reservoir holds the first k elements, then the number of
+    elements skipped before the next replacement is drawn from its
+    geometric distribution, so each element of the stream ends up in
+    the sample with probability k/n.
+
+    > Arguments:
+        - iterable (iterable): Stream of elements (any iterable);
+        - k (int): Sample size;
+        - rng: Random stream, seed or None (see "random_utils.rng").
+            ---> Defaults to None (global "random" module).
+
+    > Output:
+        - List with k elements of the stream (every element if the
+          stream has fewer than k).
+    """
+    rng = get_rng(rng)
+
+    # Check if the sample size is valid
+    if k < 0:
+        raise ValueError(f"Sample size (k = {k}) is negative!\n")
+    if k == 0:
+        return []
+
+    # Fill the reservoir with the first k elements
+    stream = iter(iterable)
+    reservoir = list(islice(stream, k))
+    if len(reservoir) < k:
+        return reservoir
+
+    # Skip a geometric number of elements, replace a random element
+    W = exp(_logUniform(rng)/k)
+    end = object()
+    while True:
+        skip = floor(_logUniform(rng) / log1p(-W))
+        x = next(islice(stream, skip, None), end)
+        if x is end:
+            return reservoir
+        reservoir[rng.randbelow(k)] = x
+        W *= exp(_logUniform(rng)/k)
+
+
+def weighted_reservoir_sample(iterable, k:int, weight=None,
+                              rng=None) -> list:
+    """Weighted Reservoir Sampling (A-ExpJ)
+
+    Theta Notation:
+        - A-ExpJ yields "n + k*lg(k)*lg(n/k)" time complexity, with
+          "k*lg(n/k)" random draws.
+
+    Each element gets a key u**(1/w) (u uniform in (0, 1), w its
+    weight) and the k largest keys form the sample. Instead of one key
+    per element, the weight to skip before the next replacement is
+    drawn from the smallest key of the reservoir. Keys are kept as
+    logarithms, so tiny keys do not underflow.
+
+    > Arguments:
+        - iterable (iterable): Stream of (element, weight) pairs, or of
+          elements if "weight" is given;
+        - k (int): Sample size;
+        - weight (function): Weight of an element (nonnegative).
+            ---> Defaults to None (elements are (element, weight)
+                 pairs);
+        - rng: Random stream, seed or None (see "random_utils.rng").
+            ---> Defaults to None (global "random" module).
+
+    > Output:
+        - List with k elements of the stream, from the largest key
+          (every element of positive weight if the stream has fewer).
+    """
+    rng = get_rng(rng)
+
+    # Check if the sample size is valid
+    if k < 0:
+        raise ValueError(f"Sample size (k = {k}) is negative!\n")
+    if k == 0:
+        return []
+
+    # Stream of (element, weight) pairs
+    stream = iter(iterable)
+    if weight is not None:
+        stream = ((x, weight(x)) for x in stream)
+
+    # Fill the reservoir (min-heap of (log key, index, element)) with
+    # the first k elements of positive weight
+    heap, index = [], 0
+    for x, w in stream:
+        if w > 0:
+            heap.append((_logUniform(rng)/w, index, x))
+            if len(heap) == k:
+                break
+        elif w < 0:
+            raise ValueError(f"Weight (w = {w}) is negative!\n")
+        index += 1
+    heapq.heapify(heap)
+
+    # Jump over the cumulative weight of each chunk
+    jump = _logUniform(rng) / heap[0][0] if len(heap) == k else None
+    while jump is not None:
+        chunk = list(islice(stream, _CHUNK))
+        if not chunk:
+            break
+        weights = [w for _, w in chunk]
+        if min(weights) < 0:
+            raise ValueError(f"Weight (w = {min(weights)}) is negative!\n")
+        totals = list(accumulate(weights))
+
+        # Replace the smallest key for each jump ending in the chunk
+        start, base = 0, 0.0
+        while True:
+            i = bisect_right(totals, base + jump, lo=start)
+            if i == len(chunk):
+                jump -= totals[-1] - base
+                break
+            x, w = chunk[i]
+            t = exp(heap[0][0] * w)
+            key = log(t + (1 - t)*exp(_logUniform(rng))) / w
+            heapq.heapreplace(heap, (key, index + i, x))
+            jump = _logUniform(rng) / heap[0][0]
+            start, base = i + 1, totals[i]
+        index += len(chunk)
+
+    # Return sample (largest keys first)
+    return [x for _, _, x in sorted(heap, reverse=True)]
+
+
+def _logUniform(rng) -> float:
+    """Logarithm of a uniform number in (0, 1) drawn from a stream"""
+    u = rng.random()
+    while u == 0:
+        u = rng.random()
+    return log(u)
+
+
+if __name__ == "__main__":
+
+    # Declare a stream and draw samples for example purposes
+    k = 5
+    print("\n>> Reservoir Sampling Examples:")
+    print(f"\nStream: range(1000000), k = {k}")
+
+    # Uniform sample
+    print(f"\n   > Uniform: {reservoir_sample(range(1000000), k)}")
+
+    # Weighted sample (weight of x is x, so larger elements are favored)
+    sample = weighted_reservoir_sample(range(1000000), k, weight=float)
+    print(f"   > Weighted (w = x): {sample}\n")
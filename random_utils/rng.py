@@ -0,0 +1,209 @@
+"""
+Random Number Streams for Randomized Algorithms
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-18
+
+Implements a random stream provider for the randomized algorithms of
+the repository ("quick_sort", "array_randomize", ...). A stream wraps a
+Mersenne Twister generator and offers:
+    - seeding per call ("default_rng(seed)"), instead of the state of
+      the global "random" module;
+    - independent child streams for parallel workers ("spawn"), seeded
+      by hashing the entropy of the parent and the index of the child;
+    - bulk draws: 64-bit words and swap indices of shuffles are drawn
+      in batches, from one "getrandbits" call per batch (or one NumPy
+      Generator call when the "numpy" backend is active).
+
+Functions accept an "rng" argument resolved by "get_rng": None keeps
+the global "random" module (so "random.seed" reproduces its results),
+a seed creates a new stream and a stream is used as is
+
+"""
+
+# Standard library imports
+import hashlib
+import random
+from array import array
+
+# Local application imports
+from linear_algebra.backends import get_backend, numpy_module
+
+
+# Bounded integers drawn per batch of swap indices
+_CHUNK = 4096
+
+# 64-bit words drawn per "getrandbits" call by bulk draws
+_WORDS = 1 << 16
+
+# Mask of the low 64 bits of a product
+_MASK64 = (1 << 64) - 1
+
+
+class RandomStream:
+    """Random Stream with Bulk Draws
+
+    Single draws call the underlying generator directly (its C
+    implementation beats any Python-level buffer), bulk draws take one
+    "getrandbits" call (or one NumPy call) per batch.
+
+    > Attributes:
+        - source: Underlying generator (a "random.Random" instance, or
+          the "random" module for the global stream).
+    """
+
+    __slots__ = ("source",)
+
+    def __init__(self, source=None):
+        self.source = random.Random() if source is None else source
+
+    def random(self) -> float:
+        """Uniform float in [0, 1)"""
+        return self.source.random()
+
+    def getrandbits(self, k:int) -> int:
+        """Integer with k random bits"""
+        return self.source.getrandbits(k)
+
+    def randbelow(self, n:int) -> int:
+        """Uniform integer in [0, n)"""
+        return self.source.randrange(n)
+
+    def randint(self, a:int, b:int) -> int:
+        """Uniform integer in [a, b]"""
+        return a + self.source.randrange(b - a + 1)
+
+    def words(self, size:int) -> array:
+        """Array of "size" uniform 64-bit words (bulk draw)"""
+        words, getrandbits = array("Q"), self.source.getrandbits
+        for start in range(0, size, _WORDS):
+            words.extend(_words(getrandbits, min(_WORDS, size-start)))
+        return words
+
+    def sample(self, population, k:int) -> list:
+        """k distinct elements of the population"""
+        return self.source.sample(population, k)
+
+    def swap_indices(self, n:int):
+        """Batches of Swap Indices of a Fisher-Yates Shuffle
+
+        > Arguments:
+            - n (int): Size of the shuffled sequence.
+
+        > Output:
+            - Generator of lists, uniform j in [0, i] for i = n-1 down
+              to 1 (in batches of at most 4096 indices).
+        """
+        # NumPy Generator (bounded integers with array upper bounds)
+        if getattr(get_backend(), "name", None) == "numpy":
+            np, generator = numpy_module(), self.numpy()
+            for top in range(n, 1, -_CHUNK):
+                bounds = np.arange(top, max(top-_CHUNK, 1), -1)
+                yield generator.integers(0, bounds).tolist()
+            return
+
+        # 64-bit words from one "getrandbits" call per batch (Lemire's
+        # method: j is the high word of w*(i+1), rejected if the low
+        # word is below 2**64 mod (i+1))
+        getrandbits = self.source.getrandbits
+        for top in range(n, 1, -_CHUNK):
+            J, bound = [], top
+            for w in _words(getrandbits, min(_CHUNK, top-1)):
+                m = w*bound
+                if m & _MASK64 < bound:
+                    threshold = (1 << 64) % bound
+                    while m & _MASK64 < threshold:
+                        m = getrandbits(64)*bound
+                J.append(m >> 64)
+                bound -= 1
+            yield J
+
+    def spawn(self, n:int) -> list:
+        """Independent Child Streams (one per parallel worker)
+
+        Children are seeded with BLAKE2b digests of 128 bits drawn
+        from this stream and of their index, so a seeded parent always
+        spawns the same children and no two children share a seed.
+
+        > Arguments:
+            - n (int): Number of child streams.
+
+        > Output:
+            - List of n RandomStream.
+        """
+        entropy = self.source.getrandbits(128).to_bytes(16, "little")
+        return [
+            RandomStream(random.Random(int.from_bytes(hashlib.blake2b(
+                entropy + i.to_bytes(8, "little"), digest_size=32
+                ).digest(), "little")))
+            for i in range(n)
+            ]
+
+    def numpy(self):
+        """NumPy Generator seeded from this stream"""
+        return numpy_module().random.default_rng(self.source.getrandbits(128))
+
+    def __repr__(self) -> str:
+        if self.source is random:
+            return "RandomStream(global)"
+        return f"RandomStream({type(self.source).__name__})"
+
+
+# Stream of the global "random" module
+_GLOBAL = RandomStream(random)
+
+
+def default_rng(seed=None) -> RandomStream:
+    """New Random Stream
+
+    > Arguments:
+        - seed (int): Seed of the stream (any "random.seed" value).
+            ---> Defaults to None (seeded from the operating system).
+
+    > Output:
+        - RandomStream.
+    """
+    return RandomStream(random.Random(seed))
+
+
+def get_rng(rng=None) -> RandomStream:
+    """Resolve the "rng" Argument of a Randomized Algorithm
+
+    > Arguments:
+        - rng: None (global "random" module), a seed (new stream), a
+          "random.Random" instance (wrapped) or a RandomStream.
+            ---> Defaults to None.
+
+    > Output:
+        - RandomStream.
+    """
+    if rng is None:
+        return _GLOBAL
+    if isinstance(rng, RandomStream):
+        return rng
+    if isinstance(rng, random.Random):
+        return RandomStream(rng)
+    return default_rng(rng)
+
+
+def _words(getrandbits, size:int) -> array:
+    """Array of "size" random 64-bit words (one "getrandbits" call)"""
+    words = array("Q")
+    words.frombytes(getrandbits(64*size).to_bytes(8*size, "little"))
+    return words
+
+
+if __name__ == "__main__":
+
+    # Declare seeded streams and draw numbers for example purposes
+    rng = default_rng(2026)
+    print("\n>> Random Stream Examples:")
+    print(f"\nStream: {rng}")
+    print(f"   > Integers in [1, 6]: {[rng.randint(1, 6) for _ in range(10)]}")
+    print(f"   > Swap indices (n = 8): {list(rng.swap_indices(8))[0]}")
+
+    # Child streams of parallel workers
+    workers = default_rng(2026).spawn(3)
+    for i, stream in enumerate(workers):
+        print(f"   > Worker {i}: {[stream.randbelow(100) for _ in range(5)]}")
+    print()
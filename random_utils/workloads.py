@@ -0,0 +1,428 @@
+"""
+Workload Generators for Benchmarks
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-18
+
+Implements reproducible generators of large inputs shared by the sort,
+search, matrix and polynomial benchmarks. Every generator is seeded
+(equal seeds give equal data) and streams its output in chunks, so
+inputs larger than the memory can be written straight to disk (and
+sequence files read back chunk by chunk or memory-mapped):
+    - integer sequences ("uniform", "sorted", "reversed",
+      "nearly_sorted", "few_unique", "organ_pipe", "zipf", "sawtooth")
+      as lists, typed arrays, ndarrays or sequence files;
+    - random matrices of a given shape and density, as nested lists,
+      Matrix, CSRMatrix or matrix files (see "linear_algebra.matrix_file");
+    - random polynomial coefficients
+
+"""
+
+# Standard library imports
+import mmap
+import struct
+from array import array
+from itertools import accumulate
+from math import floor, log, log1p
+
+# Local application imports
+from linear_algebra.backends import numpy_module
+from linear_algebra.matrix import Matrix
+from linear_algebra.matrix_file import close_matrix, create_matrix
+from linear_algebra.sparse_matrix import CSRMatrix
+from random_utils.rng import default_rng
+
+
+# Kinds of integer sequences
+SEQUENCE_KINDS = (
+    "uniform", "sorted", "reversed", "nearly_sorted", "few_unique",
+    "organ_pipe", "zipf", "sawtooth"
+    )
+
+# Elements per chunk of the streams
+_CHUNK = 1 << 16
+
+# Sequence file header (magic, version, typecode, length)
+_HEADER = struct.Struct("<6sBcQ")
+_MAGIC = b"ALGSEQ"
+_VERSION = 1
+
+
+def stream_sequence(kind:str, n:int, seed:int=0, chunk:int=_CHUNK,
+                    **options):
+    """Stream an Integer Sequence in Chunks
+
+    Kinds (and options):
+        - "uniform": uniform integers in [0, high) (high = n);
+        - "sorted", "reversed": 0, ..., n-1 and n-1, ..., 0;
+        - "nearly_sorted": 0, ..., n-1 with a fraction of the elements
+          swapped with a close neighbor (fraction = 0.01, window = 16);
+        - "few_unique": uniform integers in [0, unique) (unique = 16);
+        - "organ_pipe": 0, 1, ..., n/2 and back down to 0;
+        - "zipf": ranks in [1, unique] with probability proportional
+          to 1/rank**s (unique = 1000, s = 1.1);
+        - "sawtooth": ramps 0, ..., period-1 (period = 1000).
+
+    > Arguments:
+        - kind (str): Kind of sequence (see "SEQUENCE_KINDS");
+        - n (int): Length of the sequence;
+        - seed (int): Seed of the random elements.
+            ---> Defaults to 0.
+        - chunk (int): Elements per chunk.
+            ---> Defaults to 65536.
+        - options: Parameters of the kind (see above).
+
+    > Output:
+        - Generator of lists of integers (n elements in total).
+    """
+    if kind not in SEQUENCE_KINDS:
+        raise NotImplementedError(f"Method '{kind}' not implemented!\n")
+    if n < 0:
+        raise ValueError(f"Length of the sequence (n = {n}) is negative!\n")
+    rng = default_rng(seed)
+
+    # Bounded integers from bulk 64-bit words (bias below bound/2**64)
+    def integers(bound, size):
+        return [w*bound >> 64 for w in rng.words(size)]
+
+    # Zipf cumulative weights (shared by the chunks)
+    if kind == "zipf":
+        s = options.get("s", 1.1)
+        ranks = range(1, options.get("unique", 1000)+1)
+        cum_weights = list(accumulate(1 / k**s for k in ranks))
+
+    for start in range(0, n, chunk):
+        stop = min(start+chunk, n)
+        size = stop - start
+
+        if kind == "uniform":
+            yield integers(options.get("high", n), size)
+        elif kind == "sorted":
+            yield list(range(start, stop))
+        elif kind == "reversed":
+            yield list(range(n-1-start, n-1-stop, -1))
+        elif kind == "nearly_sorted":
+            values = list(range(start, stop))
+            window = options.get("window", 16)
+            for _ in range(round(options.get("fraction", 0.01)*size/2)):
+                i = rng.randbelow(size)
+                j = min(size-1, i + 1 + rng.randbelow(window))
+                values[i], values[j] = values[j], values[i]
+            yield values
+        elif kind == "few_unique":
+            yield integers(options.get("unique", 16), size)
+        elif kind == "organ_pipe":
+            yield [min(i, n-1-i) for i in range(start, stop)]
+        elif kind == "zipf":
+            yield rng.source.choices(ranks, cum_weights=cum_weights, k=size)
+        else:
+            period = options.get("period", 1000)
+            yield [i % period for i in range(start, stop)]
+
+
+def generate_sequence(kind:str, n:int, seed:int=0, output:str="list",
+                      path:str=None, **options):
+    """Integer Sequence in a Given Output Format
+
+    > Arguments:
+        - kind (str): Kind of sequence (see "stream_sequence");
+        - n (int): Length of the sequence;
+        - seed (int): Seed of the random elements.
+            ---> Defaults to 0.
+        - output (str): Output format.
+            ---> Options: "list", "array" (array("q")), "ndarray",
+                 "file" (sequence file written chunk by chunk);
+            ---> Defaults to "list".
+        - path (str): Output file path (for "file").
+            ---> Defaults to None.
+        - options: Parameters of the kind (see "stream_sequence").
+
+    > Output:
+        - Sequence (or the path of the sequence file).
+    """
+    chunks = stream_sequence(kind, n, seed, **options)
+
+    if output == "list":
+        return [x for values in chunks for x in values]
+    elif output == "array":
+        values = array("q")
+        for chunk in chunks:
+            values.extend(chunk)
+        return values
+    elif output == "ndarray":
+        return numpy_module().array(generate_sequence(kind, n, seed, "array",
+                                                **options))
+    elif output == "file":
+        if path is None:
+            raise ValueError("Output path of the sequence file missing!\n")
+        with open(path, "wb") as file:
+            write_sequence_file(file, n, chunks)
+        return path
+    else:
+        raise NotImplementedError(f"Method '{output}' not implemented!\n")
+
+
+def load_sequence(path:str) -> array:
+    """Read a Sequence File
+
+    > Arguments:
+        - path (str): Sequence file path.
+
+    > Output:
+        - array("q") with the elements of the sequence.
+    """
+    with open(path, "rb") as file:
+        typecode, n = _readHeader(file, path)
+        values = array(typecode)
+        values.fromfile(file, n)
+    return values
+
+
+def write_sequence_file(file, n:int, chunks, typecode:str="q") -> None:
+    """Write a Sequence File from Chunks of Elements
+
+    > Arguments:
+        - file (file): Binary file object open for writing;
+        - n (int): Length of the sequence (elements in the chunks);
+        - chunks (iterable): Lists (or arrays) of elements;
+        - typecode (str): Element type.
+            ---> Options: "q" (int64), "d" (float64);
+            ---> Defaults to "q".
+    """
+    if typecode not in ["d", "q"]:
+        raise ValueError(f"Invalid typecode '{typecode}'!\n")
+    file.write(_HEADER.pack(_MAGIC, _VERSION, typecode.encode(), n))
+    for chunk in chunks:
+        file.write(array(typecode, chunk).tobytes())
+
+
+def stream_sequence_file(file, chunk:int=_CHUNK):
+    """Stream the Elements of a Sequence File in Chunks
+
+    > Arguments:
+        - file (file): Binary file object (e.g. a pipe) positioned at
+          the header of a sequence file;
+        - chunk (int): Elements per chunk.
+            ---> Defaults to 65536.
+
+    > Output:
+        - Generator of arrays (n elements in total).
+    """
+    typecode, n = _readHeader(file, getattr(file, "name", "<stream>"))
+    itemsize = array(typecode).itemsize
+    while n > 0:
+        data = file.read(min(chunk, n)*itemsize)
+        if not data:
+            raise ValueError("Sequence file ended before its length!\n")
+        values = array(typecode)
+        values.frombytes(data[:len(data) - len(data) % itemsize])
+        n -= len(values)
+        yield values
+
+
+def open_sequence(path:str) -> memoryview:
+    """Memory-Map a Sequence File
+
+    > Arguments:
+        - path (str): Sequence file path.
+
+    > Output:
+        - Typed read-only memoryview over the mapped elements (the
+          elements are read from the file on demand).
+    """
+    with open(path, "rb") as file:
+        typecode, n = _readHeader(file, path)
+        if n == 0:
+            return memoryview(array(typecode))
+        size = _HEADER.size + array(typecode).itemsize*n
+        buffer = mmap.mmap(file.fileno(), size, access=mmap.ACCESS_READ)
+    return memoryview(buffer)[_HEADER.size:].cast(typecode)
+
+
+def close_sequence(A:memoryview) -> None:
+    """Unmap a Sequence Returned by "open_sequence"
+
+    A (and its views) must not be used afterwards.
+    """
+    buffer = A.obj
+    A.release()
+    if isinstance(buffer, mmap.mmap) and not buffer.closed:
+        buffer.close()
+
+
+def _readHeader(file, name:str) -> tuple:
+    """Typecode and length of the header of a sequence file"""
+    header = file.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        raise ValueError(f"'{name}' is not a sequence file!\n")
+    magic, version, typecode, n = _HEADER.unpack(header)
+    if magic != _MAGIC or version != _VERSION:
+        raise ValueError(f"'{name}' is not a sequence file!\n")
+    return typecode.decode(), n
+
+
+def stream_matrix_rows(rows:int, cols:int, density:float=1.0, seed:int=0,
+                       typecode:str="d", low=None, high=None):
+    """Stream the Nonzeros of a Random Matrix Row by Row
+
+    Each element is nonzero with probability "density" (the columns
+    of the nonzeros are drawn as geometric gaps, so a row costs its
+    number of nonzeros rather than its length).
+
+    > Arguments:
+        - rows (int), cols (int): Matrix shape;
+        - density (float): Fraction of nonzero elements (0 to 1).
+            ---> Defaults to 1.0.
+        - seed (int): Seed of the elements.
+            ---> Defaults to 0.
+        - typecode (str): Element type.
+            ---> Options: "d" (uniform floats in [low, high)), "q"
+                 (uniform integers in [low, high]);
+            ---> Defaults to "d".
+        - low, high: Range of the values.
+            ---> Defaults to None (-1 and 1 for "d", -9 and 9 for "q").
+
+    > Output:
+        - Generator with, for each row, a list of (column, value)
+          pairs sorted by column.
+    """
+    if not 0 <= density <= 1:
+        raise ValueError(f"Density (density = {density}) not in [0, 1]!\n")
+    if typecode not in ["d", "q"]:
+        raise ValueError(f"Invalid typecode '{typecode}'!\n")
+    # Default range of the element type
+    if low is None:
+        low = -1.0 if typecode == "d" else -9
+    if high is None:
+        high = 1.0 if typecode == "d" else 9
+    if low == high == 0:
+        raise ValueError("Range of the values holds zeros only!\n")
+    rng = default_rng(seed)
+
+    # Value generator of the element type
+    if typecode == "d":
+        uniform = rng.source.uniform
+
+        def value():
+            x = uniform(low, high)
+            while not x:
+                x = uniform(low, high)
+            return x
+    else:
+        randint = rng.randint
+
+        def value():
+            x = randint(low, high)
+            while not x:
+                x = randint(low, high)
+            return x
+
+    for _ in range(rows):
+        # Dense rows
+        if density == 1:
+            yield [(j, value()) for j in range(cols)]
+            continue
+
+        # Sparse rows (geometric gaps between nonzero columns)
+        items, j = [], -1
+        while density:
+            j += 1 + floor(log(1 - rng.random()) / log1p(-density))
+            if j >= cols:
+                break
+            items.append((j, value()))
+        yield items
+
+
+def random_matrix(rows:int, cols:int, density:float=1.0, seed:int=0,
+                  typecode:str="d", output:str="list", path:str=None,
+                  low=None, high=None):
+    """Random Matrix in a Given Output Format
+
+    > Arguments:
+        - rows (int), cols (int): Matrix shape;
+        - density (float): Fraction of nonzero elements (0 to 1).
+            ---> Defaults to 1.0.
+        - seed (int): Seed of the elements.
+            ---> Defaults to 0.
+        - typecode (str): Element type ("d" or "q").
+            ---> Defaults to "d".
+        - output (str): Output format.
+            ---> Options: "list" (nested list), "matrix" (Matrix),
+                 "csr" (CSRMatrix), "file" (matrix file written row by
+                 row);
+            ---> Defaults to "list".
+        - path (str): Output file path (for "file").
+            ---> Defaults to None.
+        - low, high: Range of the values (see "stream_matrix_rows").
+            ---> Defaults to None.
+
+    > Output:
+        - Matrix (or the path of the matrix file).
+    """
+    stream = stream_matrix_rows(rows, cols, density, seed, typecode,
+                                low, high)
+    if output == "csr":
+        return CSRMatrix.from_rows(rows, cols, stream, typecode)
+
+    # Dense rows (zeros filled in between the nonzeros)
+    zero = 0.0 if typecode == "d" else 0
+
+    def dense(items):
+        row = [zero]*cols
+        for j, x in items:
+            row[j] = x
+        return row
+
+    if output == "list":
+        return [dense(items) for items in stream]
+    elif output == "matrix":
+        M = Matrix.zeros(rows, cols, typecode)
+        for i, items in enumerate(stream):
+            M.set_row(i, dense(items))
+        return M
+    elif output == "file":
+        if path is None:
+            raise ValueError("Output path of the matrix file missing!\n")
+        M = create_matrix(path, rows, cols, typecode)
+        for i, items in enumerate(stream):
+            M.set_row(i, dense(items))
+        close_matrix(M)
+        return path
+    else:
+        raise NotImplementedError(f"Method '{output}' not implemented!\n")
+
+
+def random_polynomial(degree:int, seed:int=0, typecode:str="d",
+                      low=None, high=None) -> list:
+    """Coefficients of a Random Polynomial
+
+    > Arguments:
+        - degree (int): Degree of the polynomial (the leading
+          coefficient is nonzero);
+        - seed (int): Seed of the coefficients.
+            ---> Defaults to 0.
+        - typecode (str): Coefficient type ("d" or "q").
+            ---> Defaults to "d".
+        - low, high: Range of the coefficients (see
+          "stream_matrix_rows").
+            ---> Defaults to None.
+
+    > Output:
+        - List of ordered coefficients (coeffs[i] multiplies x**i).
+    """
+    if degree < 0:
+        raise ValueError(f"Degree (degree = {degree}) is negative!\n")
+    row = next(stream_matrix_rows(1, degree+1, 1.0, seed, typecode,
+                                  low, high))
+    return [x for _, x in row]
+
+
+if __name__ == "__main__":
+
+    # Declare small workloads for example purposes
+    print("\n>> Workload Examples:\n")
+    for kind in SEQUENCE_KINDS:
+        values = generate_sequence(kind, 12, seed=1, unique=4, period=5)
+        print(f"   > {kind:>13s}: {values}")
+    print(f"\nSparse matrix: {random_matrix(4, 6, 0.25, typecode='q')}")
+    print(f"Polynomial: {random_polynomial(4, typecode='q')}\n")
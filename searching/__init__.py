@@ -0,0 +1,32 @@
+"""
+Searching Algorithms
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-18
+
+Package with the binary search and maximum subarray algorithms of
+Chapter 2 of the book "Introduction to Algorithms" by Thomas H. Cormen
+et al. (2009) (submodules are imported on first access)
+
+"""
+
+# Standard library imports
+import importlib
+
+
+# Submodules of the package
+__all__ = [
+    "binary_search",
+    "maximum_subarray",
+    ]
+
+
+def __getattr__(name:str):
+    """Import a submodule on first access"""
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
@@ -2,7 +2,7 @@
 Merge Sort Algorithm in Python
 
 Author: Marcus Moresco Boeno
-Last Update: 2020-11-09
+Last Update: 2026-10-18
 
 Implements a function that sorts a list of elements using the 
 merge sort algorithm as described on Chapter 2 of the book 
@@ -11,21 +11,17 @@ merge sort algorithm as described on Chapter 2 of the book
 """
 
 
-def merge_sort(A:list) -> list:
-    """Merge sort algorithm
+def _merge_sort(A:list) -> list:
+    """Recursion of the Merge Sort Algorithm (sorts A in place)
 
-    Big-O Notation:
-        - Merge sort yields "n*lg(n)" time complexity.
-    
     > Arguments:
         - A (list): List of numbers to be sorted.
     
     > Output:
-        - (list): Sorted list on ascending order.
+        - (list): A, sorted on ascending order.
     """
-
     # Return the very list if only one element
-    if len(A) == 1:
+    if len(A) <= 1:
         return A
     else:
 
@@ -33,8 +29,8 @@ def merge_sort(A:list) -> list:
         mid = len(A)//2
 
         # Recursively sort the two "main" halves
-        a = merge_sort(A[:mid])
-        b = merge_sort(A[mid:])
+        a = _merge_sort(A[:mid])
+        b = _merge_sort(A[mid:])
 
         # Create empty counters
         i = j = k = 0
@@ -60,6 +56,21 @@ def merge_sort(A:list) -> list:
         return A
 
 
+def merge_sort(A:list) -> list:
+    """Merge sort algorithm
+
+    Big-O Notation:
+        - Merge sort yields "n*lg(n)" time complexity.
+    
+    > Arguments:
+        - A (list): List of numbers to be sorted.
+    
+    > Output:
+        - (list): Sorted list on ascending order.
+    """
+    return _merge_sort(A)
+
+
 if __name__ == "__main__":
 
     # Declare a list, sort it and present results for example purposes
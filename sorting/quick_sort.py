@@ -4,7 +4,7 @@ Quick Sort Algorithm in Python
     - Randomized Approach
 
 Author: Marcus Moresco Boeno
-Last Update: 2020-11-11
+Last Update: 2026-10-18
 
 Implements functions that sort a list of elements using the 
 quick sort algorithm as described on Chapter 7 of the book 
@@ -15,6 +15,9 @@ quick sort algorithm as described on Chapter 7 of the book
 # Standard library imports
 import random
 
+# Local application imports
+from random_utils.rng import get_rng
+
 
 def _partition_quick_sort(A:list, low:int, high:int) -> int:
     """Partioning Subroutine of the Quick Sort Algorithm
@@ -46,7 +49,7 @@ def _partition_quick_sort(A:list, low:int, high:int) -> int:
     return pivot_index
 
 
-def _quick_sort_randomized(A:list, low:int, high:int) -> list:
+def _quick_sort_randomized(A:list, low:int, high:int, rng) -> list:
     """Randomized Quick Sort Algorithm
 
     Big-O Notation:
@@ -57,7 +60,8 @@ def _quick_sort_randomized(A:list, low:int, high:int) -> list:
     > Arguments:
         - A (list): List of numbers to be sorted;
         - low (int): Lower index of the subarray;
-        - high (int): Higher index of the subarray.
+        - high (int): Higher index of the subarray;
+        - rng (RandomStream): Random stream of the pivots.
     
     > Output:
         - No outputs, the function sorts in place.
@@ -66,13 +70,13 @@ def _quick_sort_randomized(A:list, low:int, high:int) -> list:
     if low < high:
 
         # Randomize pivot element and find index
-        random_index = random.randint(low, high)
+        random_index = rng.randint(low, high)
         A[high], A[random_index] = A[random_index], A[high]
         pivot = _partition_quick_sort(A, low, high)
         
         # Recursevely sort elements
-        _quick_sort_randomized(A, low, pivot-1)
-        _quick_sort_randomized(A, pivot+1, high)
+        _quick_sort_randomized(A, low, pivot-1, rng)
+        _quick_sort_randomized(A, pivot+1, high, rng)
 
 
 def _quick_sort_std(A:list, low:int, high:int) -> list:
@@ -102,7 +106,7 @@ def _quick_sort_std(A:list, low:int, high:int) -> list:
         _quick_sort_std(A, pivot+1, high)
 
 
-def quick_sort(A:list, method:str="standard") -> list:
+def quick_sort(A:list, method:str="standard", rng=None) -> list:
     """Quick Sort Algorithm
 
     Big-O Notation:
@@ -122,6 +126,9 @@ def quick_sort(A:list, method:str="standard") -> list:
         - method (str): Algorithm configuration.
             ---> Options: "standard", "randomized"
             ---> Defaults to "standard"
+        - rng: Random stream, seed or None of the "randomized" approach
+          (see "random_utils.rng").
+            ---> Defaults to None (global "random" module)
     
     > Output:
         - (list): Sorted list on ascending order.
@@ -135,7 +142,7 @@ def quick_sort(A:list, method:str="standard") -> list:
     # Randomized Approach
     elif method == "randomized":
         B = A[:]
-        _quick_sort_randomized(B, 0, len(B)-1)
+        _quick_sort_randomized(B, 0, len(B)-1, get_rng(rng))
         return B
 
     # Method not implemented
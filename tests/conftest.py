@@ -0,0 +1,35 @@
+"""
+Shared Fixtures of the Test Suite
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-19
+
+Fixtures selecting the computational backend of a test (restored to
+"auto" afterwards), so vectorized paths are compared with the
+pure-Python reference implementations
+
+"""
+
+# Third party imports
+import pytest
+
+# Local application imports
+from linear_algebra.backends import set_backend
+
+
+@pytest.fixture(params=["python", "numpy"])
+def backend(request):
+    """Run the test under each backend (NumPy skipped if missing)"""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    set_backend(request.param)
+    yield request.param
+    set_backend("auto")
+
+
+@pytest.fixture
+def python_backend():
+    """Run the test under the pure-Python backend"""
+    set_backend("python")
+    yield "python"
+    set_backend("auto")
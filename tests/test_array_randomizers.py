@@ -0,0 +1,100 @@
+"""
+Tests of the Array Randomizers
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-19
+
+Checks that every method returns a permutation of its input (lists and
+ndarrays, under each backend), that seeded streams reproduce their
+results and that all permutations of a small array are drawn, also
+when every priority of the permutation by sorting is tied
+
+"""
+
+# Standard library imports
+import random
+from array import array
+from collections import Counter
+from itertools import permutations
+
+# Third party imports
+import pytest
+
+# Local application imports
+from random_utils.array_randomizers import array_randomize
+from random_utils.rng import RandomStream
+
+_METHODS = ["permute_sort", "in_place", "fisher_yates"]
+
+
+@pytest.mark.parametrize("method", _METHODS)
+def test_permutation_of_input(backend, method):
+    A = list(range(1000))
+    B = array_randomize(A[:], method, rng=7)
+    assert sorted(B) == A
+    assert list(B) != A
+
+
+@pytest.mark.parametrize("method", _METHODS)
+def test_seeded_streams_reproduce(backend, method):
+    A = list(range(200))
+    assert (list(array_randomize(A[:], method, rng=11))
+            == list(array_randomize(A[:], method, rng=11)))
+
+
+@pytest.mark.parametrize("method", _METHODS)
+def test_all_permutations_drawn(backend, method):
+    counts = Counter(
+        tuple(array_randomize([0, 1, 2], method, rng=seed))
+        for seed in range(1200)
+        )
+    assert set(counts) == set(permutations(range(3)))
+    assert min(counts.values()) > 120
+
+
+def test_fisher_yates_shuffles_in_place(backend):
+    A = bytearray(range(256))
+    assert array_randomize(A, "fisher_yates", rng=3) is A
+    assert sorted(A) == list(range(256))
+
+
+@pytest.mark.parametrize("method", _METHODS)
+def test_rows_of_2d_ndarray(python_backend, method):
+    np = pytest.importorskip("numpy")
+    A = np.arange(40).reshape(20, 2)
+    B = array_randomize(A if method == "fisher_yates" else A.copy(),
+                        method, rng=5)
+    assert sorted(map(tuple, B.tolist())) == [(2*i, 2*i+1) for i in range(20)]
+
+
+class _TiedStream(RandomStream):
+    """Random stream whose 64-bit priorities are all equal"""
+
+    __slots__ = ()
+
+    def words(self, size):
+        return array("Q", [7]*size)
+
+    def numpy(self):
+        generator = super().numpy()
+
+        class Tied:
+            def integers(self, low, high, size, dtype):
+                return generator.integers(7, 8, size=size, dtype=dtype)
+        return Tied()
+
+
+def test_permute_sort_ties_stay_uniform(backend):
+    rng = _TiedStream(random.Random(8))
+    counts = Counter(
+        tuple(array_randomize([0, 1, 2], "permute_sort", rng=rng))
+        for _ in range(3000)
+        )
+    assert set(counts) == set(permutations(range(3)))
+    assert min(counts.values()) > 400
+
+
+def test_permute_sort_gathers_once(backend):
+    A = [str(x) for x in range(500)]
+    B = array_randomize(A, "permute_sort", rng=9)
+    assert sorted(B, key=int) == A and B is not A
@@ -0,0 +1,114 @@
+"""
+Tests of the Computational Backends
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-19
+
+Checks that the "numpy" backend gives the results of the pure-Python
+implementation (including integer results beyond int64, which must be
+declined) and the int64 helpers shared by the vectorized paths
+
+"""
+
+# Standard library imports
+import random
+
+# Third party imports
+import pytest
+
+# Local application imports
+from linear_algebra.backends import (
+    fits_int64, get_backend, int_bound, numpy_module, set_backend
+    )
+from linear_algebra.batch_operations import batch_multiply, matvec
+from linear_algebra.matrix import Matrix, infer_typecode
+from linear_algebra.matrix_base_operations import (
+    matrix_add, matrix_multiply, matrix_subtract
+    )
+from polynomials.horner_rule_polys import horner_eval, horner_eval_many
+
+
+def _matrix(rows, cols, seed, high=9):
+    rng = random.Random(seed)
+    return [[rng.randint(-high, high) for _ in range(cols)]
+            for _ in range(rows)]
+
+
+def _reference(A, B):
+    return [[sum(a*b for a, b in zip(row, col)) for col in zip(*B)]
+            for row in A]
+
+
+def test_fits_int64():
+    assert fits_int64((1 << 63) - 1) and fits_int64(-(1 << 63))
+    assert not fits_int64(1 << 63) and not fits_int64(-(1 << 63) - 1)
+
+
+def test_int_bound():
+    np = pytest.importorskip("numpy")
+    assert int_bound(np.array([-7, 3])) == 7
+    assert int_bound(np.array([], dtype="q")) == 0
+    assert isinstance(int_bound(np.array([1 << 62])), int)
+
+
+def test_numpy_module():
+    np = pytest.importorskip("numpy")
+    assert numpy_module() is np
+
+
+def test_infer_typecode():
+    assert infer_typecode([]) == "q"
+    assert infer_typecode([1, -(1 << 63)]) == "q"
+    assert infer_typecode([1, 1 << 63]) == "O"
+    assert infer_typecode([1, 2.5]) == "d"
+
+
+def test_set_backend():
+    set_backend("python")
+    assert get_backend().name == "python"
+    set_backend("auto")
+    with pytest.raises(NotImplementedError):
+        set_backend("missing")
+
+
+def test_matrix_operations(backend):
+    A, B = _matrix(7, 5, 1), _matrix(5, 6, 2)
+    C = _matrix(7, 5, 3)
+    assert matrix_multiply(A, B) == _reference(A, B)
+    assert matrix_add(A, C) == [[a+c for a, c in zip(*r)]
+                                for r in zip(A, C)]
+    assert matrix_subtract(A, C) == [[a-c for a, c in zip(*r)]
+                                     for r in zip(A, C)]
+    assert matrix_multiply(Matrix.from_list(A), B).tolist() == \
+        _reference(A, B)
+
+
+def test_int64_overflow_declined(backend):
+    A = _matrix(4, 4, 4, high=1 << 40)
+    B = _matrix(4, 4, 5, high=1 << 40)
+    assert matrix_multiply(A, B) == _reference(A, B)
+    big = [[1 << 62, 1 << 62]]
+    assert matrix_add(big, big) == [[1 << 63, 1 << 63]]
+
+
+def test_batch_operations(backend):
+    A, x = _matrix(6, 4, 6), [1, -2, 3, 5]
+    assert matvec(A, x) == [sum(a*b for a, b in zip(row, x)) for row in A]
+    As = [_matrix(3, 4, k) for k in range(5)]
+    Bs = [_matrix(4, 2, k+10) for k in range(5)]
+    assert batch_multiply(As, Bs) == [_reference(A, B)
+                                      for A, B in zip(As, Bs)]
+    big = [[1 << 40]*4]
+    assert matvec(big, [1 << 40]*4) == [4 << 80]
+
+
+def test_horner_eval_many(backend):
+    coeffs = [3, -1, 4, 1, -5]
+    xs = list(range(-20, 21))
+    assert horner_eval_many(coeffs, xs) == [horner_eval(coeffs, x)
+                                            for x in xs]
+    big = [1 << 40, 1, 1]
+    assert horner_eval_many(big, [1 << 30]) == [horner_eval(big, 1 << 30)]
+    floats = [0.5, 1.5, -2.0]
+    for y, x in zip(horner_eval_many(floats, [0.1, 2.0]), [0.1, 2.0]):
+        assert y == pytest.approx(horner_eval(floats, x))
@@ -0,0 +1,90 @@
+"""
+Tests of the Batched Matrix-Vector and Matrix-Matrix Products
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-19
+
+Checks batched products against per-item schoolbook products under
+each backend, for nested lists, Matrix and ndarray operands, exact
+elements and empty batches, and the shape checks of a batch
+
+"""
+
+# Standard library imports
+import random
+from fractions import Fraction
+
+# Third party imports
+import pytest
+
+# Local application imports
+from linear_algebra.batch_operations import (
+    batch_multiply, matvec, matvec_many
+    )
+from linear_algebra.matrix import Matrix
+
+
+def _matrix(rows, cols, seed):
+    rng = random.Random(seed)
+    return [[rng.randint(-9, 9) for _ in range(cols)] for _ in range(rows)]
+
+
+def _schoolbook(A, B):
+    return [[sum(A[i][k]*B[k][j] for k in range(len(B)))
+             for j in range(len(B[0]))] for i in range(len(A))]
+
+
+def _apply(A, x):
+    return [sum(a*b for a, b in zip(row, x)) for row in A]
+
+
+def test_matvec_many(backend):
+    A, X = _matrix(5, 4, 1), _matrix(7, 4, 2)
+    expected = [_apply(A, x) for x in X]
+    assert matvec_many(A, X) == expected
+    Y = matvec_many(Matrix.from_list(A), Matrix.from_list(X))
+    assert isinstance(Y, Matrix) and Y.tolist() == expected
+    assert matvec_many(A, []) == []
+    assert matvec(A, X[0]) == expected[0]
+
+
+def test_exact_elements(backend):
+    A = [[Fraction(1, 3), 2], [1 << 70, -1]]
+    X = [[3, Fraction(1, 2)], [1, 1]]
+    assert matvec_many(A, X) == [_apply(A, x) for x in X]
+    assert batch_multiply([A], [A]) == [_schoolbook(A, A)]
+
+
+def test_batch_multiply(backend):
+    As = [_matrix(3, 5, k) for k in range(6)]
+    Bs = [_matrix(5, 2, k + 20) for k in range(6)]
+    expected = [_schoolbook(A, B) for A, B in zip(As, Bs)]
+    assert batch_multiply(As, Bs) == expected
+    C = batch_multiply([Matrix.from_list(A) for A in As], Bs)
+    assert all(isinstance(c, Matrix) for c in C)
+    assert [c.tolist() for c in C] == expected
+    assert batch_multiply([], []) == []
+
+
+def test_ndarray_operands(backend):
+    np = pytest.importorskip("numpy")
+    A, X = _matrix(4, 3, 3), _matrix(5, 3, 4)
+    Y = matvec_many(np.array(A), X)
+    assert Y.shape == (5, 4) and Y.tolist() == [_apply(A, x) for x in X]
+    assert matvec(A, np.array(X[0])).tolist() == _apply(A, X[0])
+    As = np.array([_matrix(2, 3, k) for k in range(4)])
+    C = batch_multiply(As, As.transpose(0, 2, 1))
+    assert C.tolist() == [_schoolbook(A, [list(c) for c in zip(*A)])
+                          for A in As.tolist()]
+    assert batch_multiply([], [], as_ndarray=True).shape == (0, 0, 0)
+
+
+def test_shape_checks():
+    with pytest.raises(ValueError):
+        matvec([[1, 2]], [1, 2, 3])
+    with pytest.raises(ValueError):
+        matvec_many([[1, 2]], [[1, 2], [1]])
+    with pytest.raises(ValueError):
+        batch_multiply([[[1]]], [])
+    with pytest.raises(ValueError):
+        batch_multiply([[[1, 2]], [[1]]], [[[1], [2]], [[1]]])
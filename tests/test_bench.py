@@ -0,0 +1,125 @@
+"""
+Tests of the Benchmark Harness
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-19
+
+Checks the discovery of the cases (variants and claimed complexities),
+that every case with inputs runs on a small size, the exponents of
+claimed complexities and of fitted sweeps, and the baseline comparison
+of the results (also through "python -m bench")
+
+"""
+
+# Standard library imports
+import math
+
+# Third party imports
+import pytest
+
+# Local application imports
+from bench import harness
+from bench.__main__ import main
+from bench.discovery import claimed_exponent, discover
+from bench.harness import (
+    compare, fit_exponent, load_results, run_case, save_results
+    )
+from bench.inputs import inputs_of
+
+
+@pytest.fixture(scope="module")
+def cases():
+    return {case.key: case for case in discover()}
+
+
+def test_discovery(cases):
+    assert {"sorting.quick_sort.quick_sort[standard]",
+            "sorting.quick_sort.quick_sort[randomized]",
+            "linear_algebra.matrix_base_operations.matrix_multiply[strassen]",
+            "series.fibonacci.fibo[squaring]"} <= set(cases)
+    assert cases["sorting.merge_sort.merge_sort"].claimed == '"n*lg(n)"'
+    strassen = cases[
+        "linear_algebra.matrix_base_operations.matrix_multiply[strassen]"
+        ]
+    assert claimed_exponent(strassen.claimed) == pytest.approx(math.log2(7))
+    assert not any(key.rsplit(".", 1)[1].startswith("_") for key in cases)
+
+
+def test_cases_run(cases):
+    for case in cases.values():
+        inputs = inputs_of(case)
+        if inputs is not None:
+            setup, sizes = inputs
+            kwargs = {} if case.method is None else {"method": case.method}
+            setup(case.func, 16, kwargs)()
+            assert sizes == sorted(sizes)
+
+
+@pytest.mark.parametrize("claimed, exponent", [
+    ('"n"', 1.0), ('"n" (linear)', 1.0), ('"n**2" (quadratic)', 2.0),
+    ('"n**3"', 3.0), ('"n*lg(n)"', 1.0), ('"lg(n)"', 0.0),
+    ('"n**lg(7)"', math.log2(7)), ('"2**n"', math.inf),
+    ('"n*k"', None), (None, None),
+    ])
+def test_claimed_exponent(claimed, exponent):
+    if exponent is None:
+        assert claimed_exponent(claimed) is None
+    else:
+        assert claimed_exponent(claimed) == pytest.approx(exponent)
+
+
+def test_fit_exponent():
+    sizes = [10, 100, 1000, 10000]
+    assert fit_exponent(sizes, [1e-6 * n**2 for n in sizes]) \
+        == pytest.approx(2)
+    assert fit_exponent(sizes, [3e-4 * n**0.5 for n in sizes]) \
+        == pytest.approx(0.5)
+    assert fit_exponent([10], [1.0]) is None
+
+
+def _results(seconds):
+    return {"meta": {}, "results": [
+        {"case": case, "sizes": [10, 20], "seconds": list(times)}
+        for case, times in seconds.items()
+        ]}
+
+
+def test_compare():
+    baseline = _results({"a": (1.0, 2.0), "b": (1.0, 2.0), "c": (1, 1)})
+    results = _results({"a": (1.1, 2.2), "b": (1.5, 3.0), "d": (9, 9)})
+    assert compare(results, baseline) == [("b", pytest.approx(1.5))]
+    assert compare(results, baseline, threshold=0.05) == [
+        ("a", pytest.approx(1.1)), ("b", pytest.approx(1.5))
+        ]
+
+
+def test_run_case_and_results_file(tmp_path, cases, monkeypatch):
+    monkeypatch.setattr(harness, "_MIN_TIME", 0)
+    lines = []
+    result = run_case(cases["series.fibonacci.fibo[bottom-up]"],
+                      [8, 16, 32], repeat=1, warmup=0, report=lines.append)
+    assert result["sizes"] == [8, 16, 32] and len(lines) == 3
+    assert result["claimed_exponent"] == 1.0
+    assert all(t > 0 for t in result["seconds"])
+    path = str(tmp_path / "results.json")
+    save_results({"meta": {}, "results": [result]}, path)
+    assert load_results(path)["results"] == [result]
+
+
+def test_main(tmp_path, capsys, monkeypatch, python_backend):
+    monkeypatch.setattr(harness, "_MIN_TIME", 0)
+    assert main(["--list", "--filter", "merge_sort"]) == 0
+    assert capsys.readouterr().out.split("\n")[0] \
+        == 'sorting.merge_sort.merge_sort  ["n*lg(n)"]'
+
+    # Baseline 100 times faster than any run: the gate fails
+    args = ["--quick", "--filter", "fibonacci.fibo[bottom-up]",
+            "--repeat", "1", "--backend", "python"]
+    path = str(tmp_path / "results.json")
+    assert main([*args, "--output", path]) == 0
+    results = load_results(path)
+    for r in results["results"]:
+        r["seconds"] = [t / 100 for t in r["seconds"]]
+    save_results(results, path)
+    assert main([*args, "--baseline", path]) == 1
+    assert "SLOWER series.fibonacci.fibo[bottom-up]" in capsys.readouterr().out
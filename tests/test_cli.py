@@ -0,0 +1,141 @@
+"""
+Tests of the Streaming Command Line Interface
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-19
+
+Runs the "algs" commands on temporary text and binary files (small
+chunks, so the external sort spills and merges several runs) and checks
+their outputs against "sorted", list.index, the standard product and
+the fibonacci numbers, and that memory-mapped inputs are released
+
+"""
+
+# Standard library imports
+import random
+
+# Third party imports
+import pytest
+
+# Local application imports
+from algs import cli
+from linear_algebra.matrix_file import close_matrix, open_matrix, save_matrix
+from random_utils.workloads import open_sequence, write_sequence_file
+from series.fibonacci import fibo
+
+
+def _numbers(n, seed, floats=False):
+    rng = random.Random(seed)
+    return [rng.random() if floats else rng.randint(-50, 50)
+            for _ in range(n)]
+
+
+def _sequenceFile(path, values, typecode="q"):
+    with open(path, "wb") as file:
+        write_sequence_file(file, len(values), [values], typecode)
+    return str(path)
+
+
+@pytest.mark.parametrize("method", ["merge", "quick", "insertion"])
+@pytest.mark.parametrize("floats", [False, True])
+def test_sort_text(tmp_path, capsys, method, floats):
+    A, B = _numbers(300, 1, floats), _numbers(150, 2, floats)
+    (tmp_path / "A.txt").write_text(" ".join(map(repr, A)))
+    (tmp_path / "B.txt").write_text("\n".join(map(repr, B)))
+    assert cli.main(["sort", str(tmp_path / "A.txt"),
+                     str(tmp_path / "B.txt"), "--method", method,
+                     "--chunk", "64"]) == 0
+    assert list(map(cli._number, capsys.readouterr().out.split())) \
+        == sorted(A + B)
+
+
+@pytest.mark.parametrize("chunk", [50, 10**4])
+def test_sort_binary(tmp_path, chunk):
+    A = _numbers(500, 3)
+    source = _sequenceFile(tmp_path / "A.seq", A)
+    assert cli.main(["sort", source, "--format", "binary", "--chunk",
+                     str(chunk), "--output", str(tmp_path / "S.seq")]) == 0
+    S = open_sequence(str(tmp_path / "S.seq"))
+    assert S.tolist() == sorted(A)
+    S.release()
+
+
+def test_search_text(tmp_path, capsys):
+    A = sorted(_numbers(1000, 4))
+    (tmp_path / "A.txt").write_text("\n".join(map(str, A)))
+    keys = [A[0], A[500], A[-1], 1000, -1000]
+    assert cli.main(["search", *map(str, keys), "--input",
+                     str(tmp_path / "A.txt"), "--chunk", "100"]) == 0
+    found = dict(map(int, line.split())
+                 for line in capsys.readouterr().out.splitlines())
+    for key in keys:
+        assert found[key] == (A.index(key) if key in A else -1)
+
+
+def test_search_binary_releases_map(tmp_path, capsys, monkeypatch):
+    A = sorted(_numbers(1000, 5))
+    path = _sequenceFile(tmp_path / "A.seq", A)
+    opened = []
+
+    def recording(path):
+        view = open_sequence(path)
+        opened.append((view, view.obj))
+        return view
+    monkeypatch.setattr(cli, "open_sequence", recording)
+
+    assert cli.main(["search", str(A[700]), "77", "--input", path,
+                     "--format", "binary"]) == 0
+    assert capsys.readouterr().out.splitlines() \
+        == [f"{A[700]} {A.index(A[700])}", "77 -1"]
+    (view, buffer), = opened
+    assert buffer.closed
+    with pytest.raises(ValueError):
+        view.obj
+
+
+@pytest.mark.parametrize("method", ["standard", "strassen"])
+def test_matmul_text(tmp_path, capsys, method):
+    A = [_numbers(6, 10 + i) for i in range(9)]
+    B = [_numbers(5, 20 + i) for i in range(6)]
+    for name, M in (("A", A), ("B", B)):
+        (tmp_path / f"{name}.txt").write_text(
+            "\n".join(" ".join(map(str, row)) for row in M)
+            )
+    assert cli.main(["matmul", str(tmp_path / "A.txt"),
+                     str(tmp_path / "B.txt"), "--method", method,
+                     "--chunk", "4"]) == 0
+    C = [[int(x) for x in line.split()]
+         for line in capsys.readouterr().out.splitlines()]
+    assert C == [[sum(a*b for a, b in zip(row, col)) for col in zip(*B)]
+                 for row in A]
+
+
+def test_matmul_binary(tmp_path, capsys):
+    A = [_numbers(6, 30 + i) for i in range(9)]
+    B = [_numbers(5, 40 + i) for i in range(6)]
+    save_matrix(str(tmp_path / "A.mat"), A, "q")
+    save_matrix(str(tmp_path / "B.mat"), B, "q")
+    args = ["matmul", str(tmp_path / "A.mat"), str(tmp_path / "B.mat"),
+            "--format", "binary", "--chunk", "4"]
+    assert cli.main(args) == 2
+    assert "--output" in capsys.readouterr().err
+    assert cli.main([*args, "--output", str(tmp_path / "C.mat")]) == 0
+    C = open_matrix(str(tmp_path / "C.mat"))
+    assert C.tolist() == [[sum(a*b for a, b in zip(row, col))
+                           for col in zip(*B)] for row in A]
+    close_matrix(C)
+
+
+def test_fibo(tmp_path, capsys):
+    assert cli.main(["fibo", "0", "1", "10", "90"]) == 0
+    assert capsys.readouterr().out.split() \
+        == [str(fibo(n)) for n in (0, 1, 10, 90)]
+    (tmp_path / "n.txt").write_text("5\n6 7\n")
+    assert cli.main(["fibo", "--input", str(tmp_path / "n.txt"),
+                     "--method", "squaring"]) == 0
+    assert capsys.readouterr().out.split() == ["5", "8", "13"]
+
+
+def test_missing_input(tmp_path, capsys):
+    assert cli.main(["sort", str(tmp_path / "missing.txt")]) == 2
+    assert capsys.readouterr().err.startswith("algs sort:")
@@ -0,0 +1,69 @@
+"""
+Tests of the Fused In-Place Matrix Operations
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-19
+
+Checks the fused linear combinations against element-wise references,
+including the types of the results (kernels are cached by the
+coefficients and their types)
+
+"""
+
+# Third party imports
+import pytest
+
+# Local application imports
+from linear_algebra.fused_operations import (
+    matrix_add_into, matrix_axpy, matrix_combine_into, matrix_eval_into,
+    matrix_subtract_into
+    )
+from linear_algebra.matrix import Matrix
+
+
+A = [[1, 2], [3, 4]]
+B = [[5, 6], [7, 8]]
+
+
+def _zeros():
+    return [[0, 0], [0, 0]]
+
+
+def test_axpy_keeps_coefficient_type():
+    # Integer kernel compiled first must not be reused for floats
+    assert matrix_axpy(2, A, _zeros()) == [[2, 4], [6, 8]]
+    R = matrix_axpy(2.0, A, [[1, 1], [1, 1]])
+    assert R == [[3.0, 5.0], [7.0, 9.0]]
+    assert all(type(x) is float for row in R for x in row)
+
+
+def test_unit_float_coefficients_promote():
+    R = matrix_combine_into(_zeros(), [(1.0, A), (-1.0, B)])
+    assert R == [[-4.0, -4.0], [-4.0, -4.0]]
+    assert all(type(x) is float for row in R for x in row)
+    R = matrix_combine_into(_zeros(), [(True, A), (1, B)])
+    assert R == [[6, 8], [10, 12]]
+
+
+def test_add_and_subtract_into():
+    assert matrix_add_into(_zeros(), A, B, A) == [[7, 10], [13, 16]]
+    assert matrix_subtract_into(_zeros(), B, A) == [[4, 4], [4, 4]]
+    out = Matrix.zeros(2, 2, "q")
+    assert matrix_add_into(out, A, B).tolist() == [[6, 8], [10, 12]]
+
+
+def test_eval_into():
+    R = matrix_eval_into(_zeros(), "a + 2*b - c", a=A, b=B, c=A)
+    assert R == [[10, 12], [14, 16]]
+    R = matrix_eval_into(_zeros(), "2.0*b", b=B)
+    assert all(type(x) is float for row in R for x in row)
+    with pytest.raises(ValueError):
+        matrix_eval_into(_zeros(), "a + d", a=A)
+    with pytest.raises(ValueError):
+        matrix_eval_into(_zeros(), "a b", a=A, b=B)
+
+
+def test_output_as_operand():
+    Y = [[1, 1], [1, 1]]
+    assert matrix_axpy(3, A, Y) is Y
+    assert Y == [[4, 7], [10, 13]]
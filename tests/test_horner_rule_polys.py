@@ -0,0 +1,137 @@
+"""
+Tests of the Polynomial Evaluators
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-19
+
+Checks the multi-point Horner's rule, Estrin's scheme, the compiled
+evaluators and the derivatives against "horner_eval" (of the
+derivative polynomials) and the power sum of the coefficients, under
+each backend, for exact (integer, big integer, Fraction) and float
+coefficients and for ndarray points
+
+"""
+
+# Standard library imports
+import random
+from fractions import Fraction
+
+# Third party imports
+import pytest
+
+# Local application imports
+from polynomials.horner_rule_polys import (
+    compile_poly, estrin_eval, horner_derivatives, horner_eval,
+    horner_eval_many
+    )
+
+
+def _powerSum(coeffs, x):
+    return sum(c * x**i for i, c in enumerate(coeffs))
+
+
+def _coeffs(n, seed):
+    rng = random.Random(seed)
+    return [rng.randint(-20, 20) for _ in range(n)]
+
+
+@pytest.mark.parametrize("n", [1, 2, 3, 8, 17, 64])
+def test_exact_evaluations(backend, n):
+    coeffs, xs = _coeffs(n, n), list(range(-6, 7))
+    expected = [_powerSum(coeffs, x) for x in xs]
+    assert [horner_eval(coeffs, x) for x in xs] == expected
+    assert [estrin_eval(coeffs, x) for x in xs] == expected
+    assert horner_eval_many(coeffs, xs) == expected
+    assert horner_eval_many(coeffs, []) == []
+
+
+def test_beyond_int64(backend):
+    coeffs, xs = _coeffs(30, 1), [-1000, 3, 1 << 40]
+    expected = [_powerSum(coeffs, x) for x in xs]
+    assert horner_eval_many(coeffs, xs) == expected
+    assert [estrin_eval(coeffs, x) for x in xs] == expected
+    fractions = [Fraction(c, 7) for c in coeffs]
+    assert horner_eval_many(fractions, [Fraction(1, 3)]) \
+        == [_powerSum(fractions, Fraction(1, 3))]
+
+
+def test_float_evaluations(backend):
+    rng = random.Random(2)
+    coeffs = [rng.uniform(-1, 1) for _ in range(25)]
+    xs = [rng.uniform(-1.1, 1.1) for _ in range(50)]
+    expected = [_powerSum(coeffs, x) for x in xs]
+    assert horner_eval_many(coeffs, xs) == pytest.approx(expected)
+    assert [estrin_eval(coeffs, x) for x in xs] == pytest.approx(expected)
+    assert horner_eval_many([1, 2], [0.5, 2]) == [2.0, 5]
+
+
+def test_ndarray_points(backend):
+    np = pytest.importorskip("numpy")
+    coeffs = _coeffs(12, 3)
+    xs = np.arange(-5, 6)
+    expected = [_powerSum(coeffs, x) for x in range(-5, 6)]
+    assert horner_eval_many(coeffs, xs).tolist() == expected
+    assert estrin_eval(coeffs, xs).tolist() == expected
+    assert horner_eval_many(coeffs, list(range(-5, 6)),
+                            as_ndarray=True).tolist() == expected
+
+
+@pytest.mark.parametrize("coeffs", [
+    [5], [0], [0, 0, 0], [-2310, 727, 0, 1], [0, 0, 0, 0, 0, 1],
+    [1, -1, 1, -1], [3, 0, 0, 0, 0, -2, 0, 0], [1 << 70, -(1 << 65), 7],
+    ])
+def test_compiled_exact(coeffs):
+    poly = compile_poly(coeffs)
+    for x in [-7, -1, 0, 1, 2, 1 << 20, Fraction(2, 3)]:
+        assert poly(x) == horner_eval(coeffs, x)
+
+
+def test_compiled_special_coefficients():
+    coeffs = [Fraction(1, 3), 0.5, complex(0, 1), -2.0]
+    poly = compile_poly(coeffs)
+    assert poly(3) == pytest.approx(horner_eval(coeffs, 3))
+    nan = compile_poly([float("nan"), 1])(2)
+    assert nan != nan
+    assert compile_poly([float("inf"), 1])(2) == float("inf")
+
+
+def test_compiled_cache():
+    assert compile_poly([1, 2, 3]) is compile_poly((1, 2, 3))
+    ints, floats = compile_poly([1, 2]), compile_poly([1.0, 2.0])
+    assert ints is not floats
+    assert type(ints(3)) is int and type(floats(3)) is float
+
+
+def test_compiled_ndarray():
+    np = pytest.importorskip("numpy")
+    coeffs = _coeffs(9, 4)
+    xs = np.arange(-4, 5)
+    assert compile_poly(coeffs)(xs).tolist() \
+        == [_powerSum(coeffs, x) for x in range(-4, 5)]
+
+
+def _derivative(coeffs):
+    return [i*c for i, c in enumerate(coeffs)][1:] or [0]
+
+
+@pytest.mark.parametrize("n, k", [(1, 0), (1, 2), (4, 1), (6, 3), (9, 12)])
+def test_horner_derivatives(n, k):
+    coeffs = _coeffs(n, n + k)
+    for x in [-3, 0, 2, Fraction(1, 2)]:
+        expected, c = [], coeffs
+        for _ in range(k+1):
+            expected.append(horner_eval(c, x))
+            c = _derivative(c)
+        assert horner_derivatives(coeffs, x, k) == expected
+    with pytest.raises(ValueError):
+        horner_derivatives(coeffs, 1, -1)
+
+
+def test_horner_derivatives_ndarray():
+    np = pytest.importorskip("numpy")
+    coeffs, xs = _coeffs(7, 5), np.arange(-3, 4)
+    d = horner_derivatives(coeffs, xs, 2)
+    assert [D.tolist() for D in d] == [
+        [horner_derivatives(coeffs, x, 2)[j] for x in range(-3, 4)]
+        for j in range(3)
+        ]
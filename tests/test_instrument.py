@@ -0,0 +1,125 @@
+"""
+Tests of the Operation-Count Instrumentation
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-19
+
+Checks that the kernels give the same results inside and outside
+"profile" (and are restored on exit), and that the comparison, swap
+and move counts match reference sorts that count their operations
+
+"""
+
+# Standard library imports
+import random
+
+# Third party imports
+import pytest
+
+# Local application imports
+import sorting.merge_sort
+import sorting.quick_sort
+from bench.instrument import profile
+from series.fibonacci import fibo
+from sorting.merge_sort import merge_sort
+from sorting.quick_sort import quick_sort
+
+
+def _countingMergeSort(A, counts):
+    """Reference merge sort counting comparisons and moves"""
+    if len(A) <= 1:
+        return A
+    a = _countingMergeSort(A[:len(A)//2], counts)
+    b = _countingMergeSort(A[len(A)//2:], counts)
+    merged, j, k = [], 0, 0
+    while j < len(a) and k < len(b):
+        counts["comparisons"] += 1
+        if a[j] <= b[k]:
+            merged.append(a[j])
+            j += 1
+        else:
+            merged.append(b[k])
+            k += 1
+    counts["moves"] += len(A)
+    return merged + a[j:] + b[k:]
+
+
+def _countingQuickSort(A, low, high, counts):
+    """Reference quick sort (Lomuto) counting comparisons and swaps"""
+    if low < high:
+        i = low
+        for j in range(low, high):
+            counts["comparisons"] += 1
+            if A[j] <= A[high]:
+                A[i], A[j] = A[j], A[i]
+                counts["swaps"] += 1
+                i += 1
+        A[i], A[high] = A[high], A[i]
+        counts["swaps"] += 1
+        _countingQuickSort(A, low, i-1, counts)
+        _countingQuickSort(A, i+1, high, counts)
+
+
+def _inputs():
+    rng = random.Random(2026)
+    yield []
+    yield [1]
+    yield list(range(50))
+    yield list(range(50, 0, -1))
+    yield [rng.randint(0, 5) for _ in range(300)]
+    for n in (2, 3, 17, 100, 1000):
+        yield [rng.random() for _ in range(n)]
+
+
+@pytest.mark.parametrize("A", list(_inputs()))
+def test_merge_sort_counts(A):
+    counts = {"comparisons": 0, "moves": 0}
+    expected = _countingMergeSort(A[:], counts)
+    with profile(memory=False) as stats:
+        assert merge_sort(A[:]) == expected
+    assert stats.comparisons == counts["comparisons"]
+    assert stats.moves == counts["moves"]
+    assert stats.calls["merge_sort"] == max(2*len(A) - 1, 1)
+
+
+@pytest.mark.parametrize("A", list(_inputs()))
+def test_quick_sort_counts(A):
+    counts = {"comparisons": 0, "swaps": 0}
+    expected = A[:]
+    _countingQuickSort(expected, 0, len(A)-1, counts)
+    with profile(memory=False) as stats:
+        assert quick_sort(A) == expected
+    assert stats.comparisons == counts["comparisons"]
+    assert stats.swaps == counts["swaps"]
+
+
+def test_same_results_outside_profile():
+    rng = random.Random(1)
+    A = [rng.random() for _ in range(500)]
+    with profile(memory=False):
+        inside = (merge_sort(A[:]), quick_sort(A, "randomized", rng=3),
+                  fibo(20, "recursive"))
+    assert inside == (merge_sort(A[:]), quick_sort(A, "randomized", rng=3),
+                      fibo(20, "recursive"))
+
+
+def test_kernels_restored():
+    originals = (sorting.merge_sort._merge_sort,
+                 sorting.quick_sort._partition_quick_sort)
+    with pytest.raises(RuntimeError):
+        with profile(memory=False):
+            assert sorting.merge_sort._merge_sort is not originals[0]
+            raise RuntimeError
+    assert (sorting.merge_sort._merge_sort,
+            sorting.quick_sort._partition_quick_sort) == originals
+
+
+def test_calls_depth_and_memory():
+    with profile() as stats:
+        fibo(10, "recursive")
+        merge_sort(list(range(64)))
+    assert stats.calls["fibo"] == 177
+    assert stats.depth["fibo"] == 10
+    assert stats.depth["merge_sort"] == 7
+    assert stats.peak_bytes >= 0
+    assert "merge_sort" in stats.report()
@@ -0,0 +1,68 @@
+"""
+Tests of the Lazy Random Permutations
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-19
+
+Checks that the permutation is a bijection on range(n), that shards
+(vectorized or not) give perm[i] for their positions, also for ranges
+beyond 64 bits, and that "index" inverts the permutation
+
+"""
+
+# Standard library imports
+from itertools import islice
+
+# Third party imports
+import pytest
+
+# Local application imports
+from random_utils.lazy_permutation import LazyPermutation
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 3, 17, 1000, 4099])
+def test_bijection(backend, n):
+    perm = LazyPermutation(n, seed=n)
+    assert sorted(perm) == list(range(n))
+    assert len(perm) == n
+
+
+@pytest.mark.parametrize("n", [10, 1000, 10**4 + 7])
+def test_shards_match_elements(backend, n):
+    perm = LazyPermutation(n, seed=1)
+    shards = [list(perm.shard(k, 3)) for k in range(3)]
+    assert sum(shards, []) == [perm[i] for i in range(n)]
+
+
+@pytest.mark.parametrize("n", [2**64 - 5, 2**64, 2**70, 10**30])
+def test_huge_shards_match_elements(backend, n):
+    perm = LazyPermutation(n, seed=2)
+    start = 5*n // 9
+    shard = list(islice(perm.shard(5, 9), 100))
+    assert shard == [perm[i] for i in range(start, start+100)]
+    assert all(0 <= x < n for x in shard)
+
+
+@pytest.mark.parametrize("n", [1000, 2**70])
+def test_index_inverts(n):
+    perm = LazyPermutation(n, seed=3)
+    for i in list(range(50)) + [n - 1, n // 2]:
+        assert perm.index(perm[i]) == i
+    assert perm[-1] == perm[n - 1]
+
+
+def test_seeds():
+    assert list(LazyPermutation(100, 4)) == list(LazyPermutation(100, 4))
+    assert list(LazyPermutation(100, 4)) != list(LazyPermutation(100, 5))
+
+
+def test_invalid_arguments():
+    perm = LazyPermutation(10, seed=6)
+    with pytest.raises(IndexError):
+        perm[10]
+    with pytest.raises(ValueError):
+        perm.index(10)
+    with pytest.raises(ValueError):
+        next(perm.shard(3, 3))
+    with pytest.raises(ValueError):
+        LazyPermutation(-1)
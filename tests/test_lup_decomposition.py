@@ -0,0 +1,104 @@
+"""
+Tests of the LUP Decomposition and Linear Systems Solver
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-19
+
+Checks PA = LU and the determinant exactly (Fraction elements) against
+the schoolbook product and the Laplace expansion, the solutions of
+single and multiple right-hand sides, and the factorization cache
+
+"""
+
+# Standard library imports
+import random
+from fractions import Fraction
+
+# Third party imports
+import pytest
+
+# Local application imports
+from linear_algebra import lup_decomposition as lup
+from linear_algebra.lup_decomposition import (
+    clear_lup_cache, lup_decomposition, solve
+    )
+from linear_algebra.matrix import Matrix
+
+
+def _matrix(n, seed, cols=None):
+    rng = random.Random(seed)
+    return [[Fraction(rng.randint(-9, 9)) for _ in range(cols or n)]
+            for _ in range(n)]
+
+
+def _schoolbook(A, B):
+    return [[sum(A[i][k]*B[k][j] for k in range(len(B)))
+             for j in range(len(B[0]))] for i in range(len(A))]
+
+
+def _laplace(A):
+    """Determinant by cofactor expansion along the first row"""
+    if len(A) == 1:
+        return A[0][0]
+    return sum((-1)**j * A[0][j] * _laplace([row[:j] + row[j+1:]
+                                             for row in A[1:]])
+               for j in range(len(A)))
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_factorization(seed):
+    A = _matrix(1 + seed % 6, seed)
+    if _laplace(A) == 0:
+        pytest.skip("singular matrix")
+    F = lup_decomposition(A)
+    assert _schoolbook(F.P, A) == _schoolbook(F.L, F.U)
+    assert F.determinant() == _laplace(A)
+    assert sorted(F.pi) == list(range(F.n))
+
+
+def test_textbook_example():
+    F = lup_decomposition([[1, 2, 0], [3, 4, 4], [5, 6, 3]])
+    assert F.pi == [2, 0, 1]
+    assert F.solve([3, 7, 8]) == pytest.approx([-1.4, 2.2, 0.6])
+    assert F.determinant() == pytest.approx(10)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_solve(seed):
+    A, X = _matrix(6, seed), _matrix(6, seed+10, cols=3)
+    if _laplace(A) == 0:
+        pytest.skip("singular matrix")
+    B = _schoolbook(A, X)
+    assert solve(A, B) == X
+    assert solve(A, [row[0] for row in B]) == [row[0] for row in X]
+    Y = solve(Matrix.from_list([[float(a) for a in row] for row in A]),
+              Matrix.from_list([[float(b) for b in row] for row in B]))
+    assert isinstance(Y, Matrix) and Y.typecode == "d"
+    for row, expected in zip(Y.tolist(), X):
+        assert row == pytest.approx([float(x) for x in expected])
+
+
+def test_cache(monkeypatch):
+    clear_lup_cache()
+    monkeypatch.setattr(lup, "_CACHE_SIZE", 2)
+    A = [[2, 1], [1, 3]]
+    F = lup_decomposition(A, cache=True)
+    assert lup_decomposition(A, cache=True) is F
+    assert lup_decomposition(A) is not F
+    A[0][0] = 4
+    assert lup_decomposition(A, cache=True) is not F
+    lup_decomposition([[1, 0], [0, 1]], cache=True)
+    assert len(lup._cache) == 2
+    clear_lup_cache()
+    assert not lup._cache
+
+
+def test_invalid_systems():
+    with pytest.raises(ValueError):
+        lup_decomposition([[1, 2, 3], [4, 5, 6]])
+    with pytest.raises(ValueError):
+        lup_decomposition([[1, 2], [2, 4]])
+    with pytest.raises(ValueError):
+        solve([[1, 0], [0, 1]], [1, 2, 3])
+    with pytest.raises(ValueError):
+        solve([[1, 0], [0, 1]], [[1], [2], [3]])
@@ -0,0 +1,94 @@
+"""
+Tests of the Flat Array-Backed Matrix
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-19
+
+Checks the conversions from nested lists (inferred typecodes included),
+element and row access against the nested list, and that submatrix and
+transposed views share the buffer of their matrix
+
+"""
+
+# Third party imports
+import pytest
+
+# Local application imports
+from linear_algebra.matrix import (
+    Matrix, as_matrix, infer_typecode, matrix_shape, promote_typecode
+    )
+
+
+_A = [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12]]
+
+
+def test_from_list():
+    M = Matrix.from_list(_A)
+    assert M.shape == (3, 4) and M.typecode == "q" and M.is_contiguous()
+    assert M.tolist() == _A and M == _A and list(M) == _A
+    assert M[1] == _A[1] and M[-1] == _A[-1]
+    assert M[2, 3] == 12 and M[-1, -2] == 11
+    assert Matrix.from_list([]).shape == (0, 0)
+    with pytest.raises(ValueError):
+        Matrix.from_list([[1, 2], [3]])
+
+
+@pytest.mark.parametrize("values, typecode", [
+    ([1, 2], "q"), ([1, 2.5], "d"), ([1 << 63], "O"), ([-(1 << 63)], "q"),
+    ([1, "a"], "O"), ([], "q"),
+    ])
+def test_infer_typecode(values, typecode):
+    assert infer_typecode(values) == typecode
+
+
+def test_big_integers_kept_exact():
+    M = Matrix.from_list([[1 << 70, 1]])
+    assert M.typecode == "O" and M[0, 0] == 1 << 70
+
+
+def test_views_share_buffer():
+    M = Matrix.from_list(_A)
+    V = M[1:3, 1:3]
+    assert V.tolist() == [[6, 7], [10, 11]] and not V.is_contiguous()
+    V[0, 1] = 70
+    assert M[1, 2] == 70
+    V.set_row(1, [100, 110])
+    assert M.tolist()[2] == [9, 100, 110, 12]
+    assert M[0:1, :].tolist() == [M.row(0)]
+    assert M[:, 2].tolist() == [[x] for x in M.col(2)]
+    with pytest.raises(IndexError):
+        M.view(0, 4, 0, 1)
+    with pytest.raises(ValueError):
+        M[::2, :]
+
+
+def test_transpose():
+    M = Matrix.from_list(_A)
+    T = M.T
+    assert T.tolist() == [list(col) for col in zip(*_A)]
+    assert T.T == _A
+    T[3, 0] = -4
+    assert M[0, 3] == -4
+    assert T[1:3, 0:2].tolist() == [[2, 6], [3, 7]]
+
+
+def test_copy_and_assign():
+    M = Matrix.from_list(_A)
+    C = M[0:2, 0:2].copy("d")
+    assert C.typecode == "d" and C.is_contiguous()
+    assert C.tolist() == [[1.0, 2.0], [5.0, 6.0]]
+    C.assign([[0, 0], [0, 1]])
+    assert M[0, 0] == 1
+    with pytest.raises(ValueError):
+        C.assign(_A)
+    with pytest.raises(ValueError):
+        Matrix([0]*5, 2, 3)
+
+
+def test_helpers():
+    M = Matrix.zeros(2, 3, "q")
+    assert as_matrix(M) is M and as_matrix(_A) == _A
+    assert matrix_shape(_A) == (3, 4) and matrix_shape(M) == (2, 3)
+    assert promote_typecode(M, Matrix.zeros(1, 1)) == "d"
+    assert promote_typecode(M, _A) == "O"
+    assert promote_typecode(M) == "q"
@@ -0,0 +1,93 @@
+"""
+Tests of the Matrix-Chain Multiplication
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-19
+
+Checks the optimal plans against the textbook example and against an
+exhaustive search over every parenthesization, and the chain products
+against left-to-right schoolbook products
+
+"""
+
+# Standard library imports
+import random
+from functools import reduce
+
+# Third party imports
+import pytest
+
+# Local application imports
+from linear_algebra.matrix import Matrix
+from linear_algebra.matrix_chain import (
+    format_chain_order, matrix_chain_multiply, matrix_chain_plan
+    )
+from linear_algebra.sparse_matrix import CSRMatrix
+
+
+def _chain(dims, seed):
+    rng = random.Random(seed)
+    return [[[rng.randint(-3, 3) for _ in range(dims[k+1])]
+             for _ in range(dims[k])] for k in range(len(dims)-1)]
+
+
+def _schoolbook(A, B):
+    return [[sum(A[i][k]*B[k][j] for k in range(len(B)))
+             for j in range(len(B[0]))] for i in range(len(A))]
+
+
+def _exhaustiveCost(dims, i, j):
+    """Minimum cost of Ai..Aj over every parenthesization"""
+    if i == j:
+        return 0
+    return min(_exhaustiveCost(dims, i, k) + _exhaustiveCost(dims, k+1, j)
+               + dims[i]*dims[k+1]*dims[j+1] for k in range(i, j))
+
+
+def _orderCost(order, dims):
+    """Rows, columns and cost of a parenthesization"""
+    if isinstance(order, int):
+        return dims[order], dims[order+1], 0
+    (m, n, left), (_, p, right) = (_orderCost(o, dims) for o in order)
+    return m, p, left + right + m*n*p
+
+
+def test_textbook_example():
+    dims = [30, 35, 15, 5, 10, 20, 25]
+    plan = matrix_chain_plan(*_chain(dims, 0))
+    assert plan.cost == 15125
+    assert format_chain_order(plan.order) == "((A0(A1A2))((A3A4)A5))"
+    assert plan.naive_cost == sum(30*dims[k]*dims[k+1] for k in range(1, 6))
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_optimal_cost(seed):
+    rng = random.Random(seed)
+    dims = [rng.randint(1, 40) for _ in range(rng.randint(2, 8))]
+    plan = matrix_chain_plan(*_chain(dims, seed))
+    assert plan.cost == _exhaustiveCost(dims, 0, len(dims)-2)
+    assert _orderCost(plan.order, dims) == (dims[0], dims[-1], plan.cost)
+    assert plan.cost <= plan.naive_cost
+
+
+@pytest.mark.parametrize("method", ["standard", "blocked", "strassen"])
+def test_chain_products(method):
+    mats = _chain([7, 3, 9, 2, 6, 5], 1)
+    expected = reduce(_schoolbook, mats)
+    assert matrix_chain_multiply(*mats, method=method) == expected
+    flat = matrix_chain_multiply(*map(Matrix.from_list, mats), method=method)
+    assert flat.tolist() == expected
+    assert matrix_chain_multiply(mats[0]) == mats[0]
+
+
+def test_sparse_chain():
+    mats = _chain([5, 4, 6, 3], 2)
+    C = matrix_chain_multiply(CSRMatrix.from_dense(mats[0]), *mats[1:])
+    assert C == reduce(_schoolbook, mats)
+
+
+def test_invalid_chains():
+    with pytest.raises(ValueError):
+        matrix_chain_plan()
+    with pytest.raises(ValueError):
+        matrix_chain_multiply([[1, 2]], [[1, 2]])
@@ -0,0 +1,107 @@
+"""
+Tests of the Memory-Mapped Matrix Files
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-19
+
+Checks the round trip of matrix files and the out-of-core
+multiplication against the standard product, for file, Matrix and
+nested list operands
+
+"""
+
+# Standard library imports
+import random
+
+# Third party imports
+import pytest
+
+# Local application imports
+from linear_algebra import matrix_file
+from linear_algebra.matrix import Matrix
+from linear_algebra.matrix_base_operations import matrix_multiply
+from linear_algebra.matrix_file import (
+    close_matrix, open_matrix, out_of_core_multiply, save_matrix
+    )
+
+
+def _matrix(rows, cols, seed):
+    rng = random.Random(seed)
+    return [[rng.randint(-9, 9) for _ in range(cols)] for _ in range(rows)]
+
+
+def _reference(A, B):
+    return [[sum(a*b for a, b in zip(row, col)) for col in zip(*B)]
+            for row in A]
+
+
+def test_round_trip(tmp_path):
+    A = [[1.5, -2.0], [3.25, 4.0], [0.0, 1.0]]
+    path = str(tmp_path / "A.mat")
+    save_matrix(path, A)
+    M = open_matrix(path)
+    assert M.shape == (3, 2) and M.tolist() == A
+    close_matrix(M)
+    with pytest.raises(ValueError):
+        save_matrix(path, [[1 << 70]], "O")
+
+
+@pytest.mark.parametrize("tile", [1, 3, 64])
+def test_out_of_core_files(tmp_path, tile):
+    A, B = _matrix(7, 5, 1), _matrix(5, 6, 2)
+    save_matrix(str(tmp_path / "A.mat"), A, "q")
+    save_matrix(str(tmp_path / "B.mat"), B, "q")
+    C = out_of_core_multiply(str(tmp_path / "A.mat"),
+                             str(tmp_path / "B.mat"),
+                             str(tmp_path / "C.mat"), tile=tile)
+    assert C.tolist() == _reference(A, B)
+    close_matrix(C)
+
+
+def test_out_of_core_lists_and_matrices(tmp_path):
+    A, B = _matrix(4, 3, 3), _matrix(3, 2, 4)
+    out = str(tmp_path / "C.mat")
+    C = matrix_multiply(A, B, "out_of_core", out=out)
+    assert C.tolist() == _reference(A, B)
+    close_matrix(C)
+    C = out_of_core_multiply(Matrix.from_list(A), [[0.5]*2]*3, out)
+    assert C.typecode == "d"
+    assert C.tolist() == _reference(A, [[0.5]*2]*3)
+    close_matrix(C)
+    with pytest.raises(ValueError):
+        out_of_core_multiply([[1 << 70]], [[1]], out)
+
+
+def _released(M) -> bool:
+    try:
+        M.data.obj
+    except ValueError:
+        return True
+    return False
+
+
+def test_out_of_core_closes_operands(tmp_path, monkeypatch):
+    A = _matrix(3, 3, 5)
+    save_matrix(str(tmp_path / "A.mat"), A, "q")
+    paths = [str(tmp_path / name) for name in ("A.mat", "C.mat")]
+
+    # Record the matrices mapped by the multiplication
+    opened = []
+
+    def recording(path, mode="r"):
+        M = open_matrix(path, mode)
+        opened.append(M)
+        return M
+    monkeypatch.setattr(matrix_file, "open_matrix", recording)
+
+    C = out_of_core_multiply(paths[0], paths[0], paths[1])
+    assert C.tolist() == _reference(A, A)
+    operands = [M for M in opened if M is not C]
+    assert len(operands) == 2 and all(map(_released, operands))
+    close_matrix(C)
+
+    # Operands are closed on errors too
+    opened.clear()
+    with pytest.raises(ValueError):
+        out_of_core_multiply(paths[0], [[1, 2]], paths[1])
+    assert len(opened) == 1 and _released(opened[0])
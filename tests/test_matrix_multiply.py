@@ -0,0 +1,125 @@
+"""
+Tests of the Matrix Multiplication Methods
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-19
+
+Checks every serial method against the schoolbook product, for nested
+lists, Matrix operands and views, rectangular shapes and tile sizes
+that do not divide them, and the leaf cutoffs and single padding of
+Strassen's method
+
+"""
+
+# Standard library imports
+import random
+from fractions import Fraction
+
+# Third party imports
+import pytest
+
+# Local application imports
+from linear_algebra import matrix_base_operations as base
+from linear_algebra.matrix import Matrix
+from linear_algebra.matrix_base_operations import (
+    _cutoffPadding, calibrate_strassen_cutoff, matrix_multiply
+    )
+
+
+_METHODS = ["standard", "blocked", "divide_conquer", "strassen"]
+
+
+def _matrix(rows, cols, seed, high=9):
+    rng = random.Random(seed)
+    return [[rng.randint(-high, high) for _ in range(cols)]
+            for _ in range(rows)]
+
+
+def _schoolbook(A, B):
+    return [[sum(A[i][k]*B[k][j] for k in range(len(B)))
+             for j in range(len(B[0]))] for i in range(len(A))]
+
+
+@pytest.mark.parametrize("method", _METHODS)
+@pytest.mark.parametrize("shape", [(1, 1, 1), (5, 5, 5), (7, 3, 9),
+                                   (16, 16, 16), (33, 20, 17)])
+def test_nested_lists(backend, method, shape):
+    m, n, p = shape
+    A, B = _matrix(m, n, m), _matrix(n, p, p)
+    assert matrix_multiply(A, B, method) == _schoolbook(A, B)
+
+
+@pytest.mark.parametrize("method", _METHODS)
+def test_matrix_operands(python_backend, method):
+    A, B = _matrix(12, 10, 1), _matrix(10, 11, 2)
+    C = matrix_multiply(Matrix.from_list(A), Matrix.from_list(B), method)
+    assert isinstance(C, Matrix) and C.tolist() == _schoolbook(A, B)
+
+    # Views (strided rows) and transposed views as operands
+    X, Y = Matrix.from_list(_matrix(20, 20, 3)), Matrix.from_list(B).T
+    C = matrix_multiply(X[3:15, 5:16], Y, method)
+    assert C.tolist() == _schoolbook(X[3:15, 5:16].tolist(), Y.tolist())
+
+
+@pytest.mark.parametrize("method", _METHODS)
+def test_exact_elements(python_backend, method):
+    A = [[Fraction(i+1, j+2) for j in range(6)] for i in range(5)]
+    B = [[1 << 70, -3], [2, 5], [7, 1], [0, 1], [-1, 1 << 65], [4, 4]]
+    assert matrix_multiply(A, B, method) == _schoolbook(A, B)
+
+
+def test_floats(backend):
+    rng = random.Random(4)
+    A = [[rng.random() for _ in range(9)] for _ in range(8)]
+    B = [[rng.random() for _ in range(7)] for _ in range(9)]
+    for method in _METHODS:
+        C = matrix_multiply(A, B, method)
+        for row, expected in zip(C, _schoolbook(A, B)):
+            assert row == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("tile", [1, 2, 5, 64])
+def test_blocked_tiles(backend, tile):
+    A, B = _matrix(13, 7, 5), _matrix(7, 11, 6)
+    assert matrix_multiply(A, B, "blocked", tile=tile) == _schoolbook(A, B)
+    C = matrix_multiply(Matrix.from_list(A), B, "blocked", tile=tile)
+    assert C.tolist() == _schoolbook(A, B)
+
+
+def test_invalid_arguments(backend):
+    with pytest.raises(ValueError):
+        matrix_multiply([[1, 2]], [[1, 2]])
+    with pytest.raises(ValueError):
+        matrix_multiply([[1]], [[1]], "blocked", tile=0)
+    with pytest.raises(NotImplementedError):
+        matrix_multiply([[1]], [[1]], "missing")
+
+
+@pytest.mark.parametrize("cutoff", [1, 2, 3, 5, 8, 100])
+@pytest.mark.parametrize("shape", [(9, 9, 9), (13, 6, 10), (16, 16, 16)])
+def test_strassen_cutoffs(cutoff, shape):
+    m, n, p = shape
+    A, B = _matrix(m, n, cutoff), _matrix(n, p, cutoff+1)
+    assert matrix_multiply(A, B, "strassen", cutoff=cutoff) \
+        == _schoolbook(A, B)
+    C = matrix_multiply(Matrix.from_list(A, "d"), Matrix.from_list(B, "d"),
+                        "strassen", cutoff=cutoff)
+    assert C.typecode == "d" and C.tolist() == _schoolbook(A, B)
+
+
+@pytest.mark.parametrize("n, cutoff, size", [
+    (9, 4, 12), (16, 4, 16), (17, 4, 24), (100, 32, 100), (3, 8, 3),
+    ])
+def test_strassen_pads_once(n, cutoff, size):
+    X, Y = _cutoffPadding(_matrix(n, n, 1), _matrix(n, 2, 2), cutoff)
+    assert X.shape == Y.shape == (size, size)
+    assert X[:n, :n].tolist() == _matrix(n, n, 1)
+    assert Y[:n, 2:].tolist() == [[0]*(size-2)]*n
+
+
+def test_calibrate_strassen_cutoff(monkeypatch):
+    monkeypatch.setattr(base, "_STRASSEN_CUTOFF", base._STRASSEN_CUTOFF)
+    cutoff = calibrate_strassen_cutoff(32, (4, 8, 16))
+    assert cutoff in (4, 8, 16, 32) and base._STRASSEN_CUTOFF == cutoff
+    with pytest.raises(ValueError):
+        matrix_multiply([[1]], [[1]], "strassen", cutoff=0)
@@ -0,0 +1,110 @@
+"""
+Tests of the Multipoint Evaluation and Interpolation
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-19
+
+Checks multipoint evaluation (Horner's rule and remainder tree methods)
+and interpolation against Horner's rule, for integer, fraction and
+floating point data
+
+"""
+
+# Standard library imports
+import random
+from fractions import Fraction
+
+# Third party imports
+import pytest
+
+# Local application imports
+from polynomials.horner_rule_polys import horner_eval
+from polynomials.multipoint import (
+    _trees, clear_tree_cache, interpolate, multipoint_eval, subproduct_tree
+    )
+from polynomials.polynomial import Polynomial, _schoolbook, poly_multiply
+
+
+def _data(n, seed):
+    rng = random.Random(seed)
+    points = list(dict.fromkeys(rng.randint(-4*n, 4*n) for _ in range(n)))
+    coeffs = [rng.randint(-9, 9) for _ in range(len(points))]
+    return coeffs, points
+
+
+@pytest.mark.parametrize("n", [1, 2, 7, 100, 300])
+def test_evaluation_matches_horner(n):
+    coeffs, points = _data(n, n)
+    expected = [horner_eval(coeffs, x) for x in points]
+    assert multipoint_eval(coeffs, points) == expected
+    assert multipoint_eval(Polynomial(coeffs), points) == expected
+
+    # Remainder tree (Newton inversion above the schoolbook cutoff)
+    assert subproduct_tree(points).evaluate(coeffs) == expected
+    clear_tree_cache()
+    assert multipoint_eval(coeffs, points, "tree") == expected
+    assert tuple(points) in _trees
+
+
+def test_evaluation_of_fractions_and_floats():
+    points = [Fraction(1, 3), Fraction(-5, 2), 4]
+    coeffs = [1, Fraction(2, 7), -3]
+    expected = [horner_eval(coeffs, x) for x in points]
+    assert multipoint_eval(coeffs, points) == expected
+    assert subproduct_tree(points).evaluate(coeffs) == expected
+    assert multipoint_eval(coeffs, points, "tree") == expected
+    floats = [0.25, -1.5, 3.0]
+    for method in ["horner", "tree"]:
+        assert multipoint_eval(coeffs, floats, method) == pytest.approx(
+            [horner_eval(coeffs, x) for x in floats]
+            )
+    assert tuple(floats) not in _trees
+    assert multipoint_eval(coeffs, [], "tree") == []
+    with pytest.raises(NotImplementedError):
+        multipoint_eval(coeffs, points, "missing")
+
+
+@pytest.mark.parametrize("n", [1, 5, 90])
+def test_interpolation_round_trip(n):
+    coeffs, points = _data(n, n+1)
+    values = multipoint_eval(coeffs, points)
+    assert interpolate(points, values) == Polynomial(coeffs)
+
+    # Non-integer interpolants are exact Fractions
+    p = interpolate([0, 2], [0, 1])
+    assert p.coeffs == [0, Fraction(1, 2)]
+
+
+def test_float_interpolation():
+    points, coeffs = [-1.0, 0.5, 2.0, 3.0], [1.0, -2.0, 0.5, 0.25]
+    values = [horner_eval(coeffs, x) for x in points]
+    assert interpolate(points, values).coeffs == pytest.approx(coeffs)
+
+
+def test_invalid_interpolation():
+    with pytest.raises(ValueError):
+        interpolate([1, 2, 1], [0, 0, 0])
+    with pytest.raises(ValueError):
+        interpolate([1, 2], [0])
+    with pytest.raises(ValueError):
+        subproduct_tree([])
+
+
+def test_tree_cache():
+    clear_tree_cache()
+    tree = subproduct_tree([1, 2, 3])
+    assert subproduct_tree((1, 2, 3)) is tree
+    assert tree.root == _schoolbook(_schoolbook([-1, 1], [-2, 1]), [-3, 1])
+    clear_tree_cache()
+    assert subproduct_tree([1, 2, 3]) is not tree
+
+
+def test_default_integer_product_is_kronecker():
+    # Integer operands of 16 or more coefficients use Kronecker
+    # substitution by default: results stay exact integers
+    rng = random.Random(5)
+    a = [rng.randint(-(1 << 90), 1 << 90) for _ in range(40)]
+    b = [rng.randint(-9, 9) for _ in range(16)]
+    product = poly_multiply(a, b)
+    assert product == poly_multiply(a, b, "kronecker") == _schoolbook(a, b)
+    assert all(type(c) is int for c in product)
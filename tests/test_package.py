@@ -0,0 +1,54 @@
+"""
+Tests of the Installable Package
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-19
+
+Checks that "import algs" (and each algorithm package) imports no
+algorithm module up front, and that every exported name resolves to
+the function or class of its module
+
+"""
+
+# Standard library imports
+import importlib
+import subprocess
+import sys
+from pathlib import Path
+
+# Third party imports
+import pytest
+
+# Local application imports
+import algs
+
+
+def test_lazy_import():
+    code = (
+        "import sys, algs, sorting, linear_algebra; "
+        "print(sorted(m for m in sys.modules if m.startswith(("
+        "'sorting.', 'linear_algebra.', 'random_utils', 'bench'))))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True,
+                         text=True, check=True,
+                         cwd=Path(algs.__file__).parents[1]).stdout
+    assert out.strip() == "[]"
+
+
+@pytest.mark.parametrize("name", sorted(algs._EXPORTS))
+def test_exports(name):
+    module = importlib.import_module(algs._EXPORTS[name])
+    assert getattr(algs, name) is getattr(module, name)
+    assert name in dir(algs)
+
+
+def test_packages():
+    for name in algs._PACKAGES:
+        package = getattr(algs, name)
+        assert package is importlib.import_module(name)
+        for submodule in package.__all__:
+            assert getattr(package, submodule).__name__ \
+                == f"{name}.{submodule}"
+    with pytest.raises(AttributeError):
+        algs.missing
+    assert algs.__version__
@@ -0,0 +1,86 @@
+"""
+Tests of the Multi-Process Matrix Multiplication
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-19
+
+Checks the products computed by worker processes over shared memory
+against the schoolbook product (row blocks and Strassen's base
+products, integer and float operands), the shared memory lifetime in a
+fresh process and the rejected inputs
+
+"""
+
+# Standard library imports
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+# Third party imports
+import pytest
+
+# Local application imports
+import linear_algebra
+from linear_algebra.matrix import Matrix
+from linear_algebra.matrix_base_operations import matrix_multiply
+from linear_algebra.parallel_multiply import parallel_multiply
+
+
+def _matrix(rows, cols, seed):
+    rng = random.Random(seed)
+    return [[rng.randint(-9, 9) for _ in range(cols)] for _ in range(rows)]
+
+
+def _schoolbook(A, B):
+    return [[sum(A[i][k]*B[k][j] for k in range(len(B)))
+             for j in range(len(B[0]))] for i in range(len(A))]
+
+
+@pytest.mark.parametrize("method", ["standard", "blocked", "strassen"])
+@pytest.mark.parametrize("workers", [1, 3])
+def test_integer_products(method, workers):
+    A, B = _matrix(19, 12, 1), _matrix(12, 15, 2)
+    C = parallel_multiply(A, B, method, workers, tile=4, cutoff=4)
+    assert C == _schoolbook(A, B)
+    C = matrix_multiply(Matrix.from_list(A), Matrix.from_list(B), method,
+                        tile=4, cutoff=4, workers=workers)
+    assert isinstance(C, Matrix) and C.tolist() == _schoolbook(A, B)
+
+
+@pytest.mark.parametrize("workers", [2, 9])
+def test_fresh_process(workers):
+    # First shared memory blocks of the process (no resource tracker yet)
+    code = (
+        "import random; "
+        "from linear_algebra.parallel_multiply import parallel_multiply; "
+        "rng = random.Random(0); "
+        "A = [[rng.randint(-9, 9) for _ in range(40)] for _ in range(40)]; "
+        f"C = parallel_multiply(A, A, 'strassen', workers={workers}, "
+        "cutoff=8); "
+        "assert C == [[sum(A[i][k]*A[k][j] for k in range(40)) "
+        "for j in range(40)] for i in range(40)]"
+    )
+    run = subprocess.run([sys.executable, "-c", code], capture_output=True,
+                         text=True,
+                         cwd=Path(linear_algebra.__file__).parents[1])
+    assert run.returncode == 0, run.stderr
+    assert run.stderr == ""
+
+
+def test_float_products():
+    rng = random.Random(3)
+    A = [[rng.random() for _ in range(10)] for _ in range(10)]
+    C = matrix_multiply(A, A, "strassen", cutoff=2, parallel=True,
+                        workers=2)
+    for row, expected in zip(C, _schoolbook(A, A)):
+        assert row == pytest.approx(expected)
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        parallel_multiply([[1 << 70]], [[1]])
+    with pytest.raises(ValueError):
+        parallel_multiply([[1]], [[1]], workers=0)
+    with pytest.raises(NotImplementedError):
+        parallel_multiply([[1]], [[1]], "divide_conquer", workers=1)
@@ -0,0 +1,91 @@
+"""
+Tests of the Polynomial Type and Products
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-19
+
+Checks every multiplication method against the schoolbook product and
+the arithmetic of Polynomial against Horner's rule
+
+"""
+
+# Standard library imports
+import random
+
+# Third party imports
+import pytest
+
+# Local application imports
+from polynomials.horner_rule_polys import horner_eval
+from polynomials.polynomial import Polynomial, _schoolbook, poly_multiply
+
+
+def _integers(n, seed, high=1000):
+    rng = random.Random(seed)
+    return [rng.randint(-high, high) for _ in range(n)]
+
+
+@pytest.mark.parametrize("method", [None, "schoolbook", "karatsuba",
+                                    "ntt", "kronecker"])
+@pytest.mark.parametrize("sizes", [(1, 1), (5, 17), (70, 70), (600, 130)])
+def test_exact_products(method, sizes):
+    a, b = _integers(sizes[0], 1), _integers(sizes[1], 2)
+    assert poly_multiply(a, b, method) == _schoolbook(a, b)
+
+
+def test_exact_products_of_large_and_zero_coefficients():
+    a = [0, 1 << 80, 0, -(1 << 70)] * 10
+    b = [3, 0, 0, -5] * 9 + [0, 0]
+    for method in [None, "karatsuba", "ntt", "kronecker"]:
+        assert poly_multiply(a, b, method) == _schoolbook(a, b)
+
+
+@pytest.mark.parametrize("method", [None, "karatsuba", "fft"])
+def test_float_products(method):
+    rng = random.Random(3)
+    a = [rng.uniform(-1, 1) for _ in range(700)]
+    b = [rng.uniform(-1, 1) for _ in range(600)]
+    assert poly_multiply(a, b, method) == pytest.approx(
+        _schoolbook(a, b), abs=1e-9
+        )
+
+
+def test_exact_methods_reject_floats():
+    with pytest.raises(ValueError):
+        poly_multiply([0.5, 1], [1, 1], "ntt")
+    with pytest.raises(NotImplementedError):
+        poly_multiply([1], [1], "toom")
+
+
+def test_power():
+    p = Polynomial([1, -2, 3])
+    q = Polynomial([1])
+    for k in range(6):
+        assert p**k == q
+        q = q*p
+    assert Polynomial([0, 1])**0 == Polynomial([1])
+
+
+def test_power_rejects_invalid_exponents():
+    p = Polynomial([1, 1])
+    with pytest.raises(ValueError):
+        p**-1
+    with pytest.raises(TypeError):
+        p**2.0
+
+
+def test_division():
+    a = Polynomial(_integers(30, 4))
+    b = Polynomial([-3, 0, 1])
+    q, r = divmod(a, b)
+    assert q*b + r == a and r.degree < b.degree
+    with pytest.raises(ZeroDivisionError):
+        divmod(a, Polynomial([0]))
+
+
+def test_evaluation_and_composition():
+    p, q = Polynomial([1, 2, 3]), Polynomial([-1, 0, 2])
+    for x in range(-5, 6):
+        assert p(q)(x) == horner_eval(p.coeffs, horner_eval(q.coeffs, x))
+        assert p.derivative()(x) == 2 + 6*x
+    assert (p - p).degree == -1
@@ -0,0 +1,117 @@
+"""
+Tests of the Reservoir Sampling of Streams
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-19
+
+Checks the samples of both samplers against their distributions
+(inclusion frequency k/n for the uniform one, heavier elements first
+for the weighted one), short and invalid inputs, and that seeded
+streams (or the seeded global "random" module) reproduce the samples
+
+"""
+
+# Standard library imports
+import random
+from collections import Counter
+
+# Third party imports
+import pytest
+
+# Local application imports
+from random_utils.reservoir_sampling import (
+    reservoir_sample, weighted_reservoir_sample
+    )
+from random_utils.rng import default_rng
+
+
+def test_uniform_inclusion_frequency():
+    n, k, trials = 50, 5, 4000
+    counts = Counter()
+    rng = default_rng(1)
+    for _ in range(trials):
+        sample = reservoir_sample(iter(range(n)), k, rng=rng)
+        assert len(set(sample)) == k
+        counts.update(sample)
+    expected = trials*k/n
+    assert all(abs(counts[x] - expected) < 0.25*expected for x in range(n))
+
+
+def test_weighted_inclusion_order():
+    counts = Counter()
+    rng = default_rng(2)
+    for _ in range(3000):
+        counts.update(weighted_reservoir_sample(range(1, 11), 1,
+                                                weight=float, rng=rng))
+    # P(x) = x/55 for a single draw
+    assert all(abs(counts[x] - 3000*x/55) < 60 for x in range(1, 11))
+
+
+def test_weighted_skips_chunks():
+    sample = weighted_reservoir_sample(
+        ((x, 1.0 if x < 10**4 else 0.0) for x in range(3*10**4)), 20, rng=3
+        )
+    assert len(set(sample)) == 20 and max(sample) < 10**4
+
+
+def test_short_streams():
+    assert reservoir_sample(range(3), 5, rng=1) == [0, 1, 2]
+    assert reservoir_sample(range(3), 0) == []
+    assert sorted(weighted_reservoir_sample([(0, 1), (1, 0), (2, 2)], 5,
+                                            rng=1)) == [0, 2]
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        reservoir_sample(range(3), -1)
+    with pytest.raises(ValueError):
+        weighted_reservoir_sample(range(3), -1, weight=float)
+    with pytest.raises(ValueError):
+        weighted_reservoir_sample([(0, 1), (1, -1)], 2)
+    with pytest.raises(ValueError):
+        weighted_reservoir_sample(((x, -1 if x == 5000 else 1)
+                                   for x in range(9000)), 2)
+
+
+def test_seeded_streams_reproduce():
+    stream = range(10**5)
+    assert (reservoir_sample(stream, 10, rng=7)
+            == reservoir_sample(stream, 10, rng=7))
+    assert (weighted_reservoir_sample(stream, 10, float, rng=7)
+            == weighted_reservoir_sample(stream, 10, float, rng=7))
+
+
+def test_global_random_seed_reproduces():
+    random.seed(2026)
+    first = reservoir_sample(range(10**4), 10)
+    random.seed(2026)
+    assert reservoir_sample(range(10**4), 10) == first
+
+
+def test_weighted_pairs_exact_probabilities():
+    weights = [1.0, 2.0, 3.0, 4.0, 10.0]
+    total, trials = sum(weights), 20000
+
+    # P(i in a sample of 2) drawn without replacement
+    expected = [
+        w/total + sum(v/total * w/(total - v)
+                      for j, v in enumerate(weights) if j != i)
+        for i, w in enumerate(weights)
+        ]
+    counts = Counter()
+    rng = default_rng(5)
+    for _ in range(trials):
+        counts.update(weighted_reservoir_sample(enumerate(weights), 2,
+                                                rng=rng))
+    assert all(abs(counts[i]/trials - p) < 0.015
+               for i, p in enumerate(expected))
+
+
+def test_uniform_skips_long_streams():
+    n, k = 10**5, 3
+    counts = Counter()
+    rng = default_rng(6)
+    for _ in range(300):
+        counts.update(x * 10 // n for x in reservoir_sample(range(n), k,
+                                                             rng=rng))
+    assert all(abs(counts[d] - 90) < 35 for d in range(10))
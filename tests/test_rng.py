@@ -0,0 +1,56 @@
+"""
+Tests of the Random Number Streams
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-19
+
+Checks the resolution of the "rng" argument, the bounds and
+uniformity of the bulk draws (swap indices under each backend) and the
+reproducibility and independence of spawned streams
+
+"""
+
+# Standard library imports
+import random
+from collections import Counter
+
+# Local application imports
+from random_utils.rng import RandomStream, default_rng, get_rng
+
+
+def test_get_rng():
+    stream = default_rng(1)
+    assert get_rng(stream) is stream
+    assert get_rng(None).source is random
+    assert isinstance(get_rng(random.Random(1)), RandomStream)
+    assert get_rng(5).randbelow(10**9) == default_rng(5).randbelow(10**9)
+
+
+def test_words():
+    words = default_rng(1).words(70000)
+    assert len(words) == 70000 and len(set(words)) == 70000
+    assert words == default_rng(1).words(70000)
+
+
+def test_swap_indices_bounds(backend):
+    n = 10000
+    indices = [j for J in default_rng(3).swap_indices(n) for j in J]
+    assert len(indices) == n - 1
+    assert all(0 <= j <= i for i, j in zip(range(n-1, 0, -1), indices))
+
+
+def test_swap_indices_uniform(backend):
+    rng = default_rng(4)
+    counts = Counter(
+        j for _ in range(6000) for j in next(rng.swap_indices(4))[:1]
+        )
+    assert set(counts) == {0, 1, 2, 3}
+    assert all(abs(c - 1500) < 150 for c in counts.values())
+
+
+def test_spawn():
+    children = default_rng(9).spawn(4)
+    again = default_rng(9).spawn(4)
+    draws = [child.getrandbits(64) for child in children]
+    assert draws == [child.getrandbits(64) for child in again]
+    assert len(set(draws)) == 4
@@ -0,0 +1,82 @@
+"""
+Tests of the Batched Newton and Halley Root Finding
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-19
+
+Checks the roots found from many starting points (real and complex)
+under each backend, the convergence flags of exact roots and undefined
+steps, and that both backends give the same iterates
+
+"""
+
+# Third party imports
+import pytest
+
+# Local application imports
+from linear_algebra.backends import set_backend
+from polynomials.horner_rule_polys import horner_eval
+from polynomials.root_finding import newton_roots
+
+
+# (x - 1)(x - 2)(x - 3)(x + 4)
+_COEFFS = [-24, 38, -13, -2, 1]
+
+
+@pytest.mark.parametrize("method", ["newton", "halley"])
+def test_real_roots(backend, method):
+    starts = [-5.0, 0.9, 2.1, 3.2, 10.0]
+    results = newton_roots(_COEFFS, starts, method)
+    assert results.roots == pytest.approx([-4, 1, 2, 3, 3])
+    assert all(results.converged)
+    assert all(1 <= it <= 50 for it in results.iterations)
+
+
+def test_halley_converges_faster(backend):
+    starts = [-9.0, 9.0, 0.2]
+    newton = newton_roots(_COEFFS, starts, "newton")
+    halley = newton_roots(_COEFFS, starts, "halley")
+    assert sum(halley.iterations) < sum(newton.iterations)
+
+
+def test_complex_roots(backend):
+    results = newton_roots([1, 0, 1], [1 + 1j, -2 - 0.5j])
+    assert results.roots == pytest.approx([1j, -1j])
+    assert all(results.converged)
+    for x in results.roots:
+        assert abs(horner_eval([1, 0, 1], x)) < 1e-12
+
+
+def test_stopping_rules(backend):
+    results = newton_roots([-1, 0, 1], [1.0, 0.0, 0.5], max_iter=3)
+    assert results.converged == [True, False, False]
+    assert results.iterations == [1, 1, 3]
+    assert newton_roots([-1, 0, 1], [1]).roots == [1]
+
+
+def test_backends_agree():
+    pytest.importorskip("numpy")
+    starts = [-7.5, -1.0, 0.0, 1.9, 2.6, 40.0]
+    try:
+        set_backend("python")
+        python = newton_roots(_COEFFS, starts, "halley")
+        set_backend("numpy")
+        vectorized = newton_roots(_COEFFS, starts, "halley")
+    finally:
+        set_backend("auto")
+    assert vectorized.roots == pytest.approx(python.roots)
+    assert vectorized.converged == python.converged
+    assert vectorized.iterations == python.iterations
+
+
+def test_ndarray_results(backend):
+    np = pytest.importorskip("numpy")
+    results = newton_roots(_COEFFS, np.array([0.9, 3.2]))
+    assert isinstance(results.roots, np.ndarray)
+    assert results.roots.tolist() == pytest.approx([1, 3])
+    assert results.converged.tolist() == [True, True]
+
+
+def test_invalid_method():
+    with pytest.raises(NotImplementedError):
+        newton_roots(_COEFFS, [1.0], "secant")
@@ -0,0 +1,100 @@
+"""
+Tests of the Sparse (CSR) Matrices
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-19
+
+Checks the CSR conversions and COO builder against dense matrices, and
+the sparse products and sums (sparse and mixed operands) against the
+schoolbook product and elementwise sums
+
+"""
+
+# Standard library imports
+import random
+
+# Third party imports
+import pytest
+
+# Local application imports
+from linear_algebra.matrix import Matrix
+from linear_algebra.matrix_base_operations import (
+    matrix_add, matrix_multiply, matrix_subtract
+    )
+from linear_algebra.sparse_matrix import COOBuilder, CSRMatrix
+
+
+def _sparse(rows, cols, seed, density=0.2):
+    rng = random.Random(seed)
+    return [[rng.randint(-9, 9) if rng.random() < density else 0
+             for _ in range(cols)] for _ in range(rows)]
+
+
+def _schoolbook(A, B):
+    return [[sum(A[i][k]*B[k][j] for k in range(len(B)))
+             for j in range(len(B[0]))] for i in range(len(A))]
+
+
+def test_conversions():
+    A = _sparse(8, 11, 1)
+    S = CSRMatrix.from_dense(A)
+    assert S.shape == (8, 11) and S.typecode == "q"
+    assert S.nnz == sum(x != 0 for row in A for x in row)
+    assert S.tolist() == A and S == A
+    assert S.to_matrix("d").tolist() == A
+    assert S.T.tolist() == [list(col) for col in zip(*A)]
+    assert all(S[i, j] == A[i][j] for i in range(8) for j in range(11))
+    assert CSRMatrix.from_dense(Matrix.from_list(A)) == S
+    with pytest.raises(IndexError):
+        S[8, 0]
+    with pytest.raises(ValueError):
+        CSRMatrix(2, 2, [0, 1], [0], [1])
+
+
+def test_coo_builder():
+    builder = COOBuilder(3, 4)
+    builder.extend([(2, 3, 1.5), (0, 1, 2.0), (2, 3, 0.5), (1, 0, 1.0),
+                    (1, 0, -1.0)])
+    assert len(builder) == 5
+    S = builder.to_csr()
+    assert S.tolist() == [[0, 2.0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 2.0]]
+    assert S.nnz == 2
+    with pytest.raises(IndexError):
+        builder.add(3, 0, 1.0)
+
+
+@pytest.mark.parametrize("density", [0.0, 0.1, 0.5, 1.0])
+def test_products(density):
+    A, B = _sparse(9, 7, 2, density), _sparse(7, 10, 3, density)
+    expected = _schoolbook(A, B)
+    SA, SB = CSRMatrix.from_dense(A), CSRMatrix.from_dense(B)
+    C = matrix_multiply(SA, SB)
+    assert isinstance(C, CSRMatrix) and C.tolist() == expected
+    assert C.nnz == sum(x != 0 for row in expected for x in row)
+    assert matrix_multiply(SA, B) == expected
+    assert matrix_multiply(A, SB) == expected
+    assert matrix_multiply(Matrix.from_list(A), SB, "strassen").tolist() \
+        == expected
+
+
+def test_sums():
+    A, B, C = (_sparse(6, 5, seed) for seed in (4, 5, 6))
+    SA, SB, SC = (CSRMatrix.from_dense(X) for X in (A, B, C))
+    total = [[a+b+c for a, b, c in zip(*rows)] for rows in zip(A, B, C)]
+    difference = [[a-b-c for a, b, c in zip(*rows)]
+                  for rows in zip(A, B, C)]
+    assert matrix_add(SA, SB, SC).tolist() == total
+    assert isinstance(matrix_add(SA, SB), CSRMatrix)
+    assert matrix_subtract(SA, SB, SC).tolist() == difference
+    assert matrix_add(SA, B, SC) == total
+    assert matrix_subtract(A, SB, C) == difference
+    assert matrix_subtract(SA, SA).nnz == 0
+
+
+
+def test_ndarray_results():
+    pytest.importorskip("numpy")
+    A, B = _sparse(5, 6, 7), _sparse(6, 4, 8)
+    SA, SB = CSRMatrix.from_dense(A), CSRMatrix.from_dense(B)
+    assert matrix_multiply(SA, SB, as_ndarray=True).tolist() \
+        == _schoolbook(A, B)
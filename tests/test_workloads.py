@@ -0,0 +1,162 @@
+"""
+Tests of the Workload Generators
+
+Author: Marcus Moresco Boeno
+Last Update: 2026-10-19
+
+Checks the shape of each kind of sequence, that equal seeds give equal
+workloads in every output format (lists, arrays, ndarrays, sequence
+and matrix files), the round trips of sequence files, and the density
+and ranges of random matrices and polynomials
+
+"""
+
+# Standard library imports
+import io
+from collections import Counter
+
+# Third party imports
+import pytest
+
+# Local application imports
+from linear_algebra.matrix_file import close_matrix, open_matrix
+from random_utils.workloads import (
+    SEQUENCE_KINDS, close_sequence, generate_sequence, load_sequence,
+    open_sequence, random_matrix, random_polynomial, stream_sequence,
+    stream_sequence_file, write_sequence_file
+    )
+
+
+@pytest.mark.parametrize("kind", SEQUENCE_KINDS)
+def test_sequences_reproducible(kind):
+    A = generate_sequence(kind, 3000, seed=1)
+    assert len(A) == 3000 and all(type(x) is int for x in A)
+    assert generate_sequence(kind, 3000, seed=1) == A
+    assert sum(map(len, stream_sequence(kind, 3000, 1, chunk=1000))) == 3000
+    assert generate_sequence(kind, 0) == []
+
+
+def test_sequence_kinds():
+    n = 2000
+    assert generate_sequence("sorted", n) == list(range(n))
+    assert generate_sequence("reversed", n) == list(range(n))[::-1]
+    assert generate_sequence("sawtooth", n, period=7) \
+        == [i % 7 for i in range(n)]
+    pipe = generate_sequence("organ_pipe", 9)
+    assert pipe == [0, 1, 2, 3, 4, 3, 2, 1, 0]
+
+    uniform = generate_sequence("uniform", n, seed=2, high=50)
+    assert set(uniform) == set(range(50))
+    assert generate_sequence("uniform", n, seed=3) != \
+        generate_sequence("uniform", n, seed=4)
+    assert set(generate_sequence("few_unique", n, 5, unique=4)) \
+        == {0, 1, 2, 3}
+
+    zipf = Counter(generate_sequence("zipf", n, 6, unique=20))
+    assert set(zipf) <= set(range(1, 21))
+    assert zipf.most_common(1)[0][0] == 1
+
+    nearly = generate_sequence("nearly_sorted", n, 7, fraction=0.1,
+                               window=4)
+    assert sorted(nearly) == list(range(n)) and nearly != list(range(n))
+    assert sum(x != i for i, x in enumerate(nearly)) <= 0.1*n
+
+
+def test_invalid_sequences(tmp_path):
+    with pytest.raises(NotImplementedError):
+        generate_sequence("missing", 10)
+    with pytest.raises(ValueError):
+        generate_sequence("sorted", -1)
+    with pytest.raises(ValueError):
+        generate_sequence("sorted", 10, output="file")
+    with pytest.raises(NotImplementedError):
+        generate_sequence("sorted", 10, output="tuple")
+
+
+def test_sequence_outputs(tmp_path):
+    A = generate_sequence("uniform", 5000, seed=8)
+    assert generate_sequence("uniform", 5000, 8, "array").tolist() == A
+    path = generate_sequence("uniform", 5000, 8, "file",
+                             str(tmp_path / "A.seq"))
+    assert load_sequence(path).tolist() == A
+    V = open_sequence(path)
+    assert V.tolist() == A and V[1234] == A[1234]
+    close_sequence(V)
+    with open(path, "rb") as file:
+        chunks = list(stream_sequence_file(file, 999))
+    assert [len(c) for c in chunks] == [999]*5 + [5]
+    assert [x for c in chunks for x in c] == A
+
+
+def test_ndarray_output():
+    pytest.importorskip("numpy")
+    assert generate_sequence("zipf", 500, 9, "ndarray").tolist() \
+        == generate_sequence("zipf", 500, 9)
+
+
+def test_sequence_files(tmp_path):
+    file = io.BytesIO()
+    write_sequence_file(file, 4, [[0.5, 1.5], [2.5, -1.0]], "d")
+    file.seek(0)
+    assert [list(c) for c in stream_sequence_file(file)] \
+        == [[0.5, 1.5, 2.5, -1.0]]
+
+    # Empty, truncated and foreign files
+    (tmp_path / "empty.seq").write_bytes(_sequenceBytes([]))
+    V = open_sequence(str(tmp_path / "empty.seq"))
+    assert len(V) == 0
+    close_sequence(V)
+    with pytest.raises(ValueError):
+        list(stream_sequence_file(io.BytesIO(_sequenceBytes([1, 2])[:-8])))
+    (tmp_path / "text.seq").write_bytes(b"not a sequence file at all")
+    with pytest.raises(ValueError):
+        load_sequence(str(tmp_path / "text.seq"))
+    with pytest.raises(ValueError):
+        write_sequence_file(io.BytesIO(), 1, [[1]], "i")
+
+
+def _sequenceBytes(values):
+    file = io.BytesIO()
+    write_sequence_file(file, len(values), [values])
+    return file.getvalue()
+
+
+@pytest.mark.parametrize("density", [0.0, 0.05, 0.3, 1.0])
+def test_random_matrix(tmp_path, density):
+    A = random_matrix(60, 50, density, seed=10, typecode="q")
+    nonzeros = sum(x != 0 for row in A for x in row)
+    assert abs(nonzeros - density*3000) <= 6*(3000*density)**0.5 + 1
+    assert all(-9 <= x <= 9 for row in A for x in row)
+    assert random_matrix(60, 50, density, 10, "q", "csr").tolist() == A
+    assert random_matrix(60, 50, density, 10, "q", "matrix").tolist() == A
+    path = random_matrix(60, 50, density, 10, "q", "file",
+                         str(tmp_path / "A.mat"))
+    M = open_matrix(path)
+    assert M.tolist() == A
+    close_matrix(M)
+
+
+def test_random_matrix_values():
+    A = random_matrix(20, 20, seed=11, low=2.0, high=3.0)
+    assert all(2.0 <= x < 3.0 for row in A for x in row)
+    assert random_matrix(20, 20, seed=11, low=2.0, high=3.0) == A
+    with pytest.raises(ValueError):
+        random_matrix(2, 2, density=1.5)
+    with pytest.raises(ValueError):
+        random_matrix(2, 2, typecode="O")
+    with pytest.raises(ValueError):
+        random_matrix(2, 2, typecode="q", low=0, high=0)
+    with pytest.raises(ValueError):
+        random_matrix(2, 2, typecode="d", low=0.0, high=0.0)
+    with pytest.raises(ValueError):
+        random_polynomial(3, low=0.0, high=0.0)
+    with pytest.raises(NotImplementedError):
+        random_matrix(2, 2, output="tuple")
+
+
+def test_random_polynomial():
+    coeffs = random_polynomial(40, seed=12, typecode="q", low=-1, high=1)
+    assert len(coeffs) == 41 and set(coeffs) <= {-1, 1}
+    assert random_polynomial(0)[0] != 0
+    with pytest.raises(ValueError):
+        random_polynomial(-1)